@@ -0,0 +1,59 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import argparse
+import json
+import sys
+
+from aiorchestra.benchmarks import runner
+from aiorchestra.benchmarks import topology
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m aiorchestra.benchmarks',
+        description='Deploys synthetic TOSCA topologies and prints '
+                    'stage timings and peak memory as JSON.')
+    parser.add_argument('--shapes', nargs='+', default=topology.SHAPES,
+                        choices=topology.SHAPES)
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10, 100])
+    parser.add_argument('--delay', type=float, default=0)
+    parser.add_argument('--max-concurrency', type=int, default=None)
+    parser.add_argument('--link-concurrency', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--no-memory', action='store_true',
+                        help='do not trace peak memory')
+    parser.add_argument('--output', default=None,
+                        help='file to write results to, stdout if omitted')
+    args = parser.parse_args(argv)
+
+    results = []
+    for shape in args.shapes:
+        for size in args.sizes:
+            for _ in range(args.repeat):
+                results.append(runner.run_benchmark(
+                    shape, size, delay=args.delay,
+                    max_concurrency=args.max_concurrency,
+                    link_concurrency=args.link_concurrency,
+                    measure_memory=not args.no_memory))
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+    else:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
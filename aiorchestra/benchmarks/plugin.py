@@ -0,0 +1,63 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+
+from aiorchestra.core import utils
+
+
+async def pause(node):
+    delay = node.properties.get('delay')
+    if delay:
+        await asyncio.sleep(delay)
+
+
+@utils.operation
+async def create(node, inputs):
+    await pause(node)
+    node.batch_update_runtime_properties(**{
+        'name': node.name,
+        'created': True,
+    })
+
+
+@utils.operation
+async def configure(node, inputs):
+    await pause(node)
+
+
+@utils.operation
+async def start(node, inputs):
+    await pause(node)
+
+
+@utils.operation
+async def stop(node, inputs):
+    await pause(node)
+
+
+@utils.operation
+async def delete(node, inputs):
+    await pause(node)
+    node.runtime_properties.clear()
+
+
+@utils.operation
+async def link(source, target, inputs):
+    source.update_runtime_properties(target.name, True)
+
+
+@utils.operation
+async def unlink(source, target, inputs):
+    source.runtime_properties.pop(target.name, None)
@@ -0,0 +1,105 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import logging
+import os
+import platform
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from aiorchestra.benchmarks import topology
+from aiorchestra.core import context
+from aiorchestra.core import templates
+
+LOG = logging.getLogger(__name__)
+
+
+class Stopwatch(object):
+
+    def __init__(self):
+        self.elapsed = None
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.elapsed = time.perf_counter() - self.started
+
+
+def run_benchmark(shape, size, delay=0, max_concurrency=None,
+                  link_concurrency=1, measure_memory=True, **kwargs):
+    """
+    Deploys and undeploys synthetic topology and measures each stage
+
+    :param shape: one of fan_out, chain, diamond, mesh
+    :param size: topology size, meaning depends on shape
+    :param delay: lifecycle event delay in seconds
+    :param max_concurrency: context max_concurrency
+    :param link_concurrency: context link_concurrency
+    :param measure_memory: whether to trace peak memory allocated
+                           by benchmark, tracing slows down timings
+    :param kwargs: extra topology builder parameters
+    :return: benchmark results
+    :rtype: dict
+    """
+    directory = tempfile.mkdtemp(prefix='aiorchestra-benchmark-')
+    event_loop = asyncio.new_event_loop()
+    if measure_memory:
+        tracemalloc.start()
+    try:
+        path = os.path.join(directory, '{0}-{1}.yaml'.format(shape, size))
+        nodes = topology.write_template(
+            path, shape, size, delay=delay, **kwargs)
+        cache = templates.TemplateCache(max_size=1)
+        with Stopwatch() as parse:
+            cache.get(path)
+        c = context.OrchestraContext(
+            '{0}-{1}'.format(shape, size),
+            path=path,
+            logger=LOG,
+            event_loop=event_loop,
+            max_concurrency=max_concurrency,
+            link_concurrency=link_concurrency,
+            template_cache=cache)
+        with Stopwatch() as plan:
+            c.deployment_plan
+        with Stopwatch() as deploy:
+            c.run_deploy()
+        with Stopwatch() as undeploy:
+            c.run_undeploy()
+        peak_memory = (tracemalloc.get_traced_memory()[1]
+                       if measure_memory else None)
+    finally:
+        if measure_memory:
+            tracemalloc.stop()
+        event_loop.close()
+        shutil.rmtree(directory)
+    return {
+        'shape': shape,
+        'size': size,
+        'nodes': nodes,
+        'delay': delay,
+        'max_concurrency': max_concurrency,
+        'link_concurrency': link_concurrency,
+        'parse_seconds': parse.elapsed,
+        'plan_seconds': plan.elapsed,
+        'deploy_seconds': deploy.elapsed,
+        'undeploy_seconds': undeploy.elapsed,
+        'peak_memory_bytes': peak_memory,
+        'python': platform.python_version(),
+    }
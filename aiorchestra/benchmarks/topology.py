@@ -0,0 +1,169 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import yaml
+
+PLUGIN = 'aiorchestra.benchmarks.plugin'
+NODE_TYPE = 'aiorchestra.benchmarks.node'
+RELATIONSHIP_TYPE = 'aiorchestra.benchmarks.relationships.depends_on'
+(FAN_OUT, CHAIN, DIAMOND, MESH) = ('fan_out', 'chain', 'diamond', 'mesh')
+SHAPES = [FAN_OUT, CHAIN, DIAMOND, MESH]
+
+
+def fan_out(size):
+    """
+    Builds requirements of independent nodes required by single node
+
+    :param size: number of independent nodes
+    :return: mapping of node name to required node names
+    :rtype: dict
+    """
+    requirements = {'node_{0}'.format(i): [] for i in range(size)}
+    requirements['joint'] = sorted(requirements)
+    return requirements
+
+
+def chain(size):
+    """
+    Builds requirements of nodes where each node requires previous one
+
+    :param size: chain length
+    :return: mapping of node name to required node names
+    :rtype: dict
+    """
+    return {'node_{0}'.format(i): (['node_{0}'.format(i - 1)] if i else [])
+            for i in range(size)}
+
+
+def diamond(size):
+    """
+    Builds requirements of nodes that require single root
+    and are required by single joint node
+
+    :param size: number of nodes between root and joint nodes
+    :return: mapping of node name to required node names
+    :rtype: dict
+    """
+    requirements = {'node_{0}'.format(i): ['root'] for i in range(size)}
+    requirements['joint'] = sorted(requirements)
+    requirements['root'] = []
+    return requirements
+
+
+def mesh(size, width=None):
+    """
+    Builds requirements of two node layers where
+    each node of upper layer requires all nodes of lower layer
+
+    :param size: number of nodes in upper layer
+    :param width: number of nodes in lower layer, same as size if None
+    :return: mapping of node name to required node names
+    :rtype: dict
+    """
+    lower = ['lower_{0}'.format(i) for i in range(width or size)]
+    requirements = {name: [] for name in lower}
+    for i in range(size):
+        requirements['upper_{0}'.format(i)] = list(lower)
+    return requirements
+
+
+BUILDERS = {
+    FAN_OUT: fan_out,
+    CHAIN: chain,
+    DIAMOND: diamond,
+    MESH: mesh,
+}
+
+
+def build_template(requirements, delay=0):
+    """
+    Builds TOSCA template for nodes requirements, nodes are using
+    benchmark plugin that sleeps for delay on each lifecycle event
+
+    :param requirements: mapping of node name to required node names
+    :type requirements: dict
+    :param delay: lifecycle event delay in seconds
+    :type delay: float
+    :return: TOSCA template
+    :rtype: dict
+    """
+    lifecycle = {'type': 'tosca.interfaces.node.lifecycle.Standard'}
+    for event in ['create', 'configure', 'start', 'stop', 'delete']:
+        lifecycle[event] = {
+            'implementation': '{0}:{1}'.format(PLUGIN, event)}
+    relationship = {'type': 'tosca.interfaces.relationship.Configure'}
+    for event in ['link', 'unlink']:
+        relationship[event] = {
+            'implementation': '{0}:{1}'.format(PLUGIN, event)}
+    node_templates = {}
+    for name, required in sorted(requirements.items()):
+        node_template = {
+            'type': NODE_TYPE,
+            'properties': {'delay': float(delay)},
+        }
+        if required:
+            node_template['requirements'] = [
+                {'dependency': other} for other in required]
+        node_templates[name] = node_template
+    return {
+        'tosca_definitions_version': 'tosca_simple_yaml_1_0',
+        'description': 'Synthetic topology for AIOrchestra benchmarks',
+        'node_types': {
+            NODE_TYPE: {
+                'derived_from': 'tosca.nodes.Root',
+                'properties': {
+                    'delay': {'type': 'float', 'default': 0.0},
+                },
+                'attributes': {
+                    'name': {'type': 'string'},
+                },
+                'requirements': [{
+                    'dependency': {
+                        'capability': 'tosca.capabilities.Node',
+                        'node': NODE_TYPE,
+                        'relationship': RELATIONSHIP_TYPE,
+                        'occurrences': [0, 'UNBOUNDED'],
+                    },
+                }],
+                'interfaces': {'Standard': lifecycle},
+            },
+            RELATIONSHIP_TYPE: {
+                'derived_from': 'tosca.relationships.Root',
+                'interfaces': {'Configure': relationship},
+            },
+        },
+        'topology_template': {'node_templates': node_templates},
+    }
+
+
+def write_template(path, shape, size, delay=0, **kwargs):
+    """
+    Writes synthetic TOSCA template of given shape
+
+    :param path: template file path
+    :param shape: one of fan_out, chain, diamond, mesh
+    :param size: topology size, meaning depends on shape
+    :param delay: lifecycle event delay in seconds
+    :param kwargs: extra topology builder parameters
+    :return: number of nodes in topology
+    :rtype: int
+    """
+    if shape not in BUILDERS:
+        raise Exception('Unknown topology shape "{0}", available: {1}.'
+                        .format(shape, ', '.join(SHAPES)))
+    requirements = BUILDERS[shape](size, **kwargs)
+    with open(path, 'w') as template_file:
+        yaml.safe_dump(build_template(requirements, delay=delay),
+                       template_file, default_flow_style=False)
+    return len(requirements)
@@ -14,6 +14,9 @@
 
 import asyncio
 import collections
+import copy
+import functools
+import logging
 
 try:
     import uvloop
@@ -21,10 +24,14 @@ except ImportError:
     uvloop = None
 
 
-from toscaparser import tosca_template
-
+from aiorchestra.core import diff
 from aiorchestra.core import node
 from aiorchestra.core import logger as log
+from aiorchestra.core import rollback
+from aiorchestra.core import scheduler
+from aiorchestra.core import snapshot
+from aiorchestra.core import templates
+from aiorchestra.core import utils
 
 
 class OrchestraContext(object):
@@ -37,7 +44,18 @@ class OrchestraContext(object):
                  template_inputs=None,
                  logger=None,
                  event_loop=None,
-                 enable_rollback=False):
+                 enable_rollback=False,
+                 max_concurrency=None,
+                 template_cache=None,
+                 link_concurrency=1,
+                 tracer=None,
+                 journal=None,
+                 template=None,
+                 limiter=None,
+                 executor=None,
+                 instances=None,
+                 rate_limiter=None,
+                 fail_fast=False):
         """
         Represents AIOrchestra deployment context designed to
         manage deployment through its lifecycle
@@ -52,22 +70,66 @@ class OrchestraContext(object):
         :param event_loop: asyncio or any compatible event loop
         :type event_loop: asyncio.Loop
         :param enable_rollback: weather to enable rollback on failure or not
+        :param max_concurrency: maximum number of node lifecycle events
+                                running at the same time, None for no limit
+        :type max_concurrency: int
+        :param template_cache: parsed TOSCA templates cache,
+                               shared default cache if None
+        :type template_cache: aiorchestra.core.templates.TemplateCache
+        :param link_concurrency: maximum number of relationship link or
+                                 unlink events a node runs at the same time,
+                                 None for no limit
+        :type link_concurrency: int
+        :param tracer: lifecycle events tracer, no tracing if None
+        :type tracer: aiorchestra.core.tracing.Tracer
+        :param journal: write-ahead journal of lifecycle events,
+                        no journaling if None
+        :type journal: aiorchestra.core.journal.Journal
+        :param template: already parsed TOSCA template
+                         to use instead of parsing one from path
+        :type template: toscaparser.tosca_template.ToscaTemplate
+        :param limiter: lifecycle events limiter shared with
+                        other deployments, no limit if None
+        :type limiter: aiorchestra.core.engine.DeploymentSlots
+        :param executor: executor to run non-coroutine plugin operations
+                         in, shared bounded thread pool if None
+        :type executor: concurrent.futures.Executor
+        :param instances: number of instances of node templates, overrides
+                          default instances of scalable capability
+        :type instances: dict
+        :param rate_limiter: plugin operations limiter keyed on backend,
+                             may be shared with other deployments,
+                             no limit if None
+        :type rate_limiter: aiorchestra.core.ratelimit.RateLimiter
+        :param fail_fast: whether first failed lifecycle event cancels
+                          events running at the same time and blocks
+                          events of nodes that were not started yet,
+                          otherwise only nodes that wait for failed
+                          node are blocked and other nodes run to the
+                          end; with rollback enabled failed events are
+                          not ignored and provisioned nodes are rolled
+                          back right after
+        :type fail_fast: bool
         """
         self.__name = name
-        self._tmplt = tosca_template.ToscaTemplate(
-            path=path, a_file=True,
-            parsed_params=template_inputs)
-        self.__path = path
+        self.template_cache = (template_cache if template_cache is not None
+                               else templates.DEFAULT_CACHE)
+        if template is not None:
+            self._tmplt = template
+        else:
+            self._tmplt = self.template_cache.get(
+                path, template_inputs=template_inputs)
+        self.__path = path if path else self._tmplt.path
         self.origin_nodes = self._tmplt.graph.nodetemplates
         self.vertices = self._tmplt.graph.vertices
         self.inputs_definitions = self._tmplt.inputs
         self.__outputs = self._tmplt.outputs
-        self.template_inputs = template_inputs if template_inputs else {}
+        self.template_inputs = copy.deepcopy(template_inputs or {})
         self.__status = self.PENDING
         if not logger:
             self.logger = log.UnifiedLogger(
                 log_to_console=True,
-                level="DEBUG").setup_logger(__name__)
+                level="DEBUG").setup_child_logger(__name__, name)
         else:
             self.logger = logger
         if not event_loop:
@@ -78,10 +140,77 @@ class OrchestraContext(object):
             self.event_loop = asyncio.get_event_loop()
         else:
             self.event_loop = event_loop
-        self.__orchestra_nodes = [node.OrchestraNode(self, origin_node)
-                                  for origin_node in self.origin_nodes]
+        self.instances = dict(instances or {})
+        self.nodes = self.__build_nodes()
         self.__deployment_plan = None
+        self.__nodes_order = []
+        self.__stab_relationship_events = None
         self.rollback_enabled = enable_rollback
+        self.max_concurrency = max_concurrency
+        self.link_concurrency = link_concurrency
+        self.tracer = tracer
+        self.journal = journal
+        self.limiter = limiter
+        self.executor = executor
+        self.rate_limiter = rate_limiter
+        self.fail_fast = fail_fast
+        self.resumed_events = frozenset()
+
+    def instance_count(self, origin_node):
+        """
+        Returns number of node template instances
+
+        :param origin_node: TOSCA graph node
+        :type origin_node: toscaparser.nodetemplate.NodeTemplate
+        :return: number of instances, None if node template
+                 is not scalable
+        :rtype: int
+        :raises: exception if number of instances is out of
+                 scalable capability bounds
+        """
+        limits = node.scalable_limits(origin_node)
+        count = self.instances.get(origin_node.name)
+        if count is None:
+            return limits[0] if limits else None
+        count = int(count)
+        min_instances, max_instances = (limits[1:] if limits
+                                        else (0, None))
+        if count < min_instances or (max_instances is not None and
+                                     count > max_instances):
+            msg = ('Unable to scale node "{0}" to {1} instances, '
+                   'allowed range is [{2}, {3}].'
+                   .format(origin_node.name, count, min_instances,
+                           max_instances if max_instances is not None
+                           else 'UNBOUNDED'))
+            self.logger.error(msg)
+            raise Exception(msg)
+        return count
+
+    def __build_nodes(self):
+        """
+        Builds nodes for node templates, scalable node templates
+        have node per instance
+
+        :return: nodes
+        :rtype: list of aiorchestra.core.node.OrchestraNode
+        :raises: exception if instances refer to unknown node template
+        """
+        unknown = set(self.instances) - set(
+            n.name for n in self.origin_nodes)
+        if unknown:
+            msg = ('Unable to set number of instances for unknown '
+                   'nodes: {0}.'.format(', '.join(sorted(unknown))))
+            self.logger.error(msg)
+            raise Exception(msg)
+        nodes = []
+        for origin_node in self.origin_nodes:
+            count = self.instance_count(origin_node)
+            if count is None:
+                nodes.append(node.OrchestraNode(self, origin_node))
+                continue
+            nodes.extend(node.OrchestraNode(self, origin_node, instance=index)
+                         for index in range(count))
+        return nodes
 
     @property
     def outputs(self):
@@ -108,6 +237,16 @@ class OrchestraContext(object):
             raise Exception(msg)
         return outputs
 
+    @property
+    def path(self):
+        """
+        Represents path to TOSCA template
+
+        :return: path
+        :rtype: str
+        """
+        return self.__path
+
     @property
     def status(self):
         """
@@ -164,74 +303,165 @@ class OrchestraContext(object):
     @nodes.setter
     def nodes(self, new):
         """
-        Represents deployment context node setter
+        Represents deployment context node setter,
+        also rebuilds nodes look-up index
 
         :param new: OrchestraNode
         :return: None
         :rtype: None
         """
         self.__orchestra_nodes = new
+        self.__nodes_by_name = {n.name: n for n in new}
+        self.__instances_by_template = {
+            origin_node.name: [] for origin_node in self.origin_nodes}
+        for n in new:
+            self.__instances_by_template.setdefault(
+                n.template_name, []).append(n.name)
+        self.__relationships = None
 
     def node_from_name(self, name):
         """
-        Returns node from its name
+        Returns node from its name, first instance
+        for scalable node template name
 
         :param name: node
         :return: node
         :rtype: aiorchestra.core.node.OrchestraNode
         """
-        for orchestra_node in self.nodes:
-            if orchestra_node.name == name:
-                return orchestra_node
+        orchestra_node = self.__nodes_by_name.get(name)
+        if orchestra_node is None:
+            instances = self.__instances_by_template.get(name)
+            if instances:
+                orchestra_node = self.__nodes_by_name[instances[0]]
+        return orchestra_node
+
+    def instance_names(self, template_name):
+        """
+        Returns names of nodes that are instances of node template
+
+        :param template_name: node template name
+        :type template_name: str
+        :return: node names
+        :rtype: list of str
+        """
+        return list(self.__instances_by_template.get(
+            template_name, [template_name]))
+
+    @property
+    def relationships(self):
+        """
+        Represents relationship edges between nodes, built once for
+        context nodes and keyed on source and target node names
+
+        :return: relationship edges
+        :rtype: dict of aiorchestra.core.node.RelationshipEdge
+        """
+        if self.__relationships is None:
+            edges = {}
+            for orchestra_node in self.nodes:
+                for edge in orchestra_node.operations.relationship_edges(
+                        orchestra_node):
+                    edges[(orchestra_node.name, edge.target.name)] = edge
+            self.__relationships = edges
+        return self.__relationships
+
+    def relationship_edge(self, source, target):
+        """
+        Returns relationship edge from source node to target node,
+        nodes without defined relationship are linked with stabs
+
+        :param source: source node
+        :type source: aiorchestra.core.node.OrchestraNode
+        :param target: target node
+        :type target: aiorchestra.core.node.OrchestraNode
+        :return: relationship edge
+        :rtype: aiorchestra.core.node.RelationshipEdge
+        """
+        edge = self.relationships.get((source.name, target.name))
+        if edge is None:
+            if self.__stab_relationship_events is None:
+                self.__stab_relationship_events = (
+                    source.operations.relationship_events(None, source))
+            edge = node.RelationshipEdge(
+                source, target, None, self.__stab_relationship_events)
+        return edge
 
     def __setup_deployment_plan(self):
         """
-        Represents context deployment plan initialization
-        :return:
+        Represents context deployment plan initialization,
+        nodes are sorted topologically within single pass
+        and transitive requirements of each node are computed once
+
+        :return: None
+        :rtype: None
+        :raises: exception if nodes requirements have a cycle
         """
         self.logger.info('Retrieving deployment plan for '
                          'TOSCA template {0} context.'
                          .format(self.name))
+        nodes_order = []
+        requirements = {}
+        visiting = []
 
-        deps_by_node = collections.defaultdict(list)
-        deps = []
-
-        def recursive_dependency_collector(_node):
+        def visit(_node):
             _node.attempt_to_validate()
-            _deps = []
-            if _node.has_parents:
-                if _node not in deps:
-                    deps.append(_node)
-                for other_required_by in sorted(_node.parent_nodes):
-                    next_node = self.node_from_name(other_required_by)
-                    _deps.append(
-                        recursive_dependency_collector(next_node))
-                return
-            deps.append(_deps if _deps else _node)
-            return
+            visiting.append(_node.name)
+            return _node, iter(sorted(_node.parent_nodes))
 
         for orchestra_node in self.nodes:
+            if orchestra_node.name in requirements:
+                continue
             self.logger.debug('Retrieving deployment dependencies '
                               'and building deployment task sequence for '
-                              'node {0} of TOSCA template {1} context.'
-                              .format(orchestra_node.name, self.name))
-            recursive_dependency_collector(orchestra_node)
-            deps = list(reversed(deps))
-            filtered = []
-            for dep in deps:
-                if dep.name not in [n.name for n in filtered]:
-                    filtered.append(dep)
-            deps_by_node[orchestra_node] = filtered
-            self.logger.debug('Node {0} has "{1}" deployment task sequence.'
-                              .format(orchestra_node.name, ", "
-                                      .join([str(n) for n in filtered])))
-            deps = []
+                              'node %s of TOSCA template %s context.',
+                              orchestra_node.name, self.name)
+            stack = [visit(orchestra_node)]
+            while stack:
+                current, parents = stack[-1]
+                for parent in parents:
+                    if parent in requirements:
+                        continue
+                    if parent in visiting:
+                        cycle = visiting[visiting.index(parent):] + [parent]
+                        msg = ('Unable to build deployment plan for '
+                               'TOSCA template {0} context, nodes '
+                               'requirements have a cycle: {1}.'
+                               .format(self.name, ' -> '.join(cycle)))
+                        self.logger.error(msg)
+                        raise Exception(msg)
+                    if parent not in self.__nodes_by_name:
+                        msg = ('Node "{0}" requires unknown node "{1}".'
+                               .format(current.name, parent))
+                        self.logger.error(msg)
+                        raise Exception(msg)
+                    stack.append(visit(self.__nodes_by_name[parent]))
+                    break
+                else:
+                    stack.pop()
+                    visiting.pop()
+                    transitive = set()
+                    for parent in current.parent_nodes:
+                        transitive.add(parent)
+                        transitive.update(requirements[parent])
+                    requirements[current.name] = transitive
+                    nodes_order.append(current)
+
+        position = {n.name: index for index, n in enumerate(nodes_order)}
+        deps_by_node = {}
+        for orchestra_node in nodes_order:
+            deps = [self.__nodes_by_name[name] for name in sorted(
+                requirements[orchestra_node.name], key=position.get)]
+            deps.append(orchestra_node)
+            deps_by_node[orchestra_node] = deps
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug('Node %s has "%s" deployment task '
+                                  'sequence.', orchestra_node.name,
+                                  ", ".join([str(n) for n in deps]))
 
         d = collections.OrderedDict()
-        deps_by_node_new = sorted(
-            deps_by_node, key=lambda k: len(deps_by_node[k]))
-        for item in deps_by_node_new:
+        for item in sorted(nodes_order, key=lambda k: len(deps_by_node[k])):
             d[item] = deps_by_node[item]
+        self.__nodes_order = nodes_order
         self.__deployment_plan = d
 
     @property
@@ -246,24 +476,16 @@ class OrchestraContext(object):
             self.__setup_deployment_plan()
         return self.__deployment_plan
 
-    def _gather_events(self, event):
+    def nodes_in_plan_order(self):
         """
-        Gathers events from node standard events API
+        Returns nodes in the order of deployment plan,
+        each node goes after the nodes it requires
 
-        :param event: node standard event type
-        :return: sequence of events
-        :rtype: list
+        :return: ordered nodes
+        :rtype: list of aiorchestra.core.node.OrchestraNode
         """
-        sequenced_events = []
-        nodes_order = []
-        for target_node, deployment_plan in self.deployment_plan.items():
-            for node_template in deployment_plan:
-                if node_template not in nodes_order:
-                    nodes_order.append(node_template)
-        for node_template in nodes_order:
-            event_coroutine = getattr(node_template, event)
-            sequenced_events.append(event_coroutine())
-        return sequenced_events
+        self.deployment_plan
+        return list(self.__nodes_order)
 
     def _assert_nodes_were_provisioned(self):
         """
@@ -272,29 +494,64 @@ class OrchestraContext(object):
         """
         gather = []
         for n in self.nodes:
-            self.logger.debug('Node "{0}" is provisioned: "{1}".'
-                              .format(n.name, n.is_provisioned))
+            self.logger.debug('Node "%s" is provisioned: "%s".',
+                              n.name, n.is_provisioned)
             gather.append(n.is_provisioned)
         return any(gather)
 
-    async def deploy(self):
+    def __resume_from_journal(self):
         """
-        Coroutine to start deployment
+        Restores nodes state from journal and marks events
+        that were completed before as the ones to skip
 
         :return: None
         :rtype: None
         """
-        task_list = []
+        completed = self.journal.completed(self.name)
+        for entry in completed.values():
+            for name, state in entry['nodes'].items():
+                orchestra_node = self.node_from_name(name)
+                if orchestra_node is None:
+                    continue
+                orchestra_node.runtime_properties = dict(
+                    state['runtime_properties'])
+                orchestra_node.is_provisioned = state['is_provisioned']
+        self.resumed_events = frozenset(completed.keys())
+        self.logger.info('Resuming deployment {0}, {1} events were '
+                         'completed before.'.format(self.name,
+                                                    len(completed)))
+
+    async def deploy(self, resume=False):
+        """
+        Coroutine to start deployment, node lifecycle events are
+        scheduled concurrently following nodes requirements
+
+        :param resume: whether to skip events that journal
+                       recorded as completed
+        :type resume: bool
+        :return: None
+        :rtype: None
+        """
         standard_events_order = ['create', 'configure', 'start']
         self.logger.info('Starting deployment process for deployment '
                          'context {0}.'.format(self.name))
         if self.status == self.PENDING:
-            for event in standard_events_order:
-                task_list.extend(self._gather_events(event))
+            deployment_scheduler = scheduler.DeploymentScheduler(
+                self, standard_events_order,
+                max_concurrency=self.max_concurrency,
+                limiter=self.limiter, cancel_on_failure=self.fail_fast)
+            # builds deployment plan, validates nodes and resolves
+            # relationships before any lifecycle event would be started
+            self.deployment_plan
+            self.relationships
+            if self.journal is not None:
+                if resume:
+                    self.__resume_from_journal()
+                else:
+                    await self.journal.clear(self.name)
             try:
                 self.status = self.RUNNING
-                for coro in task_list:
-                    await coro
+                await deployment_scheduler.run()
                 self._assert_nodes_were_provisioned()
                 self.status = self.COMPLETED
             except Exception as ex:
@@ -304,6 +561,10 @@ class OrchestraContext(object):
                 else:
                     self.logger.info('Rollback enabled, no need '
                                      'to raise exception.')
+                    if self.fail_fast:
+                        await self.__rollback_quietly()
+            finally:
+                self.resumed_events = frozenset()
             self.logger.info('Deployment "{0}" finished'
                              ' with status "{1}".'
                              .format(self.name, self.status))
@@ -313,29 +574,41 @@ class OrchestraContext(object):
 
     async def undeploy(self):
         """
-        Coroutine to start reverse process to deployment
+        Coroutine to start reverse process to deployment, node stop
+        and delete events are scheduled concurrently, each node is torn
+        down once all nodes that require it were torn down, failed
+        deployment with rollback enabled is rolled back instead
 
         :return: None
         :rtype: None
         """
         self.logger.info('Starting teardown process for deployment '
                          'context {0}.'.format(self.name))
-        task_list = []
-        standard_events_order = ['delete', 'stop']
-        for event in standard_events_order:
-            task_list.extend(self._gather_events(event))
         is_able = (self.status in self.AVAILABLE_FOR_DESTRUCTION if
                    not self.rollback_enabled else self.rollback_enabled)
-        if is_able:
+        if self.rollback_enabled and self.status == self.FAILED:
+            try:
+                await self.rollback()
+                if self.journal is not None:
+                    await self.journal.clear(self.name)
+            finally:
+                self.status = self.PENDING
+        elif is_able:
             self.logger.info('Destroying deployment {0}'.format(self.name))
             if not self._assert_nodes_were_provisioned():
                 msg = ('Unable to destroy deployment "{0}" because of the '
                        'nodes was not provisioned'.format(self.name))
                 self.logger.error(msg)
                 raise Exception(msg)
+            teardown_scheduler = scheduler.DeploymentScheduler(
+                self, ['stop', 'delete'],
+                max_concurrency=self.max_concurrency,
+                limiter=self.limiter, reverse=True,
+                cancel_on_failure=self.fail_fast)
             try:
-                for coro in reversed(task_list):
-                    await coro
+                await teardown_scheduler.run()
+                if self.journal is not None:
+                    await self.journal.clear(self.name)
                 self.logger.info('Deployment "{0}" destroyed.'
                                  .format(self.name))
             except Exception as ex:
@@ -351,14 +624,163 @@ class OrchestraContext(object):
                    .format(self.status))
             raise Exception(msg)
 
-    def run_deploy(self):
+    async def rollback(self, nodes=None):
+        """
+        Coroutine to roll back failed deployment, only nodes that were
+        provisioned or created are torn down, concurrently and in
+        reverse order of nodes requirements, see
+        aiorchestra.core.rollback.RollbackPlan
+
+        :param nodes: nodes to roll back, all context nodes if None
+        :type nodes: list of aiorchestra.core.node.OrchestraNode
+        :return: None
+        :rtype: None
+        :raises: first rollback error once rollback was finished
+        """
+        plan = rollback.RollbackPlan(self, nodes=nodes)
+        self.logger.info('Rolling back deployment context {0}: {1}.'
+                         .format(self.name, plan.serialize()))
+        try:
+            await plan.run()
+        except Exception as ex:
+            self.logger.error('Failed to roll back deployment "{0}". '
+                              'Reason: "{1}".'.format(self.name, str(ex)))
+            raise ex
+
+    async def __rollback_quietly(self, nodes=None):
+        try:
+            await self.rollback(nodes=nodes)
+        except Exception:
+            # failure is already logged, deployment stays FAILED
+            pass
+
+    async def update(self, path=None, template_inputs=None,
+                     instances=None):
+        """
+        Coroutine to apply new TOSCA template revision or inputs to
+        deployed context, only added, removed or changed nodes run
+        lifecycle events and only changed requirements are linked
+        or unlinked, other nodes keep their runtime properties
+
+        :param path: path to new TOSCA template revision,
+                     current template if None
+        :type path: str
+        :param template_inputs: new TOSCA template input parameters,
+                                current inputs if None
+        :type template_inputs: dict
+        :param instances: new number of instances of node templates,
+                          current number of instances if None
+        :type instances: dict
+        :return: deployment context of new template revision
+        :rtype: OrchestraContext
+        """
+        if self.status != self.COMPLETED:
+            raise Exception('Unable to update deployment. '
+                            'COMPLETED status required.')
+        desired = OrchestraContext(
+            self.name, path=path or self.__path,
+            template_inputs=(template_inputs if template_inputs is not None
+                             else self.template_inputs),
+            logger=self.logger,
+            event_loop=self.event_loop,
+            enable_rollback=self.rollback_enabled,
+            max_concurrency=self.max_concurrency,
+            template_cache=self.template_cache,
+            link_concurrency=self.link_concurrency,
+            tracer=self.tracer,
+            journal=self.journal,
+            limiter=self.limiter,
+            executor=self.executor,
+            rate_limiter=self.rate_limiter,
+            fail_fast=self.fail_fast,
+            instances=(instances if instances is not None
+                       else self.instances))
+        changes = diff.ContextDiff(self, desired)
+        self.logger.info('Updating deployment context {0}: {1}.'
+                         .format(self.name, changes.serialize()))
+        # validates new template revision before
+        # any node of current deployment would be touched
+        desired.deployment_plan
+        desired.relationships
+        recreated = changes.removed | changes.changed
+        teardown = [n for n in self.nodes if n.name in recreated]
+        redeploy = [desired.node_from_name(name)
+                    for name in changes.added | changes.changed]
+        try:
+            desired.status = self.RUNNING
+            try:
+                await utils.gather_limited(
+                    [functools.partial(self.node_from_name(target).unlink,
+                                       self.node_from_name(source))
+                     for source, target in sorted(changes.unlinked)],
+                    limit=self.link_concurrency)
+                await scheduler.DeploymentScheduler(
+                    self, ['stop', 'delete'],
+                    max_concurrency=self.max_concurrency,
+                    nodes=teardown, limiter=self.limiter,
+                    reverse=True, cancel_on_failure=self.fail_fast).run()
+            finally:
+                # unchanged nodes take state they have
+                # after being unlinked from recreated nodes
+                for name in changes.unchanged:
+                    current_node = self.node_from_name(name)
+                    desired_node = desired.node_from_name(name)
+                    desired_node.runtime_properties = dict(
+                        current_node.runtime_properties)
+                    desired_node.is_provisioned = current_node.is_provisioned
+                    desired_node.completed_events = set(
+                        current_node.completed_events)
+            await scheduler.DeploymentScheduler(
+                desired, ['create', 'configure', 'start'],
+                max_concurrency=self.max_concurrency,
+                nodes=redeploy, limiter=self.limiter,
+                cancel_on_failure=self.fail_fast).run()
+            await utils.gather_limited(
+                [functools.partial(desired.node_from_name(target).link,
+                                   desired.node_from_name(source))
+                 for source, target in sorted(changes.linked)],
+                limit=self.link_concurrency)
+            desired.status = self.COMPLETED
+        except Exception as ex:
+            desired.status = self.FAILED
+            if not self.rollback_enabled:
+                raise ex
+            else:
+                self.logger.info('Rollback enabled, no need '
+                                 'to raise exception.')
+                if self.fail_fast:
+                    await desired.__rollback_quietly(nodes=redeploy)
+        self.logger.info('Deployment "{0}" update finished'
+                         ' with status "{1}".'
+                         .format(self.name, desired.status))
+        return desired
+
+    async def scale(self, template_name, count):
+        """
+        Coroutine to scale node template out or in, only added
+        or removed instances run lifecycle events
+
+        :param template_name: node template name
+        :type template_name: str
+        :param count: new number of instances
+        :type count: int
+        :return: deployment context with new number of instances
+        :rtype: OrchestraContext
+        """
+        instances = dict(self.instances)
+        instances[template_name] = count
+        return await self.update(instances=instances)
+
+    def run_deploy(self, resume=False):
         """
         Awaits until deploy finished and exits
 
+        :param resume: whether to skip events that journal
+                       recorded as completed
         :return: None
         :rtype: None
         """
-        self.event_loop.run_until_complete(self.deploy())
+        self.event_loop.run_until_complete(self.deploy(resume=resume))
 
     def run_undeploy(self):
         """
@@ -369,6 +791,30 @@ class OrchestraContext(object):
         """
         self.event_loop.run_until_complete(self.undeploy())
 
+    def run_update(self, path=None, template_inputs=None):
+        """
+        Awaits until update finished and exits
+
+        :param path: path to new TOSCA template revision
+        :param template_inputs: new TOSCA template input parameters
+        :return: deployment context of new template revision
+        :rtype: OrchestraContext
+        """
+        return self.event_loop.run_until_complete(
+            self.update(path=path, template_inputs=template_inputs))
+
+    def run_scale(self, template_name, count):
+        """
+        Awaits until scaling finished and exits
+
+        :param template_name: node template name
+        :param count: new number of instances
+        :return: deployment context with new number of instances
+        :rtype: OrchestraContext
+        """
+        return self.event_loop.run_until_complete(
+            self.scale(template_name, count))
+
     def serialize(self):
         """
         Serializes deployment context into dict object for further consumption
@@ -381,16 +827,32 @@ class OrchestraContext(object):
             'status': self.status,
             'template_inputs': self.template_inputs,
             'nodes': [n.serialize() for n in self.nodes],
-            'path': self._tmplt.path
+            'path': self._tmplt.path,
+            'instances': self.instances,
         }
 
+    def snapshot(self, codec=None):
+        """
+        Serializes deployment context into compact versioned snapshot
+
+        :param codec: snapshot codec, msgpack if installed,
+                      zlib-compressed JSON otherwise
+        :return: snapshot
+        :rtype: bytes
+        """
+        return snapshot.dumps(self, codec=codec)
+
     @classmethod
-    def load(cls, logger, event_loop=None, **kwargs):
+    def load(cls, logger, event_loop=None, template_cache=None,
+             template=None, **kwargs):
         """
         Loads deployment context from serialized object
 
         :param logger: python logger instance
         :param event_loop: asyncio event loop or compatible
+        :param template_cache: parsed TOSCA templates cache,
+                               shared default cache if None
+        :param template: already parsed TOSCA template to reuse
         :param kwargs: serialized deployment context as kwargs
         :return: restored deployment context
         :rtype: OrchestraContext
@@ -404,13 +866,35 @@ class OrchestraContext(object):
                       path=path,
                       template_inputs=inputs,
                       event_loop=event_loop,
-                      logger=logger)
+                      logger=logger,
+                      template_cache=template_cache,
+                      template=template,
+                      instances=kwargs.get('instances'))
         context.status = __status
-        _ns = []
         for ser_n in nodes:
             _node = context.node_from_name(ser_n['__name'])
+            if _node is None:
+                raise Exception('Unable to load node "{0}", TOSCA template '
+                                'has no such node.'.format(ser_n['__name']))
             _node.load(**ser_n)
-            _ns.append(_node)
-        context.nodes = _ns
-        context.__setup_deployment_plan()
         return context
+
+    @classmethod
+    def from_snapshot(cls, data, logger, event_loop=None,
+                      template_cache=None, template=None):
+        """
+        Loads deployment context from snapshot
+
+        :param data: snapshot
+        :type data: bytes
+        :param logger: python logger instance
+        :param event_loop: asyncio event loop or compatible
+        :param template_cache: parsed TOSCA templates cache,
+                               shared default cache if None
+        :param template: already parsed TOSCA template to reuse
+        :return: restored deployment context
+        :rtype: OrchestraContext
+        """
+        return cls.load(logger, event_loop=event_loop,
+                        template_cache=template_cache,
+                        template=template, **snapshot.loads(data))
@@ -0,0 +1,171 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+from toscaparser import functions
+
+from aiorchestra.core import node
+
+
+def node_signature(orchestra_node):
+    """
+    Builds node signature out of its template, type definition
+    and template inputs its properties refer to, requirements and
+    number of instances of scalable node template are not part
+    of signature
+
+    :param orchestra_node: node
+    :type orchestra_node: aiorchestra.core.node.OrchestraNode
+    :return: node signature
+    :rtype: str
+    """
+    template = dict(orchestra_node.node.entity_tpl)
+    template.pop('requirements', None)
+    capabilities = dict(template.get('capabilities') or {})
+    for cap in orchestra_node.node.get_capabilities_objects():
+        if node.is_scalable_capability(cap):
+            capabilities.pop(cap.name, None)
+    template['capabilities'] = capabilities
+    inputs = {}
+    for prop in orchestra_node.property_definishion:
+        if isinstance(prop.value, functions.GetInput):
+            name = prop.value.input_name
+            inputs[name] = orchestra_node.context.template_inputs.get(name)
+    return json.dumps([template,
+                       orchestra_node.node_type_definition,
+                       inputs], sort_keys=True, default=repr)
+
+
+def referenced_nodes(orchestra_node):
+    """
+    Collects names of nodes that node properties refer to
+    by TOSCA get_property and get_attribute functions
+
+    :param orchestra_node: node
+    :type orchestra_node: aiorchestra.core.node.OrchestraNode
+    :return: referenced node names
+    :rtype: set
+    """
+    names = set()
+    for prop in orchestra_node.property_definishion:
+        if isinstance(prop.value, (functions.GetProperty,
+                                   functions.GetAttribute)):
+            names.update(orchestra_node.context.instance_names(
+                prop.value.node_template_name))
+    names.discard(orchestra_node.name)
+    return names
+
+
+def relationship_edges(context):
+    """
+    Collects requirements of context nodes
+
+    :param context: OrchestraContext instance
+    :type context: aiorchestra.core.context.OrchestraContext
+    :return: requirement definitions keyed on source and target node names
+    :rtype: dict
+    """
+    edges = {}
+    for orchestra_node in context.nodes:
+        for requirement in orchestra_node.node._requirements:
+            for req_def in requirement.values():
+                target = (req_def['node'] if isinstance(req_def, dict)
+                          else req_def)
+                for instance_name in context.instance_names(target):
+                    edges[(orchestra_node.name, instance_name)] = json.dumps(
+                        req_def, sort_keys=True, default=repr)
+    return edges
+
+
+class ContextDiff(object):
+
+    def __init__(self, current, desired):
+        """
+        Represents difference between deployed context
+        and context built from new template revision or inputs
+
+        Nodes with changed template, type definition or inputs are
+        recreated, as well as nodes whose properties refer to recreated,
+        added or removed nodes, requirement edges between nodes that
+        stay deployed are linked or unlinked.
+
+        :param current: deployed context
+        :type current: aiorchestra.core.context.OrchestraContext
+        :param desired: context of new template revision
+        :type desired: aiorchestra.core.context.OrchestraContext
+        """
+        current_names = set(n.name for n in current.nodes)
+        desired_names = set(n.name for n in desired.nodes)
+        self.added = desired_names - current_names
+        self.removed = current_names - desired_names
+        self.changed = set(
+            name for name in current_names & desired_names
+            if (node_signature(current.node_from_name(name)) !=
+                node_signature(desired.node_from_name(name))))
+        references = {
+            name: (referenced_nodes(current.node_from_name(name)) |
+                   referenced_nodes(desired.node_from_name(name)))
+            for name in current_names & desired_names}
+        replaced = self.added | self.removed | self.changed
+        while True:
+            dependents = set(
+                name for name, refs in references.items()
+                if name not in self.changed and refs & replaced)
+            if not dependents:
+                break
+            self.changed |= dependents
+            replaced |= dependents
+        self.unchanged = (current_names & desired_names) - self.changed
+
+        current_edges = relationship_edges(current)
+        desired_edges = relationship_edges(desired)
+        recreated = self.removed | self.changed
+        self.unlinked = set(
+            edge for edge, req_def in current_edges.items()
+            if edge[0] in self.unchanged and (
+                edge[1] in recreated or
+                desired_edges.get(edge) != req_def))
+        recreated = self.added | self.changed
+        self.linked = set(
+            edge for edge, req_def in desired_edges.items()
+            if edge[0] in self.unchanged and (
+                edge[1] in recreated or
+                current_edges.get(edge) != req_def))
+
+    @property
+    def is_empty(self):
+        """
+        Whether there is nothing to update
+
+        :return: True/False
+        :rtype: bool
+        """
+        return not (self.added or self.removed or self.changed or
+                    self.unlinked or self.linked)
+
+    def serialize(self):
+        """
+        Serializes difference into dict object
+
+        :return: serialized difference
+        :rtype: dict
+        """
+        return {
+            'added': sorted(self.added),
+            'removed': sorted(self.removed),
+            'changed': sorted(self.changed),
+            'unlinked': sorted(self.unlinked),
+            'linked': sorted(self.linked),
+        }
@@ -0,0 +1,273 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import collections
+import contextlib
+import itertools
+
+DEFAULT_TENANT = 'default'
+
+
+class FairLimiter(object):
+
+    def __init__(self, max_concurrency=None, tenant_concurrency=None):
+        """
+        Grants lifecycle event slots to many deployments
+
+        Waiting events are served by deployment priority first, then
+        round-robin between deployments, so deployment with many ready
+        events gets one slot per round and does not starve others.
+
+        :param max_concurrency: maximum number of events running
+                                at the same time, None for no limit
+        :type max_concurrency: int
+        :param tenant_concurrency: maximum number of events of single
+                                   tenant running at the same time,
+                                   None for no limit
+        :type tenant_concurrency: int
+        """
+        self.max_concurrency = max_concurrency
+        self.tenant_concurrency = tenant_concurrency
+        self.running = 0
+        self.running_by_tenant = collections.Counter()
+        self.__waiters = collections.OrderedDict()
+        self.__served = {}
+        self.__sequence = itertools.count()
+
+    @property
+    def queue_depth(self):
+        """
+        Represents number of events waiting for slot
+
+        :return: number of waiting events
+        :rtype: int
+        """
+        return sum(len(waiters) for waiters in self.__waiters.values())
+
+    def __has_room(self, tenant):
+        if (self.max_concurrency is not None and
+                self.running >= self.max_concurrency):
+            return False
+        return (self.tenant_concurrency is None or
+                self.running_by_tenant[tenant] < self.tenant_concurrency)
+
+    def __grant(self):
+        while self.__waiters:
+            candidates = [(key, waiters) for key, waiters
+                          in self.__waiters.items()
+                          if self.__has_room(key[0])]
+            if not candidates:
+                return
+            key, waiters = max(candidates, key=lambda item: (
+                item[1][0][0], -self.__served.get(item[0], -1)))
+            _, waiter = waiters.popleft()
+            if not waiters:
+                del self.__waiters[key]
+            self.__served[key] = next(self.__sequence)
+            self.running += 1
+            self.running_by_tenant[key[0]] += 1
+            waiter.set_result(None)
+
+    async def acquire(self, tenant, deployment, priority=0):
+        """
+        Coroutine to wait for event slot
+
+        :param tenant: tenant name
+        :param deployment: deployment name
+        :param priority: deployment priority, higher goes first
+        :return: None
+        :rtype: None
+        """
+        waiter = asyncio.get_event_loop().create_future()
+        key = (tenant, deployment)
+        self.__waiters.setdefault(key, collections.deque()).append(
+            (priority, waiter))
+        self.__grant()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(tenant)
+            else:
+                waiters = self.__waiters.get(key)
+                if waiters is not None:
+                    waiters.remove((priority, waiter))
+                    if not waiters:
+                        del self.__waiters[key]
+            raise
+
+    def release(self, tenant):
+        """
+        Releases event slot
+
+        :param tenant: tenant name
+        :return: None
+        :rtype: None
+        """
+        self.running -= 1
+        self.running_by_tenant[tenant] -= 1
+        self.__grant()
+
+    @contextlib.asynccontextmanager
+    async def slot(self, tenant, deployment, priority=0):
+        """
+        Asynchronous context manager to run event within slot
+
+        :param tenant: tenant name
+        :param deployment: deployment name
+        :param priority: deployment priority, higher goes first
+        """
+        await self.acquire(tenant, deployment, priority=priority)
+        try:
+            yield
+        finally:
+            self.release(tenant)
+
+
+class DeploymentSlots(object):
+
+    def __init__(self, limiter, tenant, deployment, priority=0):
+        """
+        Binds shared limiter to single deployment
+
+        :param limiter: shared limiter
+        :type limiter: FairLimiter
+        :param tenant: tenant name
+        :param deployment: deployment name
+        :param priority: deployment priority, higher goes first
+        """
+        self.limiter = limiter
+        self.tenant = tenant
+        self.deployment = deployment
+        self.priority = priority
+
+    def slot(self):
+        return self.limiter.slot(self.tenant, self.deployment,
+                                 priority=self.priority)
+
+
+class DeploymentEngine(object):
+
+    ACTIONS = ['deploy', 'undeploy']
+
+    def __init__(self, event_loop=None, max_concurrency=None,
+                 tenant_concurrency=None):
+        """
+        Runs many deployment contexts concurrently on single event loop,
+        lifecycle events of all deployments share global and per-tenant
+        limits and are interleaved fairly
+
+        :param event_loop: asyncio or any compatible event loop
+        :param max_concurrency: maximum number of lifecycle events
+                                running at the same time, None for no limit
+        :type max_concurrency: int
+        :param tenant_concurrency: maximum number of lifecycle events
+                                   of single tenant running at the same
+                                   time, None for no limit
+        :type tenant_concurrency: int
+        """
+        self.event_loop = event_loop or asyncio.get_event_loop()
+        self.limiter = FairLimiter(max_concurrency=max_concurrency,
+                                   tenant_concurrency=tenant_concurrency)
+        self.__tasks = collections.OrderedDict()
+
+    def submit(self, context, tenant=DEFAULT_TENANT,
+               priority=0, action='deploy'):
+        """
+        Schedules deployment context action
+
+        :param context: OrchestraContext instance
+        :type context: aiorchestra.core.context.OrchestraContext
+        :param tenant: tenant name
+        :type tenant: str
+        :param priority: deployment priority, higher goes first
+        :type priority: int
+        :param action: context action: deploy or undeploy
+        :type action: str
+        :return: action task
+        :rtype: asyncio.Task
+        """
+        if action not in self.ACTIONS:
+            raise Exception('Unknown deployment action "{0}", '
+                            'expected one of: {1}.'
+                            .format(action, ', '.join(self.ACTIONS)))
+        key = (tenant, context.name)
+        task = self.__tasks.get(key)
+        if task is not None and not task.done():
+            raise Exception('Deployment "{0}" of tenant "{1}" is '
+                            'already running.'.format(context.name, tenant))
+        slots = DeploymentSlots(self.limiter, tenant,
+                                context.name, priority=priority)
+        task = self.event_loop.create_task(
+            self.__run(context, action, slots))
+        self.__tasks[key] = task
+        return task
+
+    @staticmethod
+    async def __run(context, action, slots):
+        """
+        Coroutine to run context action with engine slots as context
+        limiter, limiter context had before is restored afterwards
+
+        :param context: OrchestraContext instance
+        :type context: aiorchestra.core.context.OrchestraContext
+        :param action: context action: deploy or undeploy
+        :type action: str
+        :param slots: deployment slots of engine limiter
+        :type slots: DeploymentSlots
+        :return: action result
+        :rtype: object
+        """
+        limiter, context.limiter = context.limiter, slots
+        try:
+            return await getattr(context, action)()
+        finally:
+            context.limiter = limiter
+
+    @property
+    def queue_depth(self):
+        """
+        Represents number of lifecycle events waiting for slot
+
+        :return: number of waiting events
+        :rtype: int
+        """
+        return self.limiter.queue_depth
+
+    async def wait(self):
+        """
+        Coroutine to wait for all submitted actions
+
+        :return: action errors keyed on tenant and deployment names,
+                 None for succeeded actions
+        :rtype: dict
+        """
+        tasks = list(self.__tasks.items())
+        results = await asyncio.gather(*[task for _, task in tasks],
+                                       return_exceptions=True)
+        for key, _ in tasks:
+            self.__tasks.pop(key, None)
+        return {key: (result if isinstance(result, BaseException)
+                      else None)
+                for (key, _), result in zip(tasks, results)}
+
+    def run_until_complete(self):
+        """
+        Awaits until all submitted actions finished and exits
+
+        :return: action errors keyed on tenant and deployment names
+        :rtype: dict
+        """
+        return self.event_loop.run_until_complete(self.wait())
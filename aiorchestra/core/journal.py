@@ -0,0 +1,298 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import collections
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from concurrent import futures
+
+(STARTED, COMPLETED, FAILED, CANCELLED) = (
+    'started', 'completed', 'failed', 'cancelled')
+
+
+class MemoryJournalStore(object):
+
+    def __init__(self):
+        """
+        Keeps journal entries in memory
+        """
+        self.entries = []
+        self.__lock = threading.Lock()
+
+    def append(self, entry):
+        with self.__lock:
+            self.entries.append(entry)
+
+    def read(self, context_name):
+        with self.__lock:
+            return [e for e in self.entries if e['context'] == context_name]
+
+    def clear(self, context_name):
+        with self.__lock:
+            self.entries = [e for e in self.entries
+                            if e['context'] != context_name]
+
+    def close(self):
+        pass
+
+
+class FileJournalStore(object):
+
+    def __init__(self, path, fsync=False):
+        """
+        Appends journal entries to file as JSON lines, entries of
+        deployment context are cleared by appending marker entry,
+        so file of journal shared by many contexts is not rewritten
+        until it is compacted
+
+        :param path: file path
+        :type path: str
+        :param fsync: whether to flush every entry to disk,
+                      otherwise entries survive process crash
+                      but may be lost on power failure
+        :type fsync: bool
+        """
+        self.path = path
+        self.fsync = fsync
+        self.__lock = threading.Lock()
+        self.__file = open(path, 'a')
+        if self.__file.tell() > 0:
+            with open(path, 'rb') as journal_file:
+                journal_file.seek(-1, os.SEEK_END)
+                if journal_file.read(1) != b'\n':
+                    # terminates line that was not written
+                    # completely before crash
+                    self.__file.write('\n')
+
+    def append(self, entry):
+        line = json.dumps(entry, sort_keys=True, default=repr)
+        with self.__lock:
+            self.__file.write(line + '\n')
+            self.__file.flush()
+            if self.fsync:
+                os.fsync(self.__file.fileno())
+
+    def __read_all(self):
+        entries = []
+        with open(self.path) as journal_file:
+            for line in journal_file:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    # line was not written completely before crash
+                    continue
+        return entries
+
+    def read(self, context_name):
+        entries = []
+        with self.__lock:
+            for entry in self.__read_all():
+                if entry['context'] != context_name:
+                    continue
+                if entry.get('cleared'):
+                    entries = []
+                else:
+                    entries.append(entry)
+        return entries
+
+    def clear(self, context_name):
+        self.append({'context': context_name, 'cleared': True})
+
+    def compact(self):
+        """
+        Rewrites journal file without cleared entries
+
+        :return: None
+        :rtype: None
+        """
+        with self.__lock:
+            entries = self.__read_all()
+            live, dropped = {}, set()
+            for index, entry in enumerate(entries):
+                if entry.get('cleared'):
+                    dropped.update(live.pop(entry['context'], ()))
+                    dropped.add(index)
+                else:
+                    live.setdefault(entry['context'], []).append(index)
+            entries = [entry for index, entry in enumerate(entries)
+                       if index not in dropped]
+            self.__file.close()
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as journal_file:
+                for entry in entries:
+                    journal_file.write(json.dumps(
+                        entry, sort_keys=True, default=repr) + '\n')
+            os.replace(tmp_path, self.path)
+            self.__file = open(self.path, 'a')
+
+    def close(self):
+        with self.__lock:
+            self.__file.close()
+
+
+class SQLiteJournalStore(object):
+
+    def __init__(self, path):
+        """
+        Keeps journal entries in SQLite database
+
+        :param path: database file path
+        :type path: str
+        """
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        with self.__connection:
+            self.__connection.execute(
+                'CREATE TABLE IF NOT EXISTS journal ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'context TEXT NOT NULL, '
+                'entry TEXT NOT NULL)')
+            self.__connection.execute(
+                'CREATE INDEX IF NOT EXISTS journal_context '
+                'ON journal (context)')
+
+    def append(self, entry):
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'INSERT INTO journal (context, entry) VALUES (?, ?)',
+                (entry['context'],
+                 json.dumps(entry, sort_keys=True, default=repr)))
+
+    def read(self, context_name):
+        with self.__lock:
+            rows = self.__connection.execute(
+                'SELECT entry FROM journal WHERE context = ? ORDER BY id',
+                (context_name, )).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def clear(self, context_name):
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'DELETE FROM journal WHERE context = ?', (context_name, ))
+
+    def close(self):
+        with self.__lock:
+            self.__connection.close()
+
+
+class Journal(object):
+
+    def __init__(self, store=None):
+        """
+        Write-ahead journal of node lifecycle and relationship events,
+        each event is recorded before it starts and after it finishes
+        along with state of nodes it changed
+
+        :param store: journal entries store, in-memory store if None
+        """
+        self.store = store if store is not None else MemoryJournalStore()
+        self.__executor = None
+
+    def __run(self, fn, *args):
+        # single writer thread keeps entries in order
+        # and blocking store I/O off event loop
+        if self.__executor is None:
+            self.__executor = futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='aiorchestra-journal')
+        return asyncio.get_event_loop().run_in_executor(
+            self.__executor, fn, *args)
+
+    async def record(self, context, orchestra_node, event, state,
+                     peer=None):
+        """
+        Coroutine to record event state, node state is taken
+        right away and entry is appended to store by writer thread
+
+        :param context: OrchestraContext instance
+        :param orchestra_node: node event runs for,
+                               source node for relationship events
+        :param event: lifecycle or relationship event
+        :param state: event state
+        :param peer: relationship event target node
+        :return: None
+        :rtype: None
+        """
+        entry = {
+            'context': context.name,
+            'node': orchestra_node.name,
+            'event': event,
+            'peer': peer.name if peer else None,
+            'state': state,
+            'time': time.time(),
+        }
+        if state == COMPLETED:
+            entry['nodes'] = {
+                n.name: {'is_provisioned': n.is_provisioned,
+                         'runtime_properties': dict(n.runtime_properties)}
+                for n in (orchestra_node, peer) if n is not None}
+        await self.__run(self.store.append, entry)
+
+    def completed(self, context_name):
+        """
+        Returns entries of events that were completed
+        for deployment context, in order of completion
+
+        :param context_name: deployment context name
+        :type context_name: str
+        :return: entries keyed on node, event and peer names
+        :rtype: collections.OrderedDict
+        """
+        completed = collections.OrderedDict()
+        for entry in self.store.read(context_name):
+            key = (entry['node'], entry['event'], entry['peer'])
+            completed.pop(key, None)
+            if entry['state'] == COMPLETED:
+                completed[key] = entry
+        return completed
+
+    def attempted(self, context_name):
+        """
+        Returns entries of events that were started but neither
+        completed nor failed, because they were cancelled or process
+        died while they were running, so their outcome is unknown
+
+        :param context_name: deployment context name
+        :type context_name: str
+        :return: entries keyed on node, event and peer names
+        :rtype: collections.OrderedDict
+        """
+        attempted = collections.OrderedDict()
+        for entry in self.store.read(context_name):
+            key = (entry['node'], entry['event'], entry['peer'])
+            attempted.pop(key, None)
+            if entry['state'] in [STARTED, CANCELLED]:
+                attempted[key] = entry
+        return attempted
+
+    async def clear(self, context_name):
+        """
+        Coroutine to drop entries of deployment context
+
+        :param context_name: deployment context name
+        :type context_name: str
+        :return: None
+        :rtype: None
+        """
+        await self.__run(self.store.clear, context_name)
+
+    def close(self):
+        if self.__executor is not None:
+            self.__executor.shutdown()
+        self.store.close()
@@ -12,8 +12,17 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import atexit
 import logging
+import os
+import queue
 import sys
+import threading
+
+from logging import handlers
+
+
+_LISTENERS = []
 
 
 def common_logger_setup(
@@ -36,16 +45,94 @@ def common_logger_setup(
     return log_handler, level
 
 
+def queue_logger_setup(log_handler):
+    """
+    Wraps log handler with queue handler, records are emitted
+    by listener thread, so slow disk does not block event loop
+
+    :param log_handler: log handler doing actual I/O
+    :type log_handler: logging.Handler
+    :return: queue log handler
+    :rtype: logging.handlers.QueueHandler
+    """
+    log_queue = queue.Queue(-1)
+    listener = handlers.QueueListener(
+        log_queue, log_handler, respect_handler_level=True)
+    listener.start()
+    _LISTENERS.append(listener)
+    return handlers.QueueHandler(log_queue)
+
+
+def stop_queue_listeners():
+    """
+    Stops queue listeners, pending records are emitted before stop
+
+    :return: None
+    :rtype: None
+    """
+    while _LISTENERS:
+        _LISTENERS.pop().stop()
+
+
+atexit.register(stop_queue_listeners)
+
+
+class HandlerRegistry(object):
+
+    def __init__(self):
+        """
+        Registry of log handlers shared between loggers, so each
+        log destination is opened once no matter how many times
+        loggers are set up
+        """
+        self.__handlers = {}
+        self.__lock = threading.Lock()
+
+    def get(self, filename='/tmp/aiorchestra.log', formatter=None,
+            log_to_console=False, non_blocking=False):
+        """
+        Returns registered log handler, creates it if necessary
+
+        :param filename: log file name
+        :param formatter: log record format
+        :param log_to_console: whether to log to stdout instead of file
+        :param non_blocking: whether to emit records from listener thread
+        :return: log handler
+        :rtype: logging.Handler
+        """
+        key = ('stdout' if log_to_console else os.path.abspath(filename),
+               formatter, non_blocking)
+        with self.__lock:
+            if key not in self.__handlers:
+                log_handler, _ = common_logger_setup(
+                    filename=filename,
+                    log_to_console=log_to_console,
+                    log_formatter=formatter)
+                if non_blocking:
+                    log_handler = queue_logger_setup(log_handler)
+                self.__handlers[key] = log_handler
+            return self.__handlers[key]
+
+    def __len__(self):
+        return len(self.__handlers)
+
+
+HANDLERS = HandlerRegistry()
+
+
 def setup_logging(name, filename='/tmp/aiorchestra.log',
-                  level=logging.DEBUG, log_to_console=False, formatter=None):
-    log_file_handler, log_level = common_logger_setup(
+                  level=logging.DEBUG, log_to_console=False, formatter=None,
+                  non_blocking=False, registry=None):
+    registry = registry if registry is not None else HANDLERS
+    log_handler = registry.get(
         filename=filename,
-        level=level,
+        formatter=formatter,
         log_to_console=log_to_console,
-        log_formatter=formatter)
+        non_blocking=non_blocking)
     logger = logging.getLogger(name)
-    logger.addHandler(log_file_handler)
-    logger.setLevel(log_level)
+    if log_handler not in logger.handlers:
+        logger.addHandler(log_handler)
+    logger.setLevel(level)
     return logger
 
 
@@ -60,8 +147,11 @@ class Singleton(type):
 
 class UnifiedLogger(object):
 
+    registry = HANDLERS
+
     def __init__(self, filename='/tmp/aiorchestra.log',
-                 level=logging.DEBUG, log_to_console=False):
+                 level=logging.DEBUG, log_to_console=False,
+                 non_blocking=False):
         self.filename = filename
         self.level = level
         if 'DEBUG' not in level:
@@ -77,9 +167,26 @@ class UnifiedLogger(object):
                 '%(funcName)s - '
                 '%(message)s')
         self.log_to_console = log_to_console
+        self.non_blocking = non_blocking
 
     def setup_logger(self, name):
         return setup_logging(name, filename=self.filename,
                              level=self.level,
                              log_to_console=self.log_to_console,
-                             formatter=self.log_formatter)
+                             formatter=self.log_formatter,
+                             non_blocking=self.non_blocking,
+                             registry=self.registry)
+
+    def setup_child_logger(self, name, child):
+        """
+        Returns adapter of parent logger that adds child name to
+        log records as "context" attribute, so no logger is registered
+        per child and records are emitted by parent logger handlers
+
+        :param name: parent logger name
+        :param child: child name, deployment context name
+        :return: logger adapter
+        :rtype: logging.LoggerAdapter
+        """
+        return logging.LoggerAdapter(self.setup_logger(name),
+                                     {'context': child})
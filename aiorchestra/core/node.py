@@ -12,19 +12,78 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import asyncio
+import collections
+import collections.abc
+import functools
 import importlib
 import sys
 
 from toscaparser import functions
 
+from aiorchestra.core import journal as event_journal
 from aiorchestra.core import noop
+from aiorchestra.core import ratelimit
+from aiorchestra.core import tracing
+from aiorchestra.core import utils
 
 
+_MISSING = object()
+
+STANDARD_EVENTS = ['create', 'configure', 'start', 'stop', 'delete']
+
+RelationshipEdge = collections.namedtuple(
+    'RelationshipEdge', ['source', 'target', 'relationship', 'events'])
+
 RELATIONSHIP_STABS = {
     'link': 'aiorchestra.core.noop:link',
     'unlink': 'aiorchestra.core.noop:unlink',
 }
 
+SCALABLE_CAPABILITY = 'tosca.capabilities.Scalable'
+
+INSTANCE_NAME = '{0}.{1}'
+
+
+def is_scalable_capability(capability):
+    """
+    Checks if node template capability is scalable capability
+
+    :param capability: node template capability
+    :type capability: toscaparser.capabilities.Capability
+    :return: True/False
+    :rtype: bool
+    """
+    return (capability.definition.type == SCALABLE_CAPABILITY or
+            capability.definition.is_derived_from(SCALABLE_CAPABILITY))
+
+
+def scalable_limits(node_template):
+    """
+    Returns default, minimum and maximum number of instances
+    of TOSCA node template with scalable capability
+
+    :param node_template: TOSCA graph node
+    :type node_template: toscaparser.nodetemplate.NodeTemplate
+    :return: default, minimum and maximum number of instances,
+             None if node template is not scalable
+    :rtype: tuple
+    """
+    for cap in node_template.get_capabilities_objects():
+        if not is_scalable_capability(cap):
+            continue
+        limits = []
+        for name, default in [('default_instances', None),
+                              ('min_instances', 0),
+                              ('max_instances', None)]:
+            value = cap.get_property_value(name)
+            if isinstance(value, functions.Function):
+                value = value.result()
+            limits.append(default if value is None else int(value))
+        if limits[0] is None:
+            limits[0] = max(1, limits[1])
+        return tuple(limits)
+
 
 def check_for_event_definition(action):
     def wraps(*args, **kwargs):
@@ -33,10 +92,9 @@ def check_for_event_definition(action):
         if not available:
 
             def stab(*args, **kwargs):
-                msg = ('Lifecycle event "{0}" was not implemented '
-                       'for node "{1}". Skipping.'
-                       .format(event, node.name))
-                self.context.logger.debug(msg)
+                self.context.logger.debug(
+                    'Lifecycle event "%s" was not implemented '
+                    'for node "%s". Skipping.', event, node.name)
                 return None, None
 
             return stab(*args, **kwargs)
@@ -48,32 +106,94 @@ def check_for_event_definition(action):
 def lifecycle_event_handler(action):
 
     undeploy_actions = ['stop', 'delete']
+    relationship_actions = ['link', 'unlink']
+
+    async def journaled(*args, **kwargs):
+        self = args[0]
+        context = self.context
+        node, peer = self, None
+        if action.__name__ in relationship_actions:
+            node, peer = args[1], self
+        key = (node.name, action.__name__, peer.name if peer else None)
+        if key in context.resumed_events:
+            context.logger.debug('Event %s of node %s was completed '
+                                 'before resume. Skipping.',
+                                 action.__name__, node.name)
+            return
+        journal = context.journal
+        if journal is None:
+            return await traced(*args, **kwargs)
+        await journal.record(context, node, action.__name__,
+                             event_journal.STARTED, peer=peer)
+        try:
+            await traced(*args, **kwargs)
+        except asyncio.CancelledError:
+            await journal.record(context, node, action.__name__,
+                                 event_journal.CANCELLED, peer=peer)
+            raise
+        except BaseException:
+            await journal.record(context, node, action.__name__,
+                                 event_journal.FAILED, peer=peer)
+            raise
+        await journal.record(context, node, action.__name__,
+                             event_journal.COMPLETED, peer=peer)
+
+    async def traced(*args, **kwargs):
+        self = args[0]
+        tracer = self.context.tracer
+        if tracer is None:
+            return await wraps(*args, **kwargs)
+        node, peer = self, None
+        if action.__name__ in relationship_actions:
+            node, peer = args[1], self
+        record, token = tracer.start(
+            self.context, node, action.__name__, peer=peer)
+        try:
+            await wraps(*args, **kwargs)
+        except asyncio.CancelledError as ex:
+            tracer.finish(record, token, tracing.CANCELLED, error=ex)
+            raise
+        except Exception as ex:
+            tracer.finish(record, token, tracing.FAILED, error=ex)
+            raise
+        tracer.finish(record, token, tracing.SUCCEEDED)
 
     async def wraps(*args, **kwargs):
         self = list(args)[0]
-        self.context.logger.debug('Attempting to run {0} event for '
-                                  'node {1}.'
-                                  .format(action.__name__, self.name))
+        self.context.logger.debug('Attempting to run %s event for '
+                                  'node %s.', action.__name__, self.name)
         try:
             if action.__name__ in undeploy_actions:
                 if self.context.rollback_enabled:
-                    if not self.is_provisioned:
+                    if (not self.is_provisioned and
+                            'create' not in self.completed_events):
                         self.context.logger.info(
                             '[{0}] - Unable to rollback node '
                             'because it was not provisioned.'
                             .format(self.name))
                         return await noop.noop(*args, **kwargs)
             result = action(*args, **kwargs)
-            self.context.logger.debug('Event {0} finished successfully for '
-                                      'node {1}.'
-                                      .format(action.__name__, self.name))
+            self.context.logger.debug('Event %s finished successfully for '
+                                      'node %s.', action.__name__, self.name)
             await result
+            if action.__name__ == 'delete':
+                self.completed_events.clear()
+            elif action.__name__ not in relationship_actions:
+                self.completed_events.add(action.__name__)
+        except asyncio.CancelledError:
+            if action.__name__ == 'create':
+                # create cancelled in flight may have left
+                # resources behind, so node is rolled back anyway
+                self.completed_events.add(action.__name__)
+            raise
         except Exception as ex:
             self.is_provisioned = False
             self.context.logger.error(str(ex))
             raise ex
 
-    return wraps
+    journaled.__name__ = action.__name__
+    journaled.__doc__ = action.__doc__
+    return journaled
 
 
 class InterfaceOperations(object):
@@ -83,6 +203,8 @@ class InterfaceOperations(object):
         self.node_type = node.type_definition
         self.interface_implementations = node.type_definition.interfaces
         self.check_required_lifecycle_events(node, 'Standard')
+        self.__implementations = {}
+        self.__standard_tasks = {}
 
     def check_event_availability(self, check_event, lifecycle_type):
         return check_event in [
@@ -107,7 +229,9 @@ class InterfaceOperations(object):
         __current_events = node.type_definition.interfaces.get(
             'Standard')
         implementation = __current_events[event]['implementation']
-        inputs = __current_events[event].get('inputs', {})
+        # parsed TOSCA templates are shared between contexts,
+        # so type definition inputs should never be updated in place
+        inputs = dict(__current_events[event].get('inputs') or {})
         if 'interfaces' in node.node.entity_tpl:
             node_events = node.node.entity_tpl[
                 'interfaces']['Standard']
@@ -118,7 +242,7 @@ class InterfaceOperations(object):
                 inputs.update(template_inputs)
         return implementation, inputs
 
-    def __get_relationship_entity(self, target, source):
+    def __get_relationship_entities(self, source):
         relationship_events = {n.name: rel.type
                                for n, rel in source.node.related.items()}
         _required_nodes = [list(node.values())[0]
@@ -130,11 +254,10 @@ class InterfaceOperations(object):
             elif isinstance(_req, dict):
                 rel_mapping[_req['node']] = _req['relationship']
 
-        return rel_mapping.get(target.name)
+        return rel_mapping
 
-    def __get_relationship_event(self, target, source, event):
+    def __get_relationship_event(self, relationship, source, event):
         custom_defs = source.custom_defs
-        relationship = self.__get_relationship_entity(target, source)
         if relationship in custom_defs:
             impl_def = custom_defs[relationship]['interfaces']['Configure']
             event_def = impl_def[event]
@@ -142,7 +265,53 @@ class InterfaceOperations(object):
         else:
             return RELATIONSHIP_STABS[event], {}
 
+    def relationship_events(self, relationship, source):
+        """
+        Resolves relationship link and unlink implementations and inputs
+
+        :param relationship: relationship type, None for stabs
+        :param source: source OrchestraNode instance
+        :return: mapping of relationship event to implementation and inputs
+        :rtype: dict
+        """
+        events = {}
+        for event in RELATIONSHIP_STABS:
+            impl, inputs = self.__get_relationship_event(
+                relationship, source, event)
+            inputs = dict(inputs or {})
+            backend = ratelimit.backend_key(impl, inputs)
+            inputs.pop(ratelimit.BACKEND_INPUT, None)
+            events[event] = (self.import_task_method(impl, event, source),
+                             inputs, backend)
+        return events
+
+    def relationship_edges(self, source):
+        """
+        Resolves relationships from source node to each node it requires
+
+        :param source: source OrchestraNode instance
+        :return: relationship edges
+        :rtype: list of aiorchestra.core.node.RelationshipEdge
+        """
+        edges = []
+        relationships = self.__get_relationship_entities(source)
+        for target_name, relationship in sorted(relationships.items()):
+            events = self.relationship_events(relationship, source)
+            for instance_name in self.context.instance_names(target_name):
+                edges.append(RelationshipEdge(
+                    source, self.context.node_from_name(instance_name),
+                    relationship, events))
+        return edges
+
     def import_task_method(self, impl, event, node):
+        if impl in self.__implementations:
+            return self.__implementations[impl]
+        task = self.__import_task_method(impl, event, node)
+        if task:
+            self.__implementations[impl] = task
+        return task
+
+    def __import_task_method(self, impl, event, node):
         if impl:
             parts = impl.split(":")
             if len(parts) != 2:
@@ -164,42 +333,130 @@ class InterfaceOperations(object):
                    'implementation.'.format(event, node.name))
             self.context.logger.debug(msg)
 
+    def get_standard_task(self, node, event):
+        """
+        Returns node standard lifecycle event implementation, inputs
+        and rate limit backend, all are resolved once and cached
+
+        :param node: OrchestraNode instance
+        :param event: node standard lifecycle event
+        :return: implementation, inputs and rate limit backend
+        :rtype: tuple
+        """
+        if event not in self.__standard_tasks:
+            impl, inputs = self.__get_standard_event(node, event)
+            inputs = dict(inputs or {})
+            backend = ratelimit.backend_key(impl, inputs)
+            inputs.pop(ratelimit.BACKEND_INPUT, None)
+            task = self.import_task_method(impl, event, node)
+            self.__standard_tasks[event] = (task, inputs, backend)
+        return self.__standard_tasks[event]
+
+    def resolve_standard_events(self, node):
+        """
+        Resolves implementations of all node standard lifecycle events,
+        so invalid references fail before deployment is started
+
+        :param node: OrchestraNode instance
+        :return: None
+        :rtype: None
+        """
+        for event in STANDARD_EVENTS:
+            self.get_standard_task(node, event)
+
+    async def __run_task(self, backend, task, *args):
+        rate_limiter = self.context.rate_limiter
+        if rate_limiter is None:
+            return await utils.run_task(self.context, task, *args)
+        return await rate_limiter.run(
+            backend, utils.run_task, self.context, task, *args)
+
     async def run_standard_event(self, node, event):
-        impl, inputs = self.__get_standard_event(node, event)
-        task = self.import_task_method(impl, event, node)
+        task, inputs, backend = self.get_standard_task(node, event)
         if task:
-            await task(node, inputs)
+            await self.__run_task(backend, task, node, dict(inputs))
 
     async def run_relationship_event(self, target, source, event):
-        impl, inputs = self.__get_relationship_event(target, source, event)
-        task = self.import_task_method(impl, event, source)
+        edge = self.context.relationship_edge(source, target)
+        task, inputs, backend = edge.events[event]
         if task:
-            await task(source, target, inputs)
+            await self.__run_task(backend, task,
+                                  source, target, dict(inputs))
+
+
+class OrchestraNodeAttributes(collections.abc.Mapping):
+
+    def __init__(self, node, names):
+        """
+        Read-only view of node attributes over node runtime properties.
+        Declared attributes are available only while node is provisioned,
+        attributes that were not set during provisioning are None.
+
+        :param node: OrchestraNode instance
+        :type node: aiorchestra.core.node.OrchestraNode
+        :param names: declared attribute names
+        :type names: list of str
+        """
+        self.__node = node
+        self.__names = tuple(names)
+        self.__declared = frozenset(names)
+
+    def __contains__(self, name):
+        return self.__node.is_provisioned and name in self.__declared
+
+    def __getitem__(self, name):
+        if name not in self:
+            raise KeyError(name)
+        return self.__node.runtime_properties.get(name)
+
+    def __iter__(self):
+        return iter(self.__names if self.__node.is_provisioned else ())
+
+    def __len__(self):
+        return len(self.__names) if self.__node.is_provisioned else 0
+
+    def __repr__(self):
+        return repr(dict(self))
 
 
 class OrchestraNode(object):
 
-    def __init__(self, context, node):
+    def __init__(self, context, node, instance=None):
         """
         Create an instance of an advanved TOSCA graph node
         :param context: OrchestraContext instance
         :type context: aiorchestra.core.context.OrchestraContext
         :param node: TOSCA graph node
         :type node: toscaparser.nodetemplate.NodeTemplate
+        :param instance: instance index of scalable node template,
+                         None if node template is not scalable
+        :type instance: int
         """
         self.context = context
         self.node = node
+        self.instance = instance
         self.operations = InterfaceOperations(context, node)
-        self.__name = node.name
+        self.__name = (node.name if instance is None
+                       else INSTANCE_NAME.format(node.name, instance))
         self.__properties = {}
-        self.__attributes = {}
         self.__provisioned = False
         self.__runtime_properties = {}
+        # standard lifecycle events completed since node was created,
+        # create cancelled in flight counts as completed
+        self.completed_events = set()
         self.__type_defs = node.type_definition
         self.__prop_def = node._properties
+        self.__function_properties = [
+            input_ref for input_ref in self.__prop_def
+            if isinstance(input_ref.value, (functions.GetInput,
+                                            functions.GetProperty,
+                                            functions.GetAttribute))]
+        self.__resolved_inputs = None
         self.__node_type = node.type
         self.__node_type_def = self.__type_defs.custom_def[self.node.type]
         self.__custom_defs = self.__type_defs.custom_def
+        self.__attributes = OrchestraNodeAttributes(
+            self, self.__node_type_def.get('attributes', {}).keys())
 
     @property
     def custom_defs(self):
@@ -283,13 +540,13 @@ class OrchestraNode(object):
         """
         for cap in self.capabilities:
             if cap.name == name:
-                cap_def = cap._properties
+                cap_def = dict(cap._properties)
                 for prop_name, prop_value in cap_def.items():
                     if functions.is_function(prop_value):
                         value = self.__process_tosca_function_result(
                             prop_value)
                         cap_def[prop_name] = value
-                return cap._properties
+                return cap_def
 
     def __process_tosca_function_result(self, tosca_function_def_dict):
         func = functions.get_function(
@@ -354,12 +611,11 @@ class OrchestraNode(object):
         :return:
         """
         if name in self.artifacts:
-            artifact = self.artifacts[name]
+            artifact = dict(self.artifacts[name])
             for k, v in artifact.items():
                 if functions.is_function(v):
                     func = functions.get_function(
                             self.context._tmplt, self.node, v)
-                    del artifact[k][func.name]
                     if not isinstance(func, functions.GetInput):
                         raise Exception('[{0}] - Unsupported intrinsic '
                                         'function "{1}" for '
@@ -373,21 +629,21 @@ class OrchestraNode(object):
 
     # TODO(denismakogon): define OrchestraNodeProperties class
     def __setup_properties(self):
-        self.context.logger.debug('Initializing node {0} properties.'
-                                  .format(self.name))
+        self.context.logger.debug('Initializing node %s properties.',
+                                  self.name)
         for input_ref in self.property_definishion:
             if input_ref.value is not None:
-                self.context.logger.debug('Attempting to resolve node {0} '
-                                          'properties for TOSCA functions.'
-                                          .format(self.name))
+                self.context.logger.debug('Attempting to resolve node %s '
+                                          'properties for TOSCA functions.',
+                                          self.name)
                 value = None
                 if isinstance(input_ref.value, functions.GetInput):
                     if (input_ref.value.input_name in
                             self.context.template_inputs):
                         self.context.logger.debug(
-                            'Property {0} for node {1} '
-                            'was resolved by TOSCA get_input function.'
-                            .format(input_ref.value.input_name, self.name))
+                            'Property %s for node %s '
+                            'was resolved by TOSCA get_input function.',
+                            input_ref.value.input_name, self.name)
                         value = self.context.template_inputs[
                             input_ref.value.input_name]
                     else:
@@ -402,20 +658,18 @@ class OrchestraNode(object):
                                     in self.context.inputs_definitions]:
                                 self.context.logger.debug(
                                     'Attempting to look-up for default '
-                                    'value for node "{0}" property "{1}" '
-                                    'in TOSCA template input definitions'
-                                    .format(self.name,
-                                            input_ref.value.input_name))
+                                    'value for node "%s" property "%s" '
+                                    'in TOSCA template input definitions',
+                                    self.name, input_ref.value.input_name)
                                 for i in self.context.inputs_definitions:
                                     if i.name == input_ref.value.input_name:
                                         self.context.logger.debug(
-                                            'Default value for node "{0}" '
-                                            'property "{1}" in TOSCA template '
+                                            'Default value for node "%s" '
+                                            'property "%s" in TOSCA template '
                                             'input definitions was found'
-                                            ' - {2}.'.format(
-                                                self.name,
-                                                input_ref.value.input_name,
-                                                str(i.default)))
+                                            ' - %s.', self.name,
+                                            input_ref.value.input_name,
+                                            i.default)
                                         value = i.default
                             else:
                                 msg = ('Node {0} non-required property "{1}" '
@@ -424,7 +678,7 @@ class OrchestraNode(object):
                                        .format(self.name,
                                                input_ref.value.input_name,
                                                input_ref.type))
-                                self.context.logger.warn(msg)
+                                self.context.logger.warning(msg)
                                 try:
                                     _type = (
                                         'str' if input_ref.type == 'string'
@@ -438,15 +692,15 @@ class OrchestraNode(object):
                                         'that custom type was used. '
                                         'Falling back to None'
                                         .format(input_ref.type, self.name))
-                                    self.context.logger.warn(msg)
+                                    self.context.logger.warning(msg)
                                     self.context.logger.error(str(e))
                                     value = input_ref.default
                 elif isinstance(input_ref.value, (str, dict, int,
                                                   float, list, bool)):
                     self.context.logger.debug(
-                        'Property {0} for node {1} '
-                        'was resolved by assigned value in its definition.'
-                        .format(input_ref.name, self.name))
+                        'Property %s for node %s '
+                        'was resolved by assigned value in its definition.',
+                        input_ref.name, self.name)
                     value = input_ref.value
                 elif isinstance(input_ref.value, functions.GetProperty):
                     ref_node = self.context.node_from_name(
@@ -455,9 +709,9 @@ class OrchestraNode(object):
                         value = ref_node.properties[
                             input_ref.value.property_name]
                         self.context.logger.debug(
-                            'Property {0} for node {1} was resolved by '
-                            'assigned value in its definition.'
-                            .format(input_ref.name, self.name))
+                            'Property %s for node %s was resolved by '
+                            'assigned value in its definition.',
+                            input_ref.name, self.name)
                     else:
                         msg = ('Node {0} does not have referenced property.'
                                .format(ref_node.name))
@@ -472,24 +726,48 @@ class OrchestraNode(object):
                             value = ref_node.attributes[
                                 input_ref.value.attribute_name]
                             self.context.logger.debug(
-                                'Property {0} for node {1} was resolved '
-                                'by TOSCA get_attribute function.'
-                                .format(input_ref.name, self.name))
+                                'Property %s for node %s was resolved '
+                                'by TOSCA get_attribute function.',
+                                input_ref.name, self.name)
                     else:
-                        msg = (
-                            'Unable to get node "{0}" attribute "{1}" '
+                        self.context.logger.debug(
+                            'Unable to get node "%s" attribute "%s" '
                             'because node is not provisioned. Pre-deployment '
-                            'validation failed because node "{2}" has TOSCA '
+                            'validation failed because node "%s" has TOSCA '
                             'get_attribute function usage that can be '
-                            'resolved only at deployment time.'.format(
-                                input_ref.value.node_template_name,
-                                input_ref.value.attribute_name,
-                                self.name))
-                        self.context.logger.debug(msg)
+                            'resolved only at deployment time.',
+                            input_ref.value.node_template_name,
+                            input_ref.value.attribute_name,
+                            self.name)
                 self.__properties.update(
                     {input_ref.name: value})
-        self.context.logger.debug('Node "{0}" properties: {1}.'.format(
-            self.name, str(self.__properties)))
+        self.context.logger.debug('Node "%s" properties: %s.',
+                                  self.name, self.__properties)
+
+    def __properties_inputs(self):
+        """
+        Collects values that node properties resolution depends on:
+        template inputs, referenced node properties and attributes
+
+        :return: property resolution inputs
+        :rtype: list
+        """
+        inputs = []
+        for input_ref in self.__function_properties:
+            func = input_ref.value
+            if isinstance(func, functions.GetInput):
+                inputs.append(self.context.template_inputs.get(
+                    func.input_name, _MISSING))
+                continue
+            ref_node = self.context.node_from_name(func.node_template_name)
+            if isinstance(func, functions.GetProperty):
+                inputs.append(ref_node.properties.get(
+                    func.property_name, _MISSING))
+            else:
+                inputs.append((ref_node.is_provisioned,
+                               ref_node.runtime_properties.get(
+                                   func.attribute_name, _MISSING)))
+        return inputs
 
     def process_output(self, node_output_definition):
         """
@@ -520,45 +798,20 @@ class OrchestraNode(object):
                 raise Exception(msg)
             return self.properties[name]
 
-    # TODO(denismakogon): define OrchestraNodeAttributes class
     # TODO(denismakogon): define OrchestraNodeRuntimeProperties class
-    def __setup_attributes_definition_for_node_instance(self):
-        __attributes = list(
-            self.node_type_definition.get('attributes', {}).keys())
-        if not self.is_provisioned:
-            msg = ('Can not validate attributes for node "{0}" '
-                   'because it was not provisioned.'.format(self.name))
-            self.context.logger.debug(msg)
-        else:
-            self.context.logger.debug(
-                'Attempting to process node "{0}" '
-                'attributes: {1}.'.format(
-                    self.name, str(__attributes)))
-            for attr in __attributes:
-                if attr not in self.__runtime_properties:
-                    msg = ('Node "{0}" attribute "{1}" was not '
-                           'initialized during provisioning, '
-                           'falling backe to None'.format(self.name, attr))
-                    self.context.logger.debug(msg)
-                value = self.__runtime_properties.get(attr)
-                self.context.logger.debug('Node "{0}" attribute "{1}" was '
-                                          'initialized with value "{2}".'
-                                          .format(self.name, attr, value))
-                self.__attributes.update({
-                    attr: value
-                })
-
     def attempt_to_validate(self):
         """
-        Validates node using its properties and attributes
+        Validates node using its properties, attributes
+        and lifecycle events implementations
 
         :return:
         """
         try:
             self.context.logger.debug(
-                'Validating properties for node "{0}".'.format(self.name))
+                'Validating properties for node "%s".', self.name)
             self.properties
             self.attributes
+            self.operations.resolve_standard_events(self)
         except Exception as ex:
             self.context.logger.error(
                 "Unable to validate node {0}. Reason: {1}"
@@ -575,6 +828,16 @@ class OrchestraNode(object):
         """
         return self.__name
 
+    @property
+    def template_name(self):
+        """
+        Represents name of TOSCA node template node is instance of
+
+        :return: node template name
+        :rtype: str
+        """
+        return self.node.name
+
     @property
     def is_provisioned(self):
         """
@@ -597,14 +860,16 @@ class OrchestraNode(object):
     @property
     def properties(self):
         """
-        Represents initialized node properties
+        Represents initialized node properties, properties are resolved
+        again only if template inputs or referenced nodes were changed
 
         :return: node properties
         :rtype: dict
         """
-        self.context.logger.debug('Retrieving node {0} properties.'
-                                  .format(self.name))
-        self.__setup_properties()
+        inputs = self.__properties_inputs()
+        if inputs != self.__resolved_inputs:
+            self.__setup_properties()
+            self.__resolved_inputs = inputs
         return self.__properties
 
     @properties.setter
@@ -642,12 +907,12 @@ class OrchestraNode(object):
     @property
     def attributes(self):
         """
-        Represents node attributes
+        Represents node attributes as a live view over
+        runtime properties filtered by declared attributes
 
         :return: attributes
-        :rtype: dict
+        :rtype: aiorchestra.core.node.OrchestraNodeAttributes
         """
-        self.__setup_attributes_definition_for_node_instance()
         return self.__attributes
 
     def get_attribute(self, attr):
@@ -707,17 +972,17 @@ class OrchestraNode(object):
     @property
     def parent_nodes(self):
         """
-        Returns a list of parent nodes
+        Returns a list of parent nodes, node requires
+        each instance of scalable node template
 
         :return: parents
         :rtype: list of str
         """
         required = []
         for node in [list(n.values())[0] for n in self.node._requirements]:
-            if isinstance(node, str):
-                required.append(node)
-            elif isinstance(node, dict):
-                required.append(node['node'])
+            if isinstance(node, dict):
+                node = node['node']
+            required.extend(self.context.instance_names(node))
         return required
 
     def get_requirement_capability(self, target):
@@ -732,11 +997,12 @@ class OrchestraNode(object):
         for req in self.node._requirements:
             for _, req_def in req.items():
                 if isinstance(req_def, dict):
-                    if req_def['node'] == target.name:
-                        cap_def = req_def.get('capability',
-                                              {'properties': {}})
-                        del cap_def['type']
-                        props = cap_def['properties']
+                    if req_def['node'] == target.template_name:
+                        cap_def = dict(req_def.get('capability',
+                                                   {'properties': {}}))
+                        cap_def.pop('type', None)
+                        props = dict(cap_def['properties'])
+                        cap_def['properties'] = props
                         for prop, value in props.items():
                             if functions.is_function(value):
                                 new_value = (
@@ -766,6 +1032,17 @@ class OrchestraNode(object):
         """
         return [list(req.values())[0] for req in self.node.requirements]
 
+    @property
+    def required_targets(self):
+        """
+        Represents nodes from deployment plan this node links to
+
+        :return: required nodes
+        :rtype: list of aiorchestra.core.node.OrchestraNode
+        """
+        return [target for target in self.context.deployment_plan[self]
+                if target.name != self.name]
+
     @lifecycle_event_handler
     async def link(self, source):
         """
@@ -796,10 +1073,10 @@ class OrchestraNode(object):
         :return: None
         :rtype: None
         """
-        for target in self.context.deployment_plan[self]:
-            if target.name != self.name:
-                await target.link(self)
-
+        await utils.gather_limited(
+            [functools.partial(target.link, self)
+             for target in self.required_targets],
+            limit=self.context.link_concurrency)
         await self.operations.run_standard_event(self, 'create')
         self.is_provisioned = True
 
@@ -842,9 +1119,10 @@ class OrchestraNode(object):
         :rtype: None
         """
         await self.operations.run_standard_event(self, 'delete')
-        for target in self.context.deployment_plan[self]:
-            if target.name != self.name:
-                await target.unlink(self)
+        await utils.gather_limited(
+            [functools.partial(target.unlink, self)
+             for target in self.required_targets],
+            limit=self.context.link_concurrency)
         self.is_provisioned = False
 
     def __repr__(self):
@@ -861,8 +1139,9 @@ class OrchestraNode(object):
             '__name': self.name,
             'is_provisioned': self.__provisioned,
             '__properties': self.__properties,
-            '__attributes': self.__attributes,
+            '__attributes': dict(self.__attributes),
             'runtime_properties': self.runtime_properties,
+            'completed_events': sorted(self.completed_events),
         }
 
     def load(self, **kwargs):
@@ -872,7 +1151,14 @@ class OrchestraNode(object):
         :param kwargs: node attributes
         :return: node
         :rtype: OrchestraNode
-        """
-        for k, v in kwargs.items():
-            setattr(self, k, v)
+        :raises: exception if serialized node has different name
+        """
+        name = kwargs.get('__name', self.name)
+        if name != self.name:
+            raise Exception('Unable to load node "{0}" from serialized '
+                            'node "{1}".'.format(self.name, name))
+        self.runtime_properties = dict(
+            kwargs.get('runtime_properties') or {})
+        self.is_provisioned = kwargs.get('is_provisioned', False)
+        self.completed_events = set(kwargs.get('completed_events') or ())
         return self
@@ -23,18 +23,18 @@ async def noop(*args, **kwargs):
 @utils.operation
 async def link(source, target, inputs):
     source.context.logger.debug(
-        '[{0} {2} {1}] - Relationship implementation was not '
-        'found, using stab for "{3}" event.'
-        .format(target.name, source.name, '----->', 'link'))
+        '[%s %s %s] - Relationship implementation was not '
+        'found, using stab for "%s" event.',
+        target.name, '----->', source.name, 'link')
     source.batch_update_runtime_properties(**target.runtime_properties)
 
 
 @utils.operation
 async def unlink(source, target, inputs):
     source.context.logger.debug(
-        '[{0} {2} {1}] - Relationship implementation was not '
-        'found, using stab for "{3}" event.'
-        .format(target.name, source.name, '--X-->', 'unlink'))
+        '[%s %s %s] - Relationship implementation was not '
+        'found, using stab for "%s" event.',
+        target.name, '--X-->', source.name, 'unlink')
     for k in target.runtime_properties:
         if k in source.runtime_properties:
             del source.runtime_properties[k]
@@ -0,0 +1,276 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+
+from aiorchestra.core import tracing
+
+BACKEND_INPUT = 'rate_limit_backend'
+
+
+class ThrottlingError(Exception):
+
+    def __init__(self, message='operation was throttled', retry_after=None):
+        """
+        Raised by plugin operations when backend throttled request,
+        operation is retried once backend limit backed off
+
+        :param message: error message
+        :param retry_after: number of seconds backend asked to wait,
+                            backend limit backoff is used if None
+        :type retry_after: float
+        """
+        super(ThrottlingError, self).__init__(message)
+        self.retry_after = retry_after
+
+
+def backend_key(implementation, inputs=None):
+    """
+    Returns rate limit backend of operation: backend declared
+    by operation inputs or module of operation implementation
+
+    :param implementation: operation implementation reference
+    :type implementation: str
+    :param inputs: operation inputs
+    :type inputs: dict
+    :return: backend key
+    :rtype: str
+    """
+    declared = (inputs or {}).get(BACKEND_INPUT)
+    if declared:
+        return declared
+    return implementation.split(':')[0] if implementation else None
+
+
+class TokenBucket(object):
+
+    def __init__(self, rate, burst=1):
+        """
+        Token bucket that is refilled with rate tokens per second
+
+        :param rate: number of tokens per second
+        :type rate: float
+        :param burst: bucket capacity
+        :type burst: int
+        """
+        self.rate = float(rate)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.__updated = None
+        # created by running event loop, so bucket
+        # could be built before event loop is set
+        self.__lock = None
+
+    def __refill(self, now):
+        if self.__updated is not None:
+            self.tokens = min(self.burst, self.tokens +
+                              (now - self.__updated) * self.rate)
+        self.__updated = now
+
+    async def acquire(self):
+        """
+        Coroutine to take token, waits in FIFO order until
+        bucket is refilled
+
+        :return: None
+        :rtype: None
+        """
+        event_loop = asyncio.get_event_loop()
+        if self.__lock is None:
+            self.__lock = asyncio.Lock()
+        async with self.__lock:
+            while True:
+                self.__refill(event_loop.time())
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class BackendLimit(object):
+
+    def __init__(self, rate=None, burst=1, concurrency=None,
+                 backoff=1, max_backoff=60, decrease=0.5,
+                 increase=None, max_throttle_retries=5):
+        """
+        Rate and concurrency limit of single backend that adapts
+        to throttling: each throttling error pauses backend with growing
+        backoff and cuts rate down, each success brings rate back up
+
+        :param rate: number of operations started per second,
+                     None for no limit
+        :param burst: number of operations started at once
+        :param concurrency: number of operations running at the same time,
+                            None for no limit
+        :param backoff: pause after first throttling error in seconds,
+                        doubled after each next one
+        :param max_backoff: upper bound for pause in seconds
+        :param decrease: multiplier applied to rate on throttling error
+        :param increase: number of operations per second rate grows by
+                         on success, tenth of initial rate if None
+        :param max_throttle_retries: number of retries of throttled
+                                     operation before error is raised
+        """
+        self.max_rate = float(rate) if rate else None
+        self.min_rate = self.max_rate * 0.01 if rate else None
+        self.bucket = TokenBucket(rate, burst=burst) if rate else None
+        self.concurrency = concurrency
+        # created by running event loop, so limit
+        # could be built before event loop is set
+        self.semaphore = None
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.decrease = decrease
+        self.increase = (increase if increase is not None else
+                         (self.max_rate / 10 if rate else None))
+        self.max_throttle_retries = max_throttle_retries
+        self.queue_depth = 0
+        self.throttled = 0
+        self.__consecutive_throttles = 0
+        self.__paused_until = 0
+
+    @property
+    def rate(self):
+        return self.bucket.rate if self.bucket else None
+
+    async def __acquire(self):
+        event_loop = asyncio.get_event_loop()
+        if self.concurrency and self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.queue_depth += 1
+        try:
+            if self.semaphore is not None:
+                await self.semaphore.acquire()
+            try:
+                delay = self.__paused_until - event_loop.time()
+                while delay > 0:
+                    await asyncio.sleep(delay)
+                    delay = self.__paused_until - event_loop.time()
+                if self.bucket is not None:
+                    await self.bucket.acquire()
+            except BaseException:
+                self.__release()
+                raise
+        finally:
+            self.queue_depth -= 1
+
+    def __release(self):
+        if self.semaphore is not None:
+            self.semaphore.release()
+
+    def __on_throttled(self, retry_after):
+        event_loop = asyncio.get_event_loop()
+        self.throttled += 1
+        delay = retry_after
+        if delay is None:
+            delay = min(self.max_backoff,
+                        self.backoff * 2 ** self.__consecutive_throttles)
+        self.__consecutive_throttles += 1
+        self.__paused_until = max(self.__paused_until,
+                                  event_loop.time() + delay)
+        if self.bucket is not None:
+            self.bucket.rate = max(self.min_rate,
+                                   self.bucket.rate * self.decrease)
+
+    def __on_succeeded(self):
+        self.__consecutive_throttles = 0
+        if self.bucket is not None:
+            self.bucket.rate = min(self.max_rate,
+                                   self.bucket.rate + self.increase)
+
+    async def run(self, fn, *args):
+        """
+        Coroutine to run operation within backend limit,
+        throttled operation is retried
+
+        :param fn: operation coroutine function
+        :return: operation result
+        :rtype: object
+        :raises: ThrottlingError if operation was throttled
+                 more times than allowed
+        """
+        retries = 0
+        while True:
+            await self.__acquire()
+            try:
+                result = await fn(*args)
+            except ThrottlingError as ex:
+                self.__on_throttled(ex.retry_after)
+                retries += 1
+                if retries > self.max_throttle_retries:
+                    raise
+                tracing.record_retry()
+                continue
+            finally:
+                self.__release()
+            self.__on_succeeded()
+            return result
+
+
+class RateLimiter(object):
+
+    def __init__(self, limits=None, default=None):
+        """
+        Limits plugin operations per backend, backend is the module
+        of operation implementation unless operation declares it with
+        "rate_limit_backend" input; limiter may be shared
+        between deployment contexts
+
+        :param limits: BackendLimit keyword arguments keyed on backend
+        :type limits: dict
+        :param default: BackendLimit keyword arguments for backends
+                        without own limits, no limit if None
+        :type default: dict
+        """
+        self.limits = {backend: BackendLimit(**kwargs)
+                       for backend, kwargs in (limits or {}).items()}
+        self.default = default
+
+    def backend_limit(self, backend):
+        """
+        Returns backend limit
+
+        :param backend: backend key
+        :return: backend limit, None if backend is not limited
+        :rtype: BackendLimit
+        """
+        if backend not in self.limits:
+            if self.default is None:
+                return None
+            self.limits[backend] = BackendLimit(**self.default)
+        return self.limits[backend]
+
+    async def run(self, backend, fn, *args):
+        """
+        Coroutine to run operation within backend limit
+
+        :param backend: backend key
+        :param fn: operation coroutine function
+        :return: operation result
+        :rtype: object
+        """
+        limit = self.backend_limit(backend)
+        if limit is None:
+            return await fn(*args)
+        return await limit.run(fn, *args)
+
+    def queue_depth(self):
+        """
+        Represents number of operations waiting for each backend
+
+        :return: number of waiting operations keyed on backend
+        :rtype: dict
+        """
+        return {backend: limit.queue_depth
+                for backend, limit in self.limits.items()}
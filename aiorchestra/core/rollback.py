@@ -0,0 +1,121 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+
+from aiorchestra.core import scheduler
+
+ROLLBACK_EVENTS = ['stop', 'delete']
+
+
+def restore_from_journal(context):
+    """
+    Restores state and completed events of nodes that have no state
+    in memory, as nodes of context built again after process restart,
+    from context journal, so they could be rolled back; create that
+    was cancelled or interrupted counts as completed
+
+    :param context: OrchestraContext instance
+    :type context: aiorchestra.core.context.OrchestraContext
+    :return: None
+    :rtype: None
+    """
+    if context.journal is None:
+        return
+    restored = set(n.name for n in context.nodes
+                   if not (n.is_provisioned or n.completed_events))
+    completed = context.journal.completed(context.name)
+    journaled = {}
+    for (node_name, event, peer), entry in completed.items():
+        for name, state in entry['nodes'].items():
+            if name in restored:
+                orchestra_node = context.node_from_name(name)
+                orchestra_node.runtime_properties = dict(
+                    state['runtime_properties'])
+                orchestra_node.is_provisioned = state['is_provisioned']
+        if peer is not None:
+            continue
+        events = journaled.setdefault(node_name, set())
+        if event == 'delete':
+            events.clear()
+        else:
+            events.add(event)
+    for node_name, event, peer in context.journal.attempted(context.name):
+        if event == 'create' and peer is None:
+            journaled.setdefault(node_name, set()).add(event)
+    for name in restored:
+        context.node_from_name(name).completed_events = set(
+            journaled.get(name, ()))
+
+
+class RollbackPlan(object):
+
+    def __init__(self, context, nodes=None):
+        """
+        Minimal reverse plan to undo failed deployment: node is deleted
+        only if it was provisioned or its create event was completed
+        or cancelled in flight,
+        and stopped only if its start event was completed, nodes that
+        were never created are not touched at all; nodes without
+        state in memory are restored from context journal first
+
+        :param context: OrchestraContext instance
+        :type context: aiorchestra.core.context.OrchestraContext
+        :param nodes: nodes to roll back, all context nodes if None
+        :type nodes: list of aiorchestra.core.node.OrchestraNode
+        """
+        self.context = context
+        restore_from_journal(context)
+        self.events = collections.OrderedDict()
+        for orchestra_node in (nodes if nodes is not None
+                               else context.nodes):
+            done = orchestra_node.completed_events
+            if not (orchestra_node.is_provisioned or 'create' in done):
+                continue
+            # provisioned node without completion state was loaded
+            # from context serialized without it, so it was started
+            stop = 'start' in done or not done
+            self.events[orchestra_node.name] = (
+                ['stop', 'delete'] if stop else ['delete'])
+
+    @property
+    def nodes(self):
+        return [self.context.node_from_name(name) for name in self.events]
+
+    def serialize(self):
+        """
+        Serializes rollback plan into dict object
+
+        :return: rollback events keyed on node name
+        :rtype: dict
+        """
+        return {name: list(events) for name, events in self.events.items()}
+
+    async def run(self):
+        """
+        Coroutine to run rollback plan, nodes are rolled back
+        concurrently in reverse order of nodes requirements,
+        failed node blocks only rollback of nodes it requires
+
+        :return: None
+        :rtype: None
+        :raises: first rollback error once rollback was finished
+        """
+        skip = set((name, event) for name, events in self.events.items()
+                   for event in ROLLBACK_EVENTS if event not in events)
+        await scheduler.DeploymentScheduler(
+            self.context, ROLLBACK_EVENTS,
+            max_concurrency=self.context.max_concurrency,
+            nodes=self.nodes, limiter=self.context.limiter,
+            reverse=True, skip=skip, cancel_on_failure=False).run()
@@ -0,0 +1,177 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+
+
+class DeploymentScheduler(object):
+
+    def __init__(self, context, events, max_concurrency=None, nodes=None,
+                 limiter=None, reverse=False, skip=None,
+                 cancel_on_failure=True):
+        """
+        Dependency-aware scheduler for node lifecycle events.
+
+        Each node runs its events in the given order, and every event
+        starts as soon as the same event was completed for all nodes
+        the node requires, so independent branches of the deployment
+        graph overlap instead of running one after another.
+        In reverse mode, as for teardown, node waits for all nodes
+        that require it instead.
+
+        :param context: OrchestraContext instance
+        :type context: aiorchestra.core.context.OrchestraContext
+        :param events: ordered node lifecycle events
+        :type events: list of str
+        :param max_concurrency: maximum number of lifecycle events
+                                running at the same time, None for no limit
+        :type max_concurrency: int
+        :param nodes: nodes to run events for, all context nodes if None,
+                      other nodes are considered to be done already
+        :type nodes: list of aiorchestra.core.node.OrchestraNode
+        :param limiter: object with slot() method returning
+                        asynchronous context manager each event runs
+                        within, shared between deployments to limit
+                        their events altogether, None for no limit
+        :param reverse: whether nodes wait for nodes that require them
+        :type reverse: bool
+        :param skip: node name and event pairs that are considered
+                     to be done already, so they are not run
+        :type skip: set of tuple
+        :param cancel_on_failure: whether first failed event cancels
+                                  events of all nodes, otherwise only
+                                  nodes that wait for failed node
+                                  are blocked
+        :type cancel_on_failure: bool
+        """
+        self.context = context
+        self.events = events
+        self.max_concurrency = max_concurrency
+        self.nodes = nodes
+        self.limiter = limiter
+        self.reverse = reverse
+        self.skip = frozenset(skip or ())
+        self.cancel_on_failure = cancel_on_failure
+        self.failure = None
+        self.blocked = set()
+        self.__scheduled = set()
+        self.__dependents = None
+
+    def waits_for(self, orchestra_node):
+        """
+        Returns nodes that have to finish an event before given node
+        is allowed to run the same event
+
+        :param orchestra_node: node to check
+        :type orchestra_node: aiorchestra.core.node.OrchestraNode
+        :return: nodes to wait for
+        :rtype: list of aiorchestra.core.node.OrchestraNode
+        """
+        if not self.reverse:
+            names = orchestra_node.parent_nodes
+        else:
+            if self.__dependents is None:
+                self.__dependents = {}
+                for other in self.context.nodes:
+                    for name in other.parent_nodes:
+                        self.__dependents.setdefault(name, []).append(
+                            other.name)
+            names = self.__dependents.get(orchestra_node.name, [])
+        return [self.context.node_from_name(name)
+                for name in names if name in self.__scheduled]
+
+    async def run(self):
+        """
+        Coroutine to run lifecycle events for all context nodes,
+        first failed event cancels events running at the same time
+        and events of nodes that were not started yet, unless
+        scheduler does not cancel on failure: then nodes waiting
+        for failed node are blocked, other nodes run to the end
+        and first failure is raised after all
+
+        :return: None
+        :rtype: None
+        """
+        nodes = self.context.nodes_in_plan_order()
+        if self.nodes is not None:
+            selected = set(n.name for n in self.nodes)
+            nodes = [n for n in nodes if n.name in selected]
+        self.__scheduled = set(n.name for n in nodes)
+        completed = {(n.name, event): asyncio.Event()
+                     for n in nodes for event in self.events}
+        semaphore = (asyncio.Semaphore(self.max_concurrency)
+                     if self.max_concurrency else None)
+
+        async def run_limited(orchestra_node, event):
+            if self.limiter is None:
+                await getattr(orchestra_node, event)()
+                return
+            async with self.limiter.slot():
+                await getattr(orchestra_node, event)()
+
+        async def run_event(orchestra_node, event):
+            if semaphore is None:
+                await run_limited(orchestra_node, event)
+                return
+            async with semaphore:
+                await run_limited(orchestra_node, event)
+
+        failed = set()
+
+        def give_up(orchestra_node):
+            failed.add(orchestra_node.name)
+            for event in self.events:
+                completed[(orchestra_node.name, event)].set()
+
+        async def run_node(orchestra_node):
+            required = self.waits_for(orchestra_node)
+            for event in self.events:
+                for other in required:
+                    await completed[(other.name, event)].wait()
+                    if other.name in failed:
+                        self.blocked.add(orchestra_node.name)
+                        give_up(orchestra_node)
+                        return
+                if (orchestra_node.name, event) not in self.skip:
+                    try:
+                        await run_event(orchestra_node, event)
+                    except Exception as ex:
+                        if self.failure is None:
+                            self.failure = (orchestra_node.name, event, ex)
+                        if self.cancel_on_failure:
+                            raise
+                        give_up(orchestra_node)
+                        return
+                completed[(orchestra_node.name, event)].set()
+
+        tasks = [asyncio.ensure_future(run_node(n)) for n in nodes]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            pending = [task for task in tasks if not task.done()]
+            if self.failure is not None:
+                self.context.logger.info(
+                    'Event {0} of node {1} failed, cancelling events '
+                    'of {2} nodes.'.format(self.failure[1],
+                                           self.failure[0], len(pending)))
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        if self.failure is not None:
+            self.context.logger.info(
+                'Event {0} of node {1} failed, events of nodes {2} '
+                'were blocked.'.format(self.failure[1], self.failure[0],
+                                       sorted(self.blocked)))
+            raise self.failure[2]
@@ -0,0 +1,266 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import multiprocessing
+import queue
+
+from concurrent import futures
+
+from aiorchestra.core import context as orchestra_context
+from aiorchestra.core import logger as log
+from aiorchestra.core import tracing
+
+ACTIONS = ['deploy', 'undeploy']
+
+(STATUS, EVENT) = ('status', 'event')
+
+
+def deployment_request(name, path, template_inputs=None):
+    """
+    Builds serialized deployment context that was not deployed yet,
+    so TOSCA template is parsed by worker process only
+
+    :param name: deployment context name
+    :type name: str
+    :param path: path to TOSCA template
+    :type path: str
+    :param template_inputs: TOSCA template input parameters
+    :type template_inputs: dict
+    :return: serialized deployment context
+    :rtype: dict
+    """
+    return {
+        'name': name,
+        'status': orchestra_context.OrchestraContext.PENDING,
+        'template_inputs': template_inputs or {},
+        'nodes': [],
+        'path': path,
+    }
+
+
+class QueueSink(object):
+
+    def __init__(self, updates):
+        """
+        Passes event records to queue shared with parent process
+
+        :param updates: multiprocessing queue
+        """
+        self.updates = updates
+
+    def emit(self, record):
+        update = record.serialize()
+        update['type'] = EVENT
+        self.updates.put(update)
+
+    def flush(self):
+        pass
+
+
+def run_shard(action, serialized, options, updates):
+    """
+    Runs deployment context action in worker process
+
+    :param action: context action: deploy or undeploy
+    :param serialized: serialized deployment context
+    :param options: deployment context options
+    :param updates: queue to stream status and event records to
+    :return: serialized deployment context, its outputs and error
+    :rtype: dict
+    """
+    name = serialized['name']
+    event_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(event_loop)
+    logger = log.UnifiedLogger(
+        log_to_console=True,
+        level=options.get('log_level', 'INFO')).setup_child_logger(
+        __name__, name)
+    try:
+        context = orchestra_context.OrchestraContext.load(
+            logger, event_loop=event_loop, **serialized)
+        context.rollback_enabled = options.get('enable_rollback', False)
+        context.fail_fast = options.get('fail_fast', False)
+        context.max_concurrency = options.get('max_concurrency')
+        context.link_concurrency = options.get('link_concurrency', 1)
+        context.tracer = tracing.Tracer(sinks=[QueueSink(updates)])
+        updates.put({'type': STATUS, 'context': name,
+                     'status': context.RUNNING, 'error': None})
+        error, outputs = None, {}
+        try:
+            event_loop.run_until_complete(getattr(context, action)())
+            if context.status in context.AVAILABLE_FOR_DESTRUCTION:
+                outputs = context.outputs
+        except Exception as ex:
+            error = str(ex)
+        updates.put({'type': STATUS, 'context': name,
+                     'status': context.status, 'error': error})
+        return {'context': context.serialize(),
+                'outputs': outputs,
+                'error': error}
+    finally:
+        event_loop.close()
+
+
+class ShardedDeployer(object):
+
+    def __init__(self, processes=None, event_loop=None,
+                 enable_rollback=False, max_concurrency=None,
+                 link_concurrency=1, log_level='INFO', mp_context=None,
+                 fail_fast=False):
+        """
+        Shards independent deployment contexts across pool of worker
+        processes, contexts are passed to workers serialized
+        and their status and event records are streamed back
+
+        :param processes: number of worker processes,
+                          number of CPUs if None
+        :type processes: int
+        :param event_loop: asyncio or any compatible event loop
+        :param enable_rollback: weather to enable rollback on failure or not
+        :param max_concurrency: maximum number of node lifecycle events
+                                running at the same time within context
+        :param link_concurrency: maximum number of relationship events
+                                 node runs at the same time
+        :param log_level: worker processes log level
+        :param mp_context: multiprocessing context to start workers with
+        :param fail_fast: whether first failed lifecycle event cancels
+                          other events of deployment
+        """
+        self.event_loop = event_loop or asyncio.get_event_loop()
+        self.options = {
+            'enable_rollback': enable_rollback,
+            'max_concurrency': max_concurrency,
+            'link_concurrency': link_concurrency,
+            'log_level': log_level,
+            'fail_fast': fail_fast,
+        }
+        mp_context = mp_context or multiprocessing.get_context()
+        self.executor = futures.ProcessPoolExecutor(
+            max_workers=processes, mp_context=mp_context)
+        self.__manager = mp_context.Manager()
+        self.updates = self.__manager.Queue()
+        self.__futures = []
+
+    @staticmethod
+    def __apply(context, future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        serialized = future.result()['context']
+        unknown = [ser_n['__name'] for ser_n in serialized['nodes']
+                   if context.node_from_name(ser_n['__name']) is None]
+        if unknown:
+            context.logger.error(
+                'Unable to apply state of deployment "{0}" returned by '
+                'worker process, deployment has no nodes: {1}.'
+                .format(context.name, ', '.join(unknown)))
+            return
+        context.status = serialized['status']
+        for ser_n in serialized['nodes']:
+            context.node_from_name(ser_n['__name']).load(**ser_n)
+
+    def submit(self, context, action='deploy'):
+        """
+        Schedules deployment context action in worker process
+
+        :param context: deployment context or serialized context,
+                        state of given context is updated when
+                        action finished
+        :type context: aiorchestra.core.context.OrchestraContext or dict
+        :param action: context action: deploy or undeploy
+        :type action: str
+        :return: future of serialized context, its outputs and error
+        :rtype: asyncio.Future
+        """
+        if action not in ACTIONS:
+            raise Exception('Unknown deployment action "{0}", '
+                            'expected one of: {1}.'
+                            .format(action, ', '.join(ACTIONS)))
+        serialized = (context if isinstance(context, dict)
+                      else context.serialize())
+        future = asyncio.wrap_future(
+            self.executor.submit(run_shard, action, serialized,
+                                 self.options, self.updates),
+            loop=self.event_loop)
+        if not isinstance(context, dict):
+            future.add_done_callback(
+                lambda f: self.__apply(context, f))
+        self.__futures.append(future)
+        return future
+
+    def __poll(self):
+        try:
+            return self.updates.get(timeout=0.05)
+        except queue.Empty:
+            return None
+
+    async def stream(self):
+        """
+        Asynchronous generator of status and event records
+        streamed from worker processes, finishes once all submitted
+        actions finished and their records were consumed
+
+        :return: status and event records
+        :rtype: dict
+        """
+        while True:
+            pending = any(not f.done() for f in self.__futures)
+            update = await self.event_loop.run_in_executor(
+                None, self.__poll)
+            if update is not None:
+                yield update
+            elif not pending:
+                return
+
+    async def wait(self, on_update=None):
+        """
+        Coroutine to wait for all submitted actions
+
+        :param on_update: callable to pass streamed records to
+        :return: serialized contexts, their outputs and errors
+                 in order of submission, exception if worker failed
+        :rtype: list
+        """
+        async for update in self.stream():
+            if on_update is not None:
+                on_update(update)
+        submitted, self.__futures = self.__futures, []
+        return await asyncio.gather(*submitted, return_exceptions=True)
+
+    def run_until_complete(self, on_update=None):
+        """
+        Awaits until all submitted actions finished and exits
+
+        :param on_update: callable to pass streamed records to
+        :return: serialized contexts, their outputs and errors
+        :rtype: list
+        """
+        return self.event_loop.run_until_complete(
+            self.wait(on_update=on_update))
+
+    def close(self):
+        """
+        Stops worker processes
+
+        :return: None
+        :rtype: None
+        """
+        self.executor.shutdown()
+        self.__manager.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,127 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import zlib
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+SCHEMA_VERSION = 1
+
+(MSGPACK, ZLIB_JSON) = (b'm', b'z')
+
+
+def _unsupported(value):
+    raise Exception('Unable to encode snapshot, value {0!r} of type '
+                    '"{1}" is not supported.'
+                    .format(value, type(value).__name__))
+
+
+def _encode(payload, codec):
+    if codec == MSGPACK:
+        if msgpack is None:
+            raise Exception('Unable to encode snapshot, '
+                            'msgpack is not installed.')
+        return MSGPACK + msgpack.packb(payload, use_bin_type=True,
+                                       default=_unsupported)
+    if codec == ZLIB_JSON:
+        return ZLIB_JSON + zlib.compress(json.dumps(
+            payload, separators=(',', ':'),
+            default=_unsupported).encode('utf-8'))
+    raise Exception('Unknown snapshot codec "{0}".'.format(codec))
+
+
+def _decode(data):
+    codec, body = data[:1], data[1:]
+    if codec == MSGPACK:
+        if msgpack is None:
+            raise Exception('Unable to decode snapshot, '
+                            'msgpack is not installed.')
+        return msgpack.unpackb(body, raw=False)
+    if codec == ZLIB_JSON:
+        return json.loads(zlib.decompress(body).decode('utf-8'))
+    raise Exception('Unknown snapshot codec "{0}".'.format(codec))
+
+
+def dumps(context, codec=None):
+    """
+    Builds compact snapshot of deployment context,
+    snapshot keeps only state that is not defined by TOSCA template:
+    context status and inputs and state of each node
+
+    Snapshot layout:
+    [version, name, status, path, template inputs,
+     [[node name, is provisioned, runtime properties,
+       completed events], ...],
+     number of instances of node templates]
+
+    :param context: OrchestraContext instance
+    :type context: aiorchestra.core.context.OrchestraContext
+    :param codec: snapshot codec, msgpack if installed,
+                  zlib-compressed JSON otherwise
+    :type codec: bytes
+    :return: snapshot
+    :rtype: bytes
+    :raises: exception if node runtime properties or template inputs
+             have values codec does not support
+    """
+    if codec is None:
+        codec = MSGPACK if msgpack is not None else ZLIB_JSON
+    payload = [
+        SCHEMA_VERSION,
+        context.name,
+        context.status,
+        context.path,
+        context.template_inputs,
+        [[n.name, n.is_provisioned, n.runtime_properties,
+          sorted(n.completed_events)]
+         for n in context.nodes],
+        context.instances,
+    ]
+    return _encode(payload, codec)
+
+
+def loads(data):
+    """
+    Decodes snapshot of deployment context
+
+    :param data: snapshot
+    :type data: bytes
+    :return: serialized deployment context,
+             same as OrchestraContext.serialize returns
+    :rtype: dict
+    :raises: exception if snapshot version is not supported
+    """
+    payload = _decode(data)
+    version = payload[0]
+    if version != SCHEMA_VERSION:
+        raise Exception('Unsupported snapshot version "{0}", '
+                        'expected "{1}".'.format(version, SCHEMA_VERSION))
+    _, name, status, path, template_inputs, nodes, instances = payload
+    return {
+        'name': name,
+        'status': status,
+        'path': path,
+        'template_inputs': template_inputs,
+        'nodes': [{'__name': n[0],
+                   'is_provisioned': n[1],
+                   'runtime_properties': n[2],
+                   'completed_events': n[3]}
+                  for n in nodes],
+        'instances': instances,
+    }
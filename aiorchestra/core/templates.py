@@ -0,0 +1,109 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import copy
+import hashlib
+import json
+import os
+import threading
+
+from toscaparser import tosca_template
+
+
+class TemplateCache(object):
+
+    def __init__(self, max_size=64):
+        """
+        Bounded LRU cache of parsed TOSCA templates
+
+        Templates are keyed on absolute path, template file content
+        hash and template inputs, so a template that was changed on disk
+        is parsed again. Files imported by a template are not hashed.
+
+        :param max_size: maximum number of cached templates,
+                         0 disables caching
+        :type max_size: int
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__templates = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def key(path, template_inputs=None):
+        """
+        Builds cache key for TOSCA template
+
+        :param path: path to TOSCA template
+        :type path: str
+        :param template_inputs: TOSCA template input parameters
+        :type template_inputs: dict
+        :return: cache key
+        :rtype: tuple
+        """
+        with open(path, 'rb') as template_file:
+            digest = hashlib.sha256(template_file.read()).hexdigest()
+        inputs = json.dumps(template_inputs or {},
+                            sort_keys=True, default=repr)
+        return os.path.abspath(path), digest, inputs
+
+    def get(self, path, template_inputs=None):
+        """
+        Returns parsed TOSCA template, parses it on cache miss
+
+        :param path: path to TOSCA template
+        :type path: str
+        :param template_inputs: TOSCA template input parameters
+        :type template_inputs: dict
+        :return: parsed TOSCA template
+        :rtype: toscaparser.tosca_template.ToscaTemplate
+        """
+        key = self.key(path, template_inputs)
+        with self.__lock:
+            if key in self.__templates:
+                self.hits += 1
+                self.__templates.move_to_end(key)
+                return self.__templates[key]
+            self.misses += 1
+        # parser keeps inputs, cached template
+        # must not change along with caller inputs
+        template = tosca_template.ToscaTemplate(
+            path=path, a_file=True,
+            parsed_params=copy.deepcopy(template_inputs))
+        if self.max_size > 0:
+            with self.__lock:
+                self.__templates[key] = template
+                while len(self.__templates) > self.max_size:
+                    self.__templates.popitem(last=False)
+        return template
+
+    def clear(self):
+        """
+        Drops all cached templates
+
+        :return: None
+        :rtype: None
+        """
+        with self.__lock:
+            self.__templates.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self.__templates)
+
+
+DEFAULT_CACHE = TemplateCache()
@@ -0,0 +1,361 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import contextvars
+import json
+import os
+import threading
+import time
+
+(SUCCEEDED, FAILED, CANCELLED) = ('succeeded', 'failed', 'cancelled')
+
+_CURRENT_RECORD = contextvars.ContextVar('aiorchestra_operation_record',
+                                         default=None)
+
+
+class OperationRecord(object):
+
+    def __init__(self, context, node, event, peer=None):
+        """
+        Represents timing and outcome of single node lifecycle
+        or relationship event
+
+        :param context: deployment context name
+        :type context: str
+        :param node: node name
+        :type node: str
+        :param event: lifecycle or relationship event
+        :type event: str
+        :param peer: name of node that relationship event links
+                     or unlinks this node to
+        :type peer: str
+        """
+        self.context = context
+        self.node = node
+        self.event = event
+        self.peer = peer
+        self.started = time.monotonic()
+        self.started_at = time.time()
+        self.finished = None
+        self.retries = 0
+        self.outcome = None
+        self.error = None
+
+    @property
+    def duration(self):
+        """
+        Represents event duration in seconds
+
+        :return: duration, None if event is still running
+        :rtype: float
+        """
+        if self.finished is None:
+            return None
+        return self.finished - self.started
+
+    def serialize(self):
+        """
+        Serializes record into dict object
+
+        :return: serialized record
+        :rtype: dict
+        """
+        return {
+            'context': self.context,
+            'node': self.node,
+            'event': self.event,
+            'peer': self.peer,
+            'started': self.started,
+            'finished': self.finished,
+            'started_at': self.started_at,
+            'duration': self.duration,
+            'retries': self.retries,
+            'outcome': self.outcome,
+            'error': self.error,
+        }
+
+    def __repr__(self):
+        return 'Operation {0}.{1} of node {2}'.format(
+            self.context, self.event, self.node)
+
+
+def current_record():
+    """
+    Returns record of lifecycle event that is currently running
+
+    :return: operation record, None if tracing is disabled
+    :rtype: OperationRecord
+    """
+    return _CURRENT_RECORD.get()
+
+
+def record_retry():
+    """
+    Counts retry of currently running lifecycle event
+
+    :return: None
+    :rtype: None
+    """
+    record = _CURRENT_RECORD.get()
+    if record is not None:
+        record.retries += 1
+
+
+def record_failure(ex):
+    """
+    Marks currently running lifecycle event as failed,
+    also if its error was not raised further
+
+    :param ex: event error
+    :type ex: Exception
+    :return: None
+    :rtype: None
+    """
+    record = _CURRENT_RECORD.get()
+    if record is not None and record.error is None:
+        record.error = str(ex)
+
+
+class Tracer(object):
+
+    def __init__(self, sinks=None):
+        """
+        Records node lifecycle and relationship events
+        and passes finished records to sinks
+
+        :param sinks: records consumers
+        :type sinks: list
+        """
+        self.sinks = list(sinks or [])
+
+    def start(self, context, node, event, peer=None):
+        """
+        Starts event record and makes it current
+
+        :param context: OrchestraContext instance
+        :param node: OrchestraNode instance
+        :param event: lifecycle or relationship event
+        :param peer: relationship event target node
+        :return: event record and token to reset current record
+        :rtype: tuple
+        """
+        record = OperationRecord(context.name, node.name, event,
+                                 peer=peer.name if peer else None)
+        return record, _CURRENT_RECORD.set(record)
+
+    def finish(self, record, token, outcome, error=None):
+        """
+        Finishes event record and passes it to sinks
+
+        :param record: event record
+        :param token: token to reset current record
+        :param outcome: event outcome
+        :param error: event error
+        :return: None
+        :rtype: None
+        """
+        record.finished = time.monotonic()
+        if error is not None:
+            record.error = str(error)
+        elif record.error is not None:
+            outcome = FAILED
+        record.outcome = outcome
+        _CURRENT_RECORD.reset(token)
+        for sink in self.sinks:
+            sink.emit(record)
+
+    def flush(self):
+        """
+        Flushes sinks
+
+        :return: None
+        :rtype: None
+        """
+        for sink in self.sinks:
+            sink.flush()
+
+
+class MemorySink(object):
+
+    def __init__(self):
+        """
+        Keeps event records in memory and builds deployment reports
+        """
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def flush(self):
+        pass
+
+    def for_context(self, context_name, events=None):
+        """
+        Returns records of deployment context
+
+        :param context_name: deployment context name
+        :param events: events to include, all if None
+        :return: records
+        :rtype: list of OperationRecord
+        """
+        return [r for r in self.records
+                if r.context == context_name and
+                (events is None or r.event in events)]
+
+    def slowest(self, count=10, context_name=None):
+        """
+        Returns slowest event records
+
+        :param count: number of records
+        :param context_name: deployment context name, all if None
+        :return: records sorted by duration
+        :rtype: list of OperationRecord
+        """
+        records = (self.records if context_name is None
+                   else self.for_context(context_name))
+        return sorted(records, key=lambda r: r.duration,
+                      reverse=True)[:count]
+
+    def critical_path(self, context, events=('create', 'configure',
+                                             'start', 'link'),
+                      reverse=False):
+        """
+        Returns chain of nodes that defined deployment wall time,
+        each node goes after the node it was waiting for the longest
+
+        :param context: OrchestraContext instance
+        :param events: events to account
+        :param reverse: whether nodes were waiting for nodes
+                        that require them, as in teardown
+        :return: node name, start, finish and duration of each node
+        :rtype: list of dict
+        """
+        spans = {}
+        for record in self.for_context(context.name, events=events):
+            started, finished = spans.get(
+                record.node, (record.started, record.finished))
+            spans[record.node] = (min(started, record.started),
+                                  max(finished, record.finished))
+        if not spans:
+            return []
+        waits_for = {n.name: [] for n in context.nodes}
+        for orchestra_node in context.nodes:
+            for required in orchestra_node.parent_nodes:
+                if reverse:
+                    waits_for.setdefault(required, []).append(
+                        orchestra_node.name)
+                else:
+                    waits_for[orchestra_node.name].append(required)
+        path = []
+        current = max(spans, key=lambda name: spans[name][1])
+        while current is not None:
+            started, finished = spans[current]
+            path.append({'node': current, 'started': started,
+                         'finished': finished,
+                         'duration': finished - started})
+            previous = [name for name in waits_for.get(current, [])
+                        if name in spans]
+            current = (max(previous, key=lambda name: spans[name][1])
+                       if previous else None)
+        return list(reversed(path))
+
+
+class JSONLinesSink(object):
+
+    def __init__(self, path):
+        """
+        Appends event records to file as JSON lines
+
+        :param path: file path
+        :type path: str
+        """
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__file = open(path, 'a')
+
+    def emit(self, record):
+        line = json.dumps(record.serialize(), sort_keys=True)
+        with self.__lock:
+            self.__file.write(line + '\n')
+
+    def flush(self):
+        with self.__lock:
+            self.__file.flush()
+
+    def close(self):
+        with self.__lock:
+            self.__file.close()
+
+
+class InMemorySpanExporter(object):
+
+    def __init__(self):
+        """
+        Collects exported spans in memory
+        """
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+
+class SpanSink(object):
+
+    def __init__(self, exporter=None, batch_size=64):
+        """
+        Converts event records into OpenTelemetry-style spans, one trace
+        per deployment context, and exports them in batches
+
+        :param exporter: object with export(spans) method,
+                         in-memory exporter if None
+        :param batch_size: number of spans exported at once
+        :type batch_size: int
+        """
+        self.exporter = exporter or InMemorySpanExporter()
+        self.batch_size = batch_size
+        self.__trace_ids = {}
+        self.__batch = []
+
+    def trace_id(self, context_name):
+        if context_name not in self.__trace_ids:
+            self.__trace_ids[context_name] = os.urandom(16).hex()
+        return self.__trace_ids[context_name]
+
+    def emit(self, record):
+        started = int(record.started_at * 1e9)
+        self.__batch.append({
+            'trace_id': self.trace_id(record.context),
+            'span_id': os.urandom(8).hex(),
+            'name': '{0}.{1}'.format(record.node, record.event),
+            'start_time_unix_nano': started,
+            'end_time_unix_nano': started + int(record.duration * 1e9),
+            'attributes': {
+                'aiorchestra.context': record.context,
+                'aiorchestra.node': record.node,
+                'aiorchestra.event': record.event,
+                'aiorchestra.peer': record.peer,
+                'aiorchestra.retries': record.retries,
+            },
+            'status': {
+                'code': 'OK' if record.outcome == SUCCEEDED else 'ERROR',
+                'message': record.error,
+            },
+        })
+        if len(self.__batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.__batch:
+            batch, self.__batch = self.__batch, []
+            self.exporter.export(batch)
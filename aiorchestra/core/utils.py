@@ -13,6 +13,16 @@
 #    under the License.
 
 import asyncio
+import contextvars
+import functools
+import inspect
+import os
+import random
+
+from concurrent import futures
+
+from aiorchestra.core import ratelimit
+from aiorchestra.core import tracing
 
 
 class Singleton(type):
@@ -25,7 +35,9 @@ class Singleton(type):
 
 
 async def retry(fn, args=None, kwargs=None, exceptions=None,
-                task_retries=1, task_retry_interval=10):
+                task_retries=1, task_retry_interval=10,
+                backoff=1, max_retry_interval=None,
+                jitter=0, deadline=None, ready=None):
     """
     Retry operation coroutine-handler for operation that
     are requiring polling for object changes.
@@ -38,11 +50,25 @@ async def retry(fn, args=None, kwargs=None, exceptions=None,
     :param task_retries: number of retries for retry coroutine
     :param task_retry_interval: retry interval for retry
                                 coroutine between retries
+    :param backoff: multiplier applied to retry interval after each retry
+    :param max_retry_interval: upper bound for retry interval
+    :param jitter: fraction of retry interval that is randomly
+                   cut off, 0 disables jitter
+    :param deadline: overall number of seconds for retrying, checked
+                     between retries
+    :param ready: future signalled when polled object is expected
+                  to be ready, retry wakes up and polls right away,
+                  once signalled it does not wait for future again
+    :type ready: asyncio.Future
     :return: result
     :rtype: object
     """
     args = args or []
     kwargs = kwargs or {}
+    event_loop = asyncio.get_event_loop()
+    expires_at = event_loop.time() + deadline if deadline else None
+    interval = task_retry_interval
+    signalled = False
 
     while task_retries > 0:
         try:
@@ -52,36 +78,170 @@ async def retry(fn, args=None, kwargs=None, exceptions=None,
         except Exception as e:
             if not exceptions or not isinstance(e, exceptions):
                 raise e
-        if task_retry_interval:
-            await asyncio.sleep(task_retry_interval)
         task_retries -= 1
+        if task_retries <= 0:
+            break
+        tracing.record_retry()
+        delay = interval
+        if max_retry_interval is not None:
+            delay = min(delay, max_retry_interval)
+        if jitter:
+            delay -= random.uniform(0, delay * jitter)
+        if expires_at is not None:
+            remaining = expires_at - event_loop.time()
+            if remaining <= 0:
+                raise Exception("exiting retry loop, deadline exceeded")
+            delay = min(delay, remaining)
+        if ready is not None and not signalled:
+            # signal could arrive while polling,
+            # then poll again right away
+            if not ready.done():
+                await asyncio.wait([ready], timeout=delay)
+            signalled = ready.done()
+        elif delay:
+            await asyncio.sleep(delay)
+        interval *= backoff
     raise Exception("exiting retry loop")
 
 
+async def gather_limited(factories, limit=None):
+    """
+    Runs coroutines concurrently keeping at most limit of them running.
+    Coroutines are created by factories only when they are about to run,
+    on first failure the rest of coroutines are cancelled.
+
+    :param factories: callables that return coroutine
+    :type factories: list
+    :param limit: maximum number of running coroutines, None for no limit
+    :type limit: int
+    :return: coroutines results
+    :rtype: list
+    """
+    if limit == 1:
+        return [await factory() for factory in factories]
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def run(factory):
+        if semaphore is None:
+            return await factory()
+        async with semaphore:
+            return await factory()
+
+    tasks = [asyncio.ensure_future(run(factory)) for factory in factories]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+_BLOCKING_EXECUTOR = None
+_BLOCKING_EXECUTOR_PID = None
+
+
+def blocking_executor():
+    """
+    Returns shared bounded thread pool for blocking plugin operations,
+    pool is created again in forked processes
+
+    :return: thread pool executor
+    :rtype: concurrent.futures.ThreadPoolExecutor
+    """
+    global _BLOCKING_EXECUTOR, _BLOCKING_EXECUTOR_PID
+    if _BLOCKING_EXECUTOR is None or _BLOCKING_EXECUTOR_PID != os.getpid():
+        _BLOCKING_EXECUTOR = futures.ThreadPoolExecutor(
+            thread_name_prefix='aiorchestra-blocking')
+        _BLOCKING_EXECUTOR_PID = os.getpid()
+    return _BLOCKING_EXECUTOR
+
+
+async def run_blocking(context, fn, *args, **kwargs):
+    """
+    Runs blocking callable in context executor, so it does not block
+    event loop, current operation record stays available to callable
+
+    :param context: OrchestraContext instance
+    :param fn: blocking callable
+    :return: callable result
+    :rtype: object
+    """
+    executor = context.executor or blocking_executor()
+    call = functools.partial(contextvars.copy_context().run,
+                             fn, *args, **kwargs)
+    return await asyncio.get_event_loop().run_in_executor(executor, call)
+
+
+async def run_task(context, task, *args):
+    """
+    Runs plugin operation, non-coroutine operations are run in
+    context executor, awaitable they return is awaited
+
+    :param context: OrchestraContext instance
+    :param task: plugin operation
+    :return: operation result
+    :rtype: object
+    """
+    if asyncio.iscoroutinefunction(task):
+        return await task(*args)
+    result = await run_blocking(context, task, *args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
 def operation(action):
     """
     Node lifecycle event operation coroutine-handler
 
+    Non-coroutine lifecycle events are run in context executor,
+    awaitable they return is awaited.
+    Throttling errors are raised if context has rate limiter,
+    so operation could be retried, other errors are raised if
+    rollback is disabled or context fails fast.
+
     :param action: node lifecycle event
     :type action: awaitable
     :return: None
     :rtype: None
     """
+    blocking = not asyncio.iscoroutinefunction(action)
+    name = getattr(action, '__name__', type(action).__name__)
+
     async def wraps(*args, **kwargs):
         source = list(args)[0]
         source.context.logger.debug(
-            '[{0}] - staring task "{1}" execution.'
-            .format(source.name, action.__name__))
+            '[%s] - staring task "%s" execution.', source.name, name)
         try:
-            await action(*args, **kwargs)
+            if blocking:
+                result = await run_blocking(
+                    source.context, action, *args, **kwargs)
+                if inspect.isawaitable(result):
+                    await result
+            else:
+                await action(*args, **kwargs)
             source.context.logger.debug(
-                '[{0}] - ending task "{1}" execution'
-                .format(source.name, action.__name__))
+                '[%s] - ending task "%s" execution',
+                source.name, name)
+        except ratelimit.ThrottlingError as ex:
+            if source.context.rate_limiter is None:
+                return handle_failure(source, ex)
+            source.context.logger.warning(
+                '[%s] - task "%s" execution was throttled.',
+                source.name, name)
+            raise ex
         except Exception as ex:
-            source.context.logger.error(
-                '[{0}] - error during task "{1}" execution. '
-                'Reason: {2}.'
-                .format(source.name, action.__name__, str(ex)))
-            if not source.context.rollback_enabled:
-                raise ex
+            handle_failure(source, ex)
+
+    def handle_failure(source, ex):
+        tracing.record_failure(ex)
+        source.context.logger.error(
+            '[{0}] - error during task "{1}" execution. '
+            'Reason: {2}.'
+            .format(source.name, name, str(ex)))
+        if (not source.context.rollback_enabled or
+                source.context.fail_fast):
+            raise ex
+
     return wraps
@@ -21,6 +21,7 @@ import testtools
 
 from aiorchestra.core import context
 from aiorchestra.core import logger
+from aiorchestra.core import tracing
 
 
 LOG = logger.UnifiedLogger(
@@ -93,5 +94,23 @@ class BaseAIOrchestraTestCase(testtools.TestCase):
     def assertNotEqual(self, what_to, compare_to):
         self.assertTrue(what_to != compare_to)
 
+    def build_context(self, template, name=None, sinks=None, **kwargs):
+        """
+        Builds deployment context with test logger and event loop
+
+        :param template: TOSCA template name or path
+        :param name: deployment context name, test name if None
+        :param sinks: tracer sinks, no tracing if None
+        :param kwargs: other OrchestraContext arguments
+        :return: deployment context
+        :rtype: aiorchestra.core.context.OrchestraContext
+        """
+        if sinks is not None:
+            kwargs['tracer'] = tracing.Tracer(sinks=sinks)
+        return context.OrchestraContext(
+            name or self.id().rsplit('.', 1)[-1],
+            path=os.path.join(self.tosca_directory, template),
+            logger=LOG, event_loop=self.event_loop, **kwargs)
+
     def deserialize_context(self, data):
         return context.OrchestraContext.load(LOG, self.event_loop, **data)
@@ -12,6 +12,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import asyncio
+import threading
+import time
+
+from aiorchestra.core import ratelimit
 from aiorchestra.core import utils
 
 
@@ -87,3 +92,71 @@ async def unlink(source, target, inputs):
 @utils.operation
 def is_not_coroutine(node, inputs):
     pass
+
+
+@utils.operation
+def blocking_create(node, inputs):
+    node.update_runtime_properties('create_started', time.monotonic())
+    time.sleep(0.1)
+    node.batch_update_runtime_properties(**{
+        'created': True,
+        'create_thread': threading.current_thread().name,
+        'create_finished': time.monotonic(),
+    })
+
+
+def bare_blocking_create(node, inputs):
+    time.sleep(0.01)
+    node.batch_update_runtime_properties(**{
+        'created': True,
+        'create_thread': threading.current_thread().name,
+    })
+
+
+@utils.operation
+async def sleep_create(node, inputs):
+    event_loop = asyncio.get_event_loop()
+    node.update_runtime_properties('create_started', event_loop.time())
+    await asyncio.sleep(0.1)
+    node.batch_update_runtime_properties(**{
+        'created': True,
+        'create_finished': event_loop.time(),
+    })
+
+
+@utils.operation
+async def sleep_delete(node, inputs):
+    await asyncio.sleep(0.1)
+    node.update_runtime_properties('deleted', True)
+
+
+@utils.operation
+async def sleep_link(source, target, inputs):
+    event_loop = asyncio.get_event_loop()
+    target.update_runtime_properties('link_started', event_loop.time())
+    await asyncio.sleep(0.1)
+    target.batch_update_runtime_properties(**{
+        'source': source.name,
+        'link_finished': event_loop.time(),
+    })
+
+
+@utils.operation
+async def throttled_create(node, inputs):
+    if not node.runtime_properties.get('throttled'):
+        node.update_runtime_properties('throttled', True)
+        raise ratelimit.ThrottlingError(retry_after=0.05)
+    event_loop = asyncio.get_event_loop()
+    node.update_runtime_properties('create_started', event_loop.time())
+    await asyncio.sleep(0.05)
+    node.batch_update_runtime_properties(**{
+        'created': True,
+        'create_inputs': sorted(inputs),
+        'create_finished': event_loop.time(),
+    })
+
+
+@utils.operation
+async def fail_create(node, inputs):
+    await asyncio.sleep(0.01)
+    raise Exception('i must fail.')
@@ -0,0 +1,69 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import os
+import tempfile
+
+from aiorchestra.benchmarks import __main__ as cli
+from aiorchestra.benchmarks import runner
+from aiorchestra.benchmarks import topology
+
+from aiorchestra.tests import base
+
+
+class TestBenchmarks(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestBenchmarks, self).setUp()
+
+    def tearDown(self):
+        super(TestBenchmarks, self).tearDown()
+
+    def test_topology_shapes(self):
+        self.assertEqual(['node_0', 'node_1', 'node_2'],
+                         topology.fan_out(3)['joint'])
+        self.assertEqual(['node_1'], topology.chain(3)['node_2'])
+        self.assertEqual(['root'], topology.diamond(3)['node_1'])
+        self.assertEqual(['node_0', 'node_1', 'node_2'],
+                         topology.diamond(3)['joint'])
+        requirements = topology.mesh(2, width=3)
+        self.assertEqual(5, len(requirements))
+        self.assertEqual(['lower_0', 'lower_1', 'lower_2'],
+                         requirements['upper_1'])
+
+    def test_unknown_shape(self):
+        self.assertRaises(Exception, topology.write_template,
+                          os.devnull, 'ring', 3)
+
+    def test_run_benchmark(self):
+        for shape in topology.SHAPES:
+            result = runner.run_benchmark(shape, 3)
+            self.assertEqual(shape, result['shape'])
+            for stage in ['parse_seconds', 'plan_seconds',
+                          'deploy_seconds', 'undeploy_seconds',
+                          'peak_memory_bytes']:
+                self.assertTrue(result[stage] > 0)
+
+    def test_machine_readable_results(self):
+        fd, output = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, output)
+        cli.main(['--shapes', 'chain', 'mesh', '--sizes', '2', '3',
+                  '--no-memory', '--output', output])
+        with open(output) as results_file:
+            results = json.load(results_file)
+        self.assertEqual([('chain', 2), ('chain', 3), ('mesh', 2),
+                          ('mesh', 3)],
+                         [(r['shape'], r['size']) for r in results])
@@ -13,8 +13,10 @@
 #    under the License.
 
 from aiorchestra.core import context
+from aiorchestra.core import noop
 
 from aiorchestra.tests import base
+from aiorchestra.tests import plugin
 
 
 class TestContextLoader(base.BaseAIOrchestraTestCase):
@@ -69,3 +71,46 @@ class TestContextLoader(base.BaseAIOrchestraTestCase):
         plan = _c.deployment_plan
         node_deps_plan = plan[_c.node_from_name('test_node')]
         self.assertIn(_c.node_from_name('test_node'), node_deps_plan)
+
+    @base.with_template('simple_node_template.yaml')
+    def test_nodes_in_plan_order(self, template_path):
+        _c = context.OrchestraContext(
+            'simple_node_template',
+            path=template_path,
+            logger=base.LOG)
+        names = [n.name for n in _c.nodes_in_plan_order()]
+        self.assertEqual(['test_node', 'dependent_node'], names)
+
+    @base.with_template('template_with_requirements_cycle.yaml')
+    def test_deployment_plan_with_requirements_cycle(self, template_path):
+        _c = context.OrchestraContext(
+            'template_with_requirements_cycle',
+            path=template_path,
+            logger=base.LOG)
+        ex = self.assertRaises(Exception, lambda: _c.deployment_plan)
+        self.assertIn('requirements have a cycle', str(ex))
+
+    @base.with_template('template_with_plugin.yaml')
+    def test_relationship_edges(self, template_path):
+        _c = context.OrchestraContext(
+            'template_with_plugin',
+            path=template_path,
+            logger=base.LOG)
+        self.assertEqual([('dependent_node', 'test_node')],
+                         list(_c.relationships))
+        edge = _c.relationship_edge(_c.node_from_name('dependent_node'),
+                                    _c.node_from_name('test_node'))
+        self.assertEqual('tosca.test.relationships.node', edge.relationship)
+        self.assertEqual(plugin.link, edge.events['link'][0])
+        self.assertEqual(plugin.unlink, edge.events['unlink'][0])
+
+    @base.with_template('template_with_plugin.yaml')
+    def test_relationship_edge_stabs(self, template_path):
+        _c = context.OrchestraContext(
+            'template_with_plugin',
+            path=template_path,
+            logger=base.LOG)
+        edge = _c.relationship_edge(_c.node_from_name('test_node'),
+                                    _c.node_from_name('dependent_node'))
+        self.assertIsNone(edge.relationship)
+        self.assertEqual(noop.link, edge.events['link'][0])
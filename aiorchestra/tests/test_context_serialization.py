@@ -12,6 +12,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+import zlib
+
+from aiorchestra.core import context as context_module
+from aiorchestra.core import snapshot
 from aiorchestra.tests import base
 
 
@@ -57,3 +62,63 @@ class TestContextSerialization(base.BaseAIOrchestraTestCase):
     @base.with_deployed('template_with_plugin.yaml', do_deploy=False)
     def test_nodes_were_provisioned_before_deploy(self, context):
         self.assertFalse(context._assert_nodes_were_provisioned())
+
+    @base.with_deployed('template_with_plugin.yaml', do_deploy=True)
+    def test_node_state_loaded(self, context):
+        new_context = self.deserialize_context(context.serialize())
+        for orchestra_node in context.nodes:
+            loaded = new_context.node_from_name(orchestra_node.name)
+            self.assertEqual(orchestra_node.is_provisioned,
+                             loaded.is_provisioned)
+            self.assertEqual(orchestra_node.runtime_properties,
+                             loaded.runtime_properties)
+            self.assertIsNot(orchestra_node.runtime_properties,
+                             loaded.runtime_properties)
+            self.assertEqual(orchestra_node.completed_events,
+                             loaded.completed_events)
+        self.assertTrue(new_context._assert_nodes_were_provisioned())
+
+    @base.with_deployed('template_with_plugin.yaml', do_deploy=True)
+    def test_snapshot_round_trip(self, context):
+        data = context.snapshot()
+        self.assertIsInstance(data, bytes)
+        self.assertLess(len(data), len(json.dumps(context.serialize())))
+        restored = context_module.OrchestraContext.from_snapshot(
+            data, base.LOG, event_loop=self.event_loop,
+            template=context._tmplt)
+        self.assertIs(context._tmplt, restored._tmplt)
+        self.assertEqual(context.name, restored.name)
+        self.assertEqual(context.status, restored.status)
+        self.assertEqual(context.path, restored.path)
+        self.assertEqual(
+            [(n.name, n.is_provisioned, n.runtime_properties,
+              n.completed_events) for n in context.nodes],
+            [(n.name, n.is_provisioned, n.runtime_properties,
+              n.completed_events) for n in restored.nodes])
+
+    @base.with_deployed('template_with_plugin.yaml', do_deploy=False)
+    def test_snapshot_codecs(self, context):
+        codecs = [snapshot.ZLIB_JSON]
+        if snapshot.msgpack is not None:
+            codecs.append(snapshot.MSGPACK)
+        for codec in codecs:
+            data = context.snapshot(codec=codec)
+            self.assertEqual(codec, data[:1])
+            self.assertEqual(context.serialize()['nodes'][0]['__name'],
+                             snapshot.loads(data)['nodes'][0]['__name'])
+
+    @base.with_deployed('template_with_plugin.yaml', do_deploy=False)
+    def test_snapshot_unsupported_value(self, context):
+        context.nodes[0].runtime_properties = {'value': object()}
+        codecs = [snapshot.ZLIB_JSON]
+        if snapshot.msgpack is not None:
+            codecs.append(snapshot.MSGPACK)
+        for codec in codecs:
+            ex = self.assertRaises(Exception, context.snapshot, codec=codec)
+            self.assertIn('type "object" is not supported', str(ex))
+
+    @base.with_deployed('template_with_plugin.yaml', do_deploy=False)
+    def test_snapshot_version_checked(self, context):
+        data = snapshot.ZLIB_JSON + zlib.compress(b'[0]')
+        ex = self.assertRaises(Exception, snapshot.loads, data)
+        self.assertIn('Unsupported snapshot version', str(ex))
@@ -0,0 +1,135 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+
+from aiorchestra.core import context
+from aiorchestra.core import diff
+from aiorchestra.core import tracing
+from aiorchestra.tests import base
+
+
+class TestContextUpdate(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestContextUpdate, self).setUp()
+
+    def tearDown(self):
+        super(TestContextUpdate, self).tearDown()
+
+    def _events(self, sink, events):
+        return sorted((r.node, r.event, r.peer) for r in sink.records
+                      if r.event in events)
+
+    def test_diff(self):
+        sink = tracing.MemorySink()
+        current = self.build_context(
+            'template_for_parallel_deployment.yaml', sinks=[sink])
+        desired = self.build_context(
+            'template_for_parallel_deployment_updated.yaml', sinks=[sink])
+        changes = diff.ContextDiff(current, desired)
+        self.assertEqual({'node_e'}, changes.added)
+        self.assertEqual({'node_d'}, changes.removed)
+        self.assertEqual({'node_b'}, changes.changed)
+        self.assertEqual({'node_a', 'node_c', 'joint_node'},
+                         changes.unchanged)
+        self.assertEqual({('joint_node', 'node_b'),
+                          ('joint_node', 'node_d')}, changes.unlinked)
+        self.assertEqual({('joint_node', 'node_b'),
+                          ('joint_node', 'node_e')}, changes.linked)
+        self.assertTrue(diff.ContextDiff(current, current).is_empty)
+
+    def test_diff_of_referencing_nodes(self):
+        current = self.build_context(
+            'template_with_functions.yaml',
+            template_inputs={'node_name': 'test_node'})
+        desired = self.build_context(
+            'template_with_functions.yaml',
+            template_inputs={'node_name': 'test_node_updated'})
+        changes = diff.ContextDiff(current, desired)
+        self.assertEqual({'test_node', 'dependent_node'}, changes.changed)
+        self.assertEqual(set(), changes.unchanged)
+        self.assertEqual({'test_node'},
+                         diff.referenced_nodes(
+                             desired.node_from_name('dependent_node')))
+
+    def test_update_runs_only_changed_events(self):
+        sink = tracing.MemorySink()
+        current = self.build_context(
+            'template_for_parallel_deployment.yaml', sinks=[sink])
+        current.run_deploy()
+        restored = context.OrchestraContext.load(
+            base.LOG, self.event_loop, **current.serialize())
+        restored.tracer = current.tracer
+        del sink.records[:]
+
+        updated = restored.run_update(path=os.path.join(
+            self.tosca_directory,
+            'template_for_parallel_deployment_updated.yaml'))
+
+        self.assertEqual(updated.COMPLETED, updated.status)
+        self.assertEqual(
+            [('node_b', 'create', None), ('node_e', 'create', None)],
+            self._events(sink, ['create']))
+        self.assertEqual(
+            [('node_b', 'delete', None), ('node_d', 'delete', None)],
+            self._events(sink, ['delete']))
+        self.assertEqual(
+            [('joint_node', 'link', 'node_b'),
+             ('joint_node', 'link', 'node_e')],
+            self._events(sink, ['link']))
+        self.assertEqual(
+            [('joint_node', 'unlink', 'node_b'),
+             ('joint_node', 'unlink', 'node_d')],
+            self._events(sink, ['unlink']))
+        joint_node = updated.node_from_name('joint_node')
+        self.assertTrue(joint_node.is_provisioned)
+        self.assertEqual({'create', 'configure', 'start'},
+                         joint_node.completed_events)
+        self.assertEqual('node_b_updated',
+                         updated.node_from_name('node_b').properties['name'])
+        updated.run_undeploy()
+
+    def test_update_keeps_unlink_side_effects(self):
+        current = self.build_context('template_for_parallel_deployment.yaml')
+        current.run_deploy()
+        self.assertTrue(current.node_from_name(
+            'joint_node').runtime_properties['created'])
+        updated = current.run_update(path=os.path.join(
+            self.tosca_directory,
+            'template_for_parallel_deployment_updated.yaml'))
+        # test plugin unlink drops source runtime properties
+        # that unlinked target has as well
+        joint_node = updated.node_from_name('joint_node')
+        self.assertEqual({}, joint_node.runtime_properties)
+        self.assertEqual(current.node_from_name(
+            'joint_node').runtime_properties, joint_node.runtime_properties)
+        updated.run_undeploy()
+
+    def test_update_without_changes(self):
+        sink = tracing.MemorySink()
+        current = self.build_context(
+            'template_for_parallel_deployment.yaml', sinks=[sink])
+        current.run_deploy()
+        del sink.records[:]
+        updated = current.run_update()
+        self.assertEqual(updated.COMPLETED, updated.status)
+        self.assertEqual([], sink.records)
+        updated.run_undeploy()
+
+    @base.with_deployed('template_for_parallel_deployment.yaml',
+                        do_deploy=False)
+    def test_update_requires_completed_deployment(self, c):
+        ex = self.assertRaises(Exception, c.run_update)
+        self.assertIn('COMPLETED status required', str(ex))
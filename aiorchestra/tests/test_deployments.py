@@ -83,3 +83,10 @@ class TestDeployments(base.BaseAIOrchestraTestCase):
     def test_invalid_node_event_implementation_reference(self, c):
         ex = self.assertRaises(Exception, c.run_deploy)
         self.assertIn('Invalid event implementation reference', str(ex))
+
+    @base.with_deployed('invalid_node_template.yaml', do_deploy=False)
+    def test_implementation_validated_before_deployment(self, c):
+        ex = self.assertRaises(Exception, lambda: c.deployment_plan)
+        self.assertIn("No module named 'module'", str(ex))
+        self.assertRaises(Exception, c.run_deploy)
+        self.assertEqual(context.OrchestraContext.PENDING, c.status)
@@ -0,0 +1,117 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+
+from aiorchestra.core import engine
+from aiorchestra.tests import base
+
+
+class TestEngine(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestEngine, self).setUp()
+
+    def tearDown(self):
+        super(TestEngine, self).tearDown()
+
+    def _grant_order(self, limiter, requests):
+        granted = []
+
+        async def run(tenant, deployment, priority):
+            async with limiter.slot(tenant, deployment, priority=priority):
+                granted.append(deployment)
+                await asyncio.sleep(0)
+
+        async def run_all():
+            await asyncio.gather(*[run(*request) for request in requests])
+
+        self.event_loop.run_until_complete(run_all())
+        self.assertEqual(0, limiter.running)
+        self.assertEqual(0, limiter.queue_depth)
+        return granted
+
+    def test_deployments_interleaved(self):
+        limiter = engine.FairLimiter(max_concurrency=1)
+        granted = self._grant_order(
+            limiter, [('t', 'big', 0)] * 4 + [('t', 'small', 0)])
+        self.assertEqual(['big', 'small', 'big', 'big', 'big'], granted)
+
+    def test_priority_goes_first(self):
+        limiter = engine.FairLimiter(max_concurrency=1)
+        granted = self._grant_order(
+            limiter, [('t', 'first', 0), ('t', 'low', 0),
+                      ('t', 'low', 0), ('t', 'high', 1)])
+        self.assertEqual(['first', 'high', 'low', 'low'], granted)
+
+    def test_tenant_limit(self):
+        limiter = engine.FairLimiter(tenant_concurrency=1)
+        observed = []
+
+        async def run(tenant):
+            async with limiter.slot(tenant, tenant):
+                observed.append(dict(limiter.running_by_tenant))
+                await asyncio.sleep(0.01)
+
+        self.event_loop.run_until_complete(asyncio.gather(
+            *[run(tenant) for tenant in ['a', 'a', 'b', 'b']]))
+        self.assertEqual(2, max(sum(o.values()) for o in observed))
+        self.assertEqual(1, max(max(o.values()) for o in observed))
+
+    def test_cancelled_waiter_released(self):
+        limiter = engine.FairLimiter(max_concurrency=1)
+
+        async def run():
+            await limiter.acquire('t', 'a')
+            waiting = asyncio.ensure_future(limiter.acquire('t', 'b'))
+            await asyncio.sleep(0)
+            self.assertEqual(1, limiter.queue_depth)
+            waiting.cancel()
+            await asyncio.gather(waiting, return_exceptions=True)
+            self.assertEqual(0, limiter.queue_depth)
+            limiter.release('t')
+
+        self.event_loop.run_until_complete(run())
+        self.assertEqual(0, limiter.running)
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_engine_runs_many_deployments(self, template_path):
+        deployment_engine = engine.DeploymentEngine(
+            event_loop=self.event_loop, max_concurrency=3,
+            tenant_concurrency=2)
+        contexts = [self.build_context(
+            template_path, name='test_engine_{0}'.format(index))
+            for index in range(4)]
+        for index, c in enumerate(contexts):
+            deployment_engine.submit(c, tenant='tenant_{0}'.format(index % 2))
+        errors = deployment_engine.run_until_complete()
+        self.assertEqual([None] * 4, list(errors.values()))
+        for c in contexts:
+            self.assertEqual(c.COMPLETED, c.status)
+            self.assertIsNone(c.limiter)
+        self.assertEqual(0, deployment_engine.limiter.running)
+        for index, c in enumerate(contexts):
+            deployment_engine.submit(c, tenant='tenant_{0}'.format(index % 2),
+                                     action='undeploy')
+        errors = deployment_engine.run_until_complete()
+        self.assertEqual([None] * 4, list(errors.values()))
+        for c in contexts:
+            self.assertEqual(c.PENDING, c.status)
+
+    @base.with_deployed('template_with_plugin.yaml', do_deploy=False)
+    def test_unknown_action(self, c):
+        deployment_engine = engine.DeploymentEngine(
+            event_loop=self.event_loop)
+        self.assertRaises(Exception, deployment_engine.submit,
+                          c, action='explode')
@@ -0,0 +1,143 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import tempfile
+import threading
+
+from aiorchestra.core import journal
+from aiorchestra.core import tracing
+from aiorchestra.tests import base
+
+
+class TestJournal(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestJournal, self).setUp()
+
+    def tearDown(self):
+        super(TestJournal, self).tearDown()
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_resume_skips_completed_events(self, template_path):
+        store = journal.MemoryJournalStore()
+        sink = tracing.MemorySink()
+        c = self.build_context(template_path, name='test_resume',
+                               sinks=[sink], journal=journal.Journal(store))
+        c.run_deploy()
+        # process died before joint node was started
+        store.entries = [e for e in store.entries
+                         if not (e['node'] == 'joint_node' and
+                                 e['event'] == 'start')]
+        del sink.records[:]
+
+        resumed = self.build_context(
+            template_path, name='test_resume', sinks=[sink],
+            journal=journal.Journal(store))
+        resumed.run_deploy(resume=True)
+        self.assertEqual(resumed.COMPLETED, resumed.status)
+        self.assertEqual([('joint_node', 'start')],
+                         [(r.node, r.event) for r in sink.records])
+        for orchestra_node in resumed.nodes:
+            self.assertTrue(orchestra_node.is_provisioned)
+            self.assertTrue(orchestra_node.runtime_properties['created'])
+        self.assertEqual(frozenset(), resumed.resumed_events)
+        resumed.run_undeploy()
+        self.assertEqual([], store.read('test_resume'))
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_deploy_without_resume_starts_over(self, template_path):
+        store = journal.MemoryJournalStore()
+        sink = tracing.MemorySink()
+        c = self.build_context(template_path, name='test_start_over',
+                               sinks=[sink], journal=journal.Journal(store))
+        c.run_deploy()
+        del sink.records[:]
+        again = self.build_context(
+            template_path, name='test_start_over', sinks=[sink],
+            journal=journal.Journal(store))
+        again.run_deploy()
+        self.assertEqual(5, len([r for r in sink.records
+                                 if r.event == 'create']))
+        again.run_undeploy()
+
+    def _check_store(self, store):
+        self.addCleanup(store.close)
+        store.append({'context': 'a', 'node': 'n', 'event': 'create',
+                      'peer': None, 'state': journal.STARTED})
+        store.append({'context': 'b', 'node': 'n', 'event': 'create',
+                      'peer': None, 'state': journal.STARTED})
+        store.append({'context': 'a', 'node': 'n', 'event': 'create',
+                      'peer': None, 'state': journal.COMPLETED,
+                      'nodes': {'n': {'is_provisioned': True,
+                                      'runtime_properties': {'x': 1}}}})
+        completed = journal.Journal(store).completed('a')
+        self.assertEqual([('n', 'create', None)], list(completed))
+        self.assertEqual(
+            {'x': 1},
+            completed[('n', 'create', None)]['nodes']['n'][
+                'runtime_properties'])
+        store.clear('a')
+        self.assertEqual([], store.read('a'))
+        self.assertEqual(1, len(store.read('b')))
+
+    def test_file_store(self):
+        path = os.path.join(tempfile.mkdtemp(), 'journal.jsonl')
+        store = journal.FileJournalStore(path)
+        self._check_store(store)
+        with open(path, 'a') as journal_file:
+            journal_file.write('{"context": "b", "no')
+        self.assertEqual(1, len(store.read('b')))
+        store.close()
+        store = journal.FileJournalStore(path)
+        self.addCleanup(store.close)
+        store.append({'context': 'b', 'node': 'n', 'event': 'start',
+                      'peer': None, 'state': journal.STARTED})
+        self.assertEqual(2, len(store.read('b')))
+
+    def test_file_store_compacted(self):
+        path = os.path.join(tempfile.mkdtemp(), 'journal.jsonl')
+        store = journal.FileJournalStore(path)
+        self._check_store(store)
+        with open(path) as journal_file:
+            # entries are cleared by marker, file is not rewritten
+            self.assertEqual(4, len(journal_file.readlines()))
+        store.compact()
+        with open(path) as journal_file:
+            self.assertEqual(1, len(journal_file.readlines()))
+        self.assertEqual([], store.read('a'))
+        self.assertEqual(1, len(store.read('b')))
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_store_written_off_event_loop(self, template_path):
+        store = journal.MemoryJournalStore()
+        threads = set()
+        append = store.append
+
+        def record_thread(entry):
+            threads.add(threading.current_thread())
+            append(entry)
+
+        store.append = record_thread
+        c = self.build_context(template_path,
+                               journal=journal.Journal(store))
+        c.run_deploy()
+        self.assertEqual(1, len(threads))
+        self.assertNotIn(threading.current_thread(), threads)
+        c.run_undeploy()
+        c.journal.close()
+
+    def test_sqlite_store(self):
+        path = os.path.join(tempfile.mkdtemp(), 'journal.db')
+        self._check_store(journal.SQLiteJournalStore(path))
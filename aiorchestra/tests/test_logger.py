@@ -0,0 +1,88 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import logging
+import os
+import tempfile
+
+from logging import handlers
+
+from aiorchestra.core import context
+from aiorchestra.core import logger
+
+from aiorchestra.tests import base
+
+
+class TestLogger(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestLogger, self).setUp()
+        fd, self.filename = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.filename)
+        super(TestLogger, self).tearDown()
+
+    def test_non_blocking_logger(self):
+        log = logger.UnifiedLogger(
+            filename=self.filename, level='INFO',
+            non_blocking=True).setup_logger('test_non_blocking_logger')
+        self.assertIsInstance(log.handlers[-1], handlers.QueueHandler)
+        log.info('written by listener')
+        logger.stop_queue_listeners()
+        with open(self.filename) as log_file:
+            self.assertIn('written by listener', log_file.read())
+
+    def test_disabled_level_is_not_formatted(self):
+        class Argument(object):
+            formatted = False
+
+            def __str__(self):
+                self.formatted = True
+                return 'argument'
+
+        log = logger.UnifiedLogger(
+            filename=self.filename,
+            level='INFO').setup_logger('test_disabled_level')
+        argument = Argument()
+        log.debug('%s', argument)
+        self.assertFalse(argument.formatted)
+        self.assertFalse(log.isEnabledFor(logging.DEBUG))
+
+    def test_logger_setup_is_idempotent(self):
+        unified = logger.UnifiedLogger(filename=self.filename, level='INFO')
+        first = unified.setup_logger('test_logger_setup_is_idempotent')
+        second = unified.setup_logger('test_logger_setup_is_idempotent')
+        self.assertIs(first, second)
+        self.assertEqual(1, len(first.handlers))
+
+    def test_loggers_share_handlers(self):
+        unified = logger.UnifiedLogger(filename=self.filename, level='INFO')
+        first = unified.setup_logger('test_loggers_share_handlers.first')
+        second = unified.setup_logger('test_loggers_share_handlers.second')
+        self.assertIs(first.handlers[0], second.handlers[0])
+
+    @base.with_template('simple_node_template.yaml')
+    def test_context_child_loggers(self, template_path):
+        contexts = [context.OrchestraContext(
+            'context-{0}'.format(i), path=template_path,
+            event_loop=self.event_loop) for i in range(3)]
+        parent = logging.getLogger(context.__name__)
+        self.assertEqual(1, len(parent.handlers))
+        for c in contexts:
+            self.assertIs(parent, c.logger.logger)
+            self.assertEqual({'context': c.name}, c.logger.extra)
+        self.assertNotIn('{0}.context-0'.format(context.__name__),
+                         logging.Logger.manager.loggerDict)
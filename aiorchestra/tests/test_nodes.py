@@ -36,3 +36,46 @@ class TestContextNodes(base.BaseAIOrchestraTestCase):
     def test_nodes_parent_presence(self, context):
         node = context.node_from_name('dependent_node')
         self.assertIn('test_node', node.parent_nodes)
+
+    @base.with_deployed('simple_node_template.yaml', do_deploy=False)
+    def test_node_from_name_follows_nodes_setter(self, context):
+        node = context.node_from_name('test_node')
+        context.nodes = [n for n in context.nodes if n is not node]
+        self.assertIsNone(context.node_from_name('test_node'))
+        self.assertIsNotNone(context.node_from_name('dependent_node'))
+        context.nodes = context.nodes + [node]
+        self.assertEqual(node, context.node_from_name('test_node'))
+
+    @base.with_deployed('template_with_functions.yaml', do_deploy=False,
+                        inputs={'node_name': 'first'})
+    def test_properties_follow_template_inputs(self, context):
+        node = context.node_from_name('test_node')
+        self.assertEqual('first', node.properties['name'])
+        context.template_inputs['node_name'] = 'second'
+        self.assertEqual('second', node.properties['name'])
+
+    @base.with_deployed('template_with_functions.yaml',
+                        inputs={'node_name': 'test_node'})
+    def test_properties_follow_referenced_node_attributes(self, context):
+        node = context.node_from_name('dependent_node')
+        target = context.node_from_name('test_node')
+        self.assertEqual('test_node', node.properties['target_name'])
+        self.assertEqual('tosca.test.node', node.properties['target_type'])
+        target.update_runtime_properties('name', 'renamed')
+        self.assertEqual('renamed', node.properties['target_name'])
+
+    @base.with_deployed('template_with_plugin.yaml', do_deploy=False)
+    def test_attributes_before_deploy(self, context):
+        node = context.node_from_name('test_node')
+        self.assertEqual({}, dict(node.attributes))
+        self.assertRaises(AttributeError, node.get_attribute, 'name')
+
+    @base.with_deployed('template_with_plugin.yaml')
+    def test_attributes_follow_runtime_properties(self, context):
+        node = context.node_from_name('test_node')
+        self.assertEqual({'name': 'test_node', 'my_type': None},
+                         dict(node.attributes))
+        node.update_runtime_properties('my_type', 'updated')
+        self.assertEqual('updated', node.get_attribute('my_type'))
+        self.assertNotIn('created', node.attributes)
+        self.assertRaises(AttributeError, node.get_attribute, 'created')
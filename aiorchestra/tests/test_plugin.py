@@ -12,9 +12,21 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import threading
+
+from aiorchestra.core import utils
 from aiorchestra.tests import base
 
 
+class AsyncCallable(object):
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, node, inputs):
+        self.calls.append(node.name)
+
+
 class TestPlugin(base.BaseAIOrchestraTestCase):
 
     def setUp(self):
@@ -54,13 +66,33 @@ class TestPlugin(base.BaseAIOrchestraTestCase):
         self.assertEqual(parent.name, target_name)
         self.assertEqual(child.name, source_name)
 
-    @base.with_deployed('template_with_bad_plugin.yaml', do_deploy=False)
-    def test_plugin_operations_should_be_coroutines(self, context):
-        ex = self.assertRaises(Exception, context.run_deploy)
-        self.assertIn("object NoneType can't be used in "
-                      "'await' expression", str(ex))
+    @base.with_deployed('template_with_bad_plugin.yaml', do_deploy=True)
+    def test_plugin_operations_may_be_blocking(self, context):
+        self.assertEqual(context.COMPLETED, context.status)
+
+    @base.with_deployed('template_with_blocking_plugin.yaml', do_deploy=True)
+    def test_blocking_operations_offloaded(self, context):
+        nodes = [context.node_from_name(name) for name in
+                 ['node_a', 'node_b', 'node_c', 'node_d']]
+        self.assertLess(
+            max(n.runtime_properties['create_started'] for n in nodes),
+            min(n.runtime_properties['create_finished'] for n in nodes))
+        for n in nodes + [context.node_from_name('joint_node')]:
+            self.assertTrue(n.runtime_properties['created'])
+            self.assertNotEqual(threading.main_thread().name,
+                                n.runtime_properties['create_thread'])
 
     @base.with_deployed('simple_template_for_rollback_test.yaml',
                         do_deploy=True, enable_rollback=True)
     def test_rollback(self, context):
         pass
+
+    @base.with_deployed('template_with_plugin.yaml', do_deploy=False)
+    def test_returned_awaitables_awaited(self, context):
+        orchestra_node = context.node_from_name('test_node')
+        task = AsyncCallable()
+        self.event_loop.run_until_complete(
+            utils.run_task(context, task, orchestra_node, {}))
+        self.event_loop.run_until_complete(
+            utils.operation(task)(orchestra_node, {}))
+        self.assertEqual(['test_node', 'test_node'], task.calls)
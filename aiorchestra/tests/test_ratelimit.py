@@ -0,0 +1,143 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+
+from aiorchestra.core import ratelimit
+from aiorchestra.core import tracing
+from aiorchestra.tests import base
+
+
+class TestRateLimit(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestRateLimit, self).setUp()
+
+    def tearDown(self):
+        super(TestRateLimit, self).tearDown()
+
+    def test_backend_key(self):
+        self.assertEqual('aiorchestra.tests.plugin', ratelimit.backend_key(
+            'aiorchestra.tests.plugin:create'))
+        self.assertEqual('cloud', ratelimit.backend_key(
+            'aiorchestra.tests.plugin:create',
+            {ratelimit.BACKEND_INPUT: 'cloud'}))
+        self.assertIsNone(ratelimit.backend_key(None))
+
+    def test_token_bucket_rate(self):
+        limiter = ratelimit.RateLimiter(limits={'cloud': {'rate': 50}})
+        started = []
+
+        async def call():
+            started.append(self.event_loop.time())
+
+        self.event_loop.run_until_complete(asyncio.gather(
+            *[limiter.run('cloud', call) for _ in range(5)]))
+        self.assertGreaterEqual(started[-1] - started[0], 0.07)
+        self.assertEqual({'cloud': 0}, limiter.queue_depth())
+
+    def test_concurrency_and_queue_depth(self):
+        limiter = ratelimit.RateLimiter(limits={'cloud': {'concurrency': 2}})
+        # semaphore is created by event loop running operations
+        self.assertIsNone(limiter.backend_limit('cloud').semaphore)
+        running = []
+        depths = []
+
+        async def call():
+            running.append(1)
+            await asyncio.sleep(0.01)
+            depths.append((len(running), limiter.queue_depth()['cloud']))
+            running.pop()
+
+        self.event_loop.run_until_complete(asyncio.gather(
+            *[limiter.run('cloud', call) for _ in range(5)]))
+        self.assertEqual(2, max(r for r, _ in depths))
+        self.assertEqual(3, max(d for _, d in depths))
+        self.assertEqual({'cloud': 0}, limiter.queue_depth())
+
+    def test_unlimited_backend(self):
+        limiter = ratelimit.RateLimiter(limits={'cloud': {'concurrency': 1}})
+
+        async def call():
+            return 'done'
+
+        self.assertEqual('done', self.event_loop.run_until_complete(
+            limiter.run('other', call)))
+        self.assertNotIn('other', limiter.queue_depth())
+
+    def test_throttled_operation_retried(self):
+        limiter = ratelimit.RateLimiter(default={
+            'rate': 100, 'burst': 5, 'backoff': 0.01})
+        calls = []
+
+        async def call():
+            calls.append(self.event_loop.time())
+            if len(calls) < 3:
+                raise ratelimit.ThrottlingError()
+            return 'done'
+
+        self.assertEqual('done', self.event_loop.run_until_complete(
+            limiter.run('cloud', call)))
+        limit = limiter.backend_limit('cloud')
+        self.assertEqual(2, limit.throttled)
+        self.assertLess(limit.rate, 100)
+        self.assertGreaterEqual(calls[2] - calls[1], 0.019)
+
+    def test_throttling_retries_exhausted(self):
+        limiter = ratelimit.RateLimiter(default={
+            'backoff': 0.001, 'max_throttle_retries': 2})
+
+        async def call():
+            raise ratelimit.ThrottlingError()
+
+        self.assertRaises(ratelimit.ThrottlingError,
+                          self.event_loop.run_until_complete,
+                          limiter.run('cloud', call))
+        self.assertEqual(3, limiter.backend_limit('cloud').throttled)
+
+    @base.with_template('template_with_throttled_plugin.yaml')
+    def test_deployment_rate_limited(self, template_path):
+        sink = tracing.MemorySink()
+        limiter = ratelimit.RateLimiter(
+            limits={'cloud': {'concurrency': 1, 'backoff': 0.01}})
+        c = self.build_context(template_path, sinks=[sink],
+                               enable_rollback=True, rate_limiter=limiter)
+        c.run_deploy()
+        self.assertEqual(c.COMPLETED, c.status)
+        self.assertEqual(3, limiter.backend_limit('cloud').throttled)
+        self.assertEqual(3, sum(r.retries for r in sink.records
+                                if r.event == 'create'))
+        spans = sorted((n.runtime_properties['create_started'],
+                        n.runtime_properties['create_finished'])
+                       for n in c.nodes)
+        for (_, finished), (started, _) in zip(spans, spans[1:]):
+            self.assertLessEqual(finished, started)
+        for orchestra_node in c.nodes:
+            self.assertNotIn(ratelimit.BACKEND_INPUT,
+                             orchestra_node.runtime_properties[
+                                 'create_inputs'])
+        c.run_undeploy()
+
+    @base.with_template('template_with_throttled_plugin.yaml')
+    def test_throttling_without_rate_limiter(self, template_path):
+        sink = tracing.MemorySink()
+        c = self.build_context(template_path, sinks=[sink],
+                               enable_rollback=True)
+        c.run_deploy()
+        self.assertEqual(c.COMPLETED, c.status)
+        self.assertEqual(
+            [tracing.FAILED] * 3,
+            [r.outcome for r in sink.records if r.event == 'create'])
+        for orchestra_node in c.nodes:
+            self.assertNotIn('created', orchestra_node.runtime_properties)
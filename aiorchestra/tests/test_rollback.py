@@ -0,0 +1,128 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from aiorchestra.core import context
+from aiorchestra.core import journal
+from aiorchestra.core import rollback
+from aiorchestra.core import tracing
+from aiorchestra.tests import base
+
+
+class TestRollback(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestRollback, self).setUp()
+
+    def tearDown(self):
+        super(TestRollback, self).tearDown()
+
+    @staticmethod
+    def _rollback_records(sink):
+        return [(r.node, r.event) for r in sink.records
+                if r.event in rollback.ROLLBACK_EVENTS]
+
+    @base.with_template('template_for_fail_fast.yaml')
+    def test_never_created_nodes_untouched(self, template_path):
+        sink = tracing.MemorySink()
+        c = self.build_context(template_path, sinks=[sink], fail_fast=True)
+        self.assertRaises(Exception, c.run_deploy)
+        self.assertEqual({'fast_node': ['stop', 'delete'],
+                          'slow_node': ['delete']},
+                         rollback.RollbackPlan(c).serialize())
+        c.rollback_enabled = True
+        c.run_undeploy()
+        self.assertEqual(c.PENDING, c.status)
+        self.assertEqual([('fast_node', 'delete'), ('fast_node', 'stop'),
+                          ('slow_node', 'delete')],
+                         sorted(self._rollback_records(sink)))
+        self.assertEqual({}, rollback.RollbackPlan(c).serialize())
+
+    @base.with_template('simple_template_for_rollback_test.yaml')
+    def test_created_node_deleted_without_stop(self, template_path):
+        sink = tracing.MemorySink()
+        c = self.build_context(template_path, sinks=[sink],
+                               enable_rollback=True, fail_fast=True)
+        c.run_deploy()
+        self.assertEqual(c.FAILED, c.status)
+        records = self._rollback_records(sink)
+        self.assertEqual(
+            [('dependent_node', 'delete'), ('test_node', 'stop'),
+             ('test_node', 'delete')], records)
+        for orchestra_node in c.nodes:
+            self.assertFalse(orchestra_node.is_provisioned)
+            self.assertEqual(set(), orchestra_node.completed_events)
+
+    @base.with_template('simple_template_for_rollback_test.yaml')
+    def test_plan_from_journal(self, template_path):
+        store = journal.MemoryJournalStore()
+        sink = tracing.MemorySink()
+        c = self.build_context(template_path, sinks=[sink], fail_fast=True,
+                               journal=journal.Journal(store))
+        self.assertRaises(Exception, c.run_deploy)
+
+        restarted = self.build_context(
+            template_path, sinks=[sink], enable_rollback=True,
+            journal=journal.Journal(store))
+        restarted.status = restarted.FAILED
+        self.assertEqual(
+            {'test_node': ['stop', 'delete'], 'dependent_node': ['delete']},
+            rollback.RollbackPlan(restarted).serialize())
+        test_node = restarted.node_from_name('test_node')
+        dependent = restarted.node_from_name('dependent_node')
+        self.assertTrue(test_node.runtime_properties['started'])
+        self.assertTrue(dependent.runtime_properties['created'])
+        del sink.records[:]
+        restarted.run_undeploy()
+        self.assertEqual(restarted.PENDING, restarted.status)
+        records = self._rollback_records(sink)
+        self.assertEqual(
+            [('dependent_node', 'delete'), ('test_node', 'delete'),
+             ('test_node', 'stop')], sorted(records))
+        self.assertLess(records.index(('dependent_node', 'delete')),
+                        records.index(('test_node', 'delete')))
+        self.assertTrue(dependent.runtime_properties['deleted'])
+        self.assertNotIn('stopped', dependent.runtime_properties)
+        self.assertTrue(test_node.runtime_properties['deleted'])
+        self.assertIn('stopped', test_node.runtime_properties)
+        for orchestra_node in restarted.nodes:
+            self.assertFalse(orchestra_node.is_provisioned)
+        self.assertEqual([], store.read('test_plan_from_journal'))
+
+    @base.with_template('simple_template_for_rollback_test.yaml')
+    def test_plan_from_snapshot(self, template_path):
+        c = self.build_context(template_path, fail_fast=True)
+        self.assertRaises(Exception, c.run_deploy)
+        for restored in [
+                self.deserialize_context(c.serialize()),
+                context.OrchestraContext.from_snapshot(
+                    c.snapshot(), base.LOG, event_loop=self.event_loop)]:
+            self.assertEqual(
+                {'create', 'configure'},
+                restored.node_from_name('dependent_node').completed_events)
+            self.assertEqual(
+                {'test_node': ['stop', 'delete'],
+                 'dependent_node': ['delete']},
+                rollback.RollbackPlan(restored).serialize())
+
+    @base.with_template('template_for_fail_fast.yaml')
+    def test_cancelled_create_rolled_back_from_journal(self, template_path):
+        store = journal.MemoryJournalStore()
+        c = self.build_context(template_path, fail_fast=True,
+                               journal=journal.Journal(store))
+        self.assertRaises(Exception, c.run_deploy)
+        restarted = self.build_context(template_path, enable_rollback=True,
+                                       journal=journal.Journal(store))
+        self.assertEqual({'fast_node': ['stop', 'delete'],
+                          'slow_node': ['delete']},
+                         rollback.RollbackPlan(restarted).serialize())
@@ -0,0 +1,104 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from aiorchestra.core import context
+from aiorchestra.core import tracing
+from aiorchestra.tests import base
+
+
+WORKERS = ['worker.0', 'worker.1', 'worker.2']
+
+
+class TestScaling(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestScaling, self).setUp()
+
+    def tearDown(self):
+        super(TestScaling, self).tearDown()
+
+    @base.with_deployed('template_with_scalable_nodes.yaml', do_deploy=True)
+    def test_default_instances(self, c):
+        self.assertEqual(WORKERS + ['balancer'], [n.name for n in c.nodes])
+        self.assertEqual(WORKERS, c.instance_names('worker'))
+        self.assertIs(c.node_from_name('worker.0'),
+                      c.node_from_name('worker'))
+        balancer = c.node_from_name('balancer')
+        self.assertEqual(WORKERS, balancer.parent_nodes)
+        self.assertEqual(
+            set(('balancer', name) for name in WORKERS),
+            set(c.relationships))
+        workers = [c.node_from_name(name) for name in WORKERS]
+        for index, worker in enumerate(workers):
+            self.assertEqual(index, worker.instance)
+            self.assertEqual('worker', worker.template_name)
+            self.assertEqual('balancer', worker.runtime_properties['source'])
+        self.assertLess(
+            max(w.runtime_properties['create_started'] for w in workers),
+            min(w.runtime_properties['create_finished'] for w in workers))
+        workers[0].update_runtime_properties('only_first', True)
+        self.assertNotIn('only_first', workers[1].runtime_properties)
+
+    @base.with_template('template_with_scalable_nodes.yaml')
+    def test_instances_override(self, template_path):
+        c = self.build_context(template_path, instances={'worker': 2})
+        self.assertEqual(['worker.0', 'worker.1'],
+                         c.instance_names('worker'))
+        ex = self.assertRaises(Exception, self.build_context,
+                               template_path, instances={'worker': 6})
+        self.assertIn('allowed range is [1, 5]', str(ex))
+        ex = self.assertRaises(Exception, self.build_context,
+                               template_path, instances={'unknown': 2})
+        self.assertIn('unknown nodes: unknown', str(ex))
+
+    @base.with_template('template_with_scalable_nodes.yaml')
+    def test_scale_touches_only_delta(self, template_path):
+        sink = tracing.MemorySink()
+        c = self.build_context(template_path, sinks=[sink])
+        c.run_deploy()
+        del sink.records[:]
+
+        c = c.run_scale('worker', 5)
+        self.assertEqual(c.COMPLETED, c.status)
+        self.assertEqual({'worker': 5}, c.instances)
+        self.assertEqual(
+            [('worker.3', 'create'), ('worker.4', 'create')],
+            sorted((r.node, r.event) for r in sink.records
+                   if r.event == 'create'))
+        self.assertEqual(
+            [('balancer', 'worker.3'), ('balancer', 'worker.4')],
+            sorted((r.node, r.peer) for r in sink.records
+                   if r.event == 'link'))
+        self.assertTrue(c.node_from_name('worker.0').runtime_properties[
+            'created'])
+        del sink.records[:]
+
+        c = c.run_scale('worker', 2)
+        self.assertEqual(c.COMPLETED, c.status)
+        self.assertEqual(
+            ['worker.2', 'worker.3', 'worker.4'],
+            sorted(r.node for r in sink.records if r.event == 'delete'))
+        self.assertEqual(
+            ['worker.2', 'worker.3', 'worker.4'],
+            sorted(r.peer for r in sink.records if r.event == 'unlink'))
+        self.assertEqual(['worker.0', 'worker.1', 'balancer'],
+                         [n.name for n in c.nodes])
+
+        restored = self.deserialize_context(c.serialize())
+        self.assertEqual(['worker.0', 'worker.1', 'balancer'],
+                         [n.name for n in restored.nodes])
+        restored = context.OrchestraContext.from_snapshot(
+            c.snapshot(), base.LOG, event_loop=self.event_loop)
+        self.assertEqual({'worker': 2}, restored.instances)
+        c.run_undeploy()
@@ -0,0 +1,181 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from aiorchestra.core import context
+from aiorchestra.core import tracing
+
+from aiorchestra.tests import base
+
+
+INDEPENDENT_NODES = ['node_a', 'node_b', 'node_c', 'node_d']
+
+
+class TestDeploymentScheduler(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestDeploymentScheduler, self).setUp()
+
+    def tearDown(self):
+        super(TestDeploymentScheduler, self).tearDown()
+
+    def deploy(self, template_path, **kwargs):
+        c = self.build_context(template_path, **kwargs)
+        c.run_deploy()
+        return c
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_independent_nodes_created_concurrently(self, template_path):
+        c = self.deploy(template_path)
+        self.assertEqual(context.OrchestraContext.COMPLETED, c.status)
+        nodes = [c.node_from_name(name) for name in INDEPENDENT_NODES]
+        last_started = max(n.runtime_properties['create_started']
+                           for n in nodes)
+        first_finished = min(n.runtime_properties['create_finished']
+                             for n in nodes)
+        self.assertTrue(last_started < first_finished)
+        c.run_undeploy()
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_dependent_node_waits_for_requirements(self, template_path):
+        c = self.deploy(template_path)
+        joint = c.node_from_name('joint_node')
+        for name in INDEPENDENT_NODES:
+            required = c.node_from_name(name)
+            self.assertTrue(required.runtime_properties['create_finished'] <=
+                            joint.runtime_properties['create_started'])
+        c.run_undeploy()
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_max_concurrency(self, template_path):
+        c = self.deploy(template_path, max_concurrency=1)
+        timings = sorted(
+            (n.runtime_properties['create_started'],
+             n.runtime_properties['create_finished'])
+            for n in [c.node_from_name(name) for name in INDEPENDENT_NODES])
+        for (_, finished), (started, _) in zip(timings, timings[1:]):
+            self.assertTrue(finished <= started)
+        c.run_undeploy()
+
+    def link_timings(self, c):
+        return sorted(
+            (n.runtime_properties['link_started'],
+             n.runtime_properties['link_finished'])
+            for n in [c.node_from_name(name) for name in INDEPENDENT_NODES])
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_links_run_one_by_one(self, template_path):
+        c = self.deploy(template_path)
+        timings = self.link_timings(c)
+        for (_, finished), (started, _) in zip(timings, timings[1:]):
+            self.assertTrue(finished <= started)
+        c.run_undeploy()
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_concurrent_links(self, template_path):
+        c = self.deploy(template_path, link_concurrency=None)
+        timings = self.link_timings(c)
+        last_started = max(started for started, _ in timings)
+        first_finished = min(finished for _, finished in timings)
+        self.assertTrue(last_started < first_finished)
+        c.run_undeploy()
+
+    def teardown_records(self, template_path, max_concurrency=None):
+        sink = tracing.MemorySink()
+        c = self.deploy(template_path, max_concurrency=max_concurrency,
+                        sinks=[sink])
+        del sink.records[:]
+        c.run_undeploy()
+        self.assertEqual(context.OrchestraContext.PENDING, c.status)
+        return {(r.node, r.event): r for r in sink.records
+                if r.event in ['stop', 'delete']}
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_teardown_follows_reverse_requirements(self, template_path):
+        records = self.teardown_records(template_path)
+        joint_deleted = records[('joint_node', 'delete')].finished
+        for name in INDEPENDENT_NODES:
+            self.assertTrue(joint_deleted <= records[(name, 'stop')].started)
+            self.assertTrue(records[(name, 'stop')].finished <=
+                            records[(name, 'delete')].started)
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_independent_nodes_deleted_concurrently(self, template_path):
+        records = self.teardown_records(template_path)
+        deletes = [records[(name, 'delete')] for name in INDEPENDENT_NODES]
+        self.assertTrue(max(r.started for r in deletes) <
+                        min(r.finished for r in deletes))
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_teardown_max_concurrency(self, template_path):
+        records = self.teardown_records(template_path, max_concurrency=1)
+        timings = sorted((r.started, r.finished) for r in records.values())
+        for (_, finished), (started, _) in zip(timings, timings[1:]):
+            self.assertTrue(finished <= started)
+
+    @base.with_template('template_for_fail_fast.yaml')
+    def test_fail_fast_raises(self, template_path):
+        sink = tracing.MemorySink()
+        c = self.build_context(template_path, sinks=[sink], fail_fast=True)
+        self.assertRaises(Exception, c.run_deploy)
+        self.assertEqual(c.FAILED, c.status)
+        records = {(r.node, r.event): r for r in sink.records}
+        self.assertEqual(tracing.FAILED,
+                         records[('failing_node', 'create')].outcome)
+        self.assertEqual(tracing.CANCELLED,
+                         records[('slow_node', 'create')].outcome)
+        self.assertNotIn(('dependent_node', 'create'), records)
+        self.assertNotIn('created', c.node_from_name(
+            'slow_node').runtime_properties)
+
+    @base.with_template('template_for_fail_fast.yaml')
+    def test_without_fail_fast_running_events_finish(self, template_path):
+        sink = tracing.MemorySink()
+        c = self.build_context(template_path, sinks=[sink])
+        self.assertRaises(Exception, c.run_deploy)
+        self.assertEqual(c.FAILED, c.status)
+        records = {(r.node, r.event): r for r in sink.records}
+        self.assertEqual(tracing.FAILED,
+                         records[('failing_node', 'create')].outcome)
+        for name in ['fast_node', 'slow_node']:
+            self.assertEqual(tracing.SUCCEEDED,
+                             records[(name, 'start')].outcome)
+            self.assertTrue(c.node_from_name(name).is_provisioned)
+        self.assertNotIn(('dependent_node', 'create'), records)
+        self.assertTrue(c.node_from_name(
+            'slow_node').runtime_properties['created'])
+
+    @base.with_template('template_for_fail_fast.yaml')
+    def test_fail_fast_rolls_back_started_nodes(self, template_path):
+        sink = tracing.MemorySink()
+        c = self.build_context(template_path, sinks=[sink], fail_fast=True,
+                               enable_rollback=True)
+        started = self.event_loop.time()
+        c.run_deploy()
+        self.assertLess(self.event_loop.time() - started, 0.1)
+        self.assertEqual(c.FAILED, c.status)
+        # create of slow node was cancelled in flight,
+        # so whatever it created is deleted
+        self.assertEqual(
+            [('fast_node', 'delete'), ('fast_node', 'stop'),
+             ('slow_node', 'delete')],
+            sorted((r.node, r.event) for r in sink.records
+                   if r.event in ['stop', 'delete']))
+        for orchestra_node in c.nodes:
+            self.assertFalse(orchestra_node.is_provisioned)
+        for name in ['fast_node', 'slow_node']:
+            self.assertTrue(c.node_from_name(
+                name).runtime_properties['deleted'])
+        for name in ['failing_node', 'dependent_node']:
+            self.assertNotIn('deleted', c.node_from_name(
+                name).runtime_properties)
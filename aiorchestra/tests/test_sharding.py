@@ -0,0 +1,89 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from aiorchestra.core import context
+from aiorchestra.core import sharding
+from aiorchestra.tests import base
+
+
+class TestSharding(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestSharding, self).setUp()
+        self.deployer = sharding.ShardedDeployer(
+            processes=2, event_loop=self.event_loop)
+        self.addCleanup(self.deployer.close)
+
+    def tearDown(self):
+        super(TestSharding, self).tearDown()
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_deployments_sharded(self, template_path):
+        for index in range(3):
+            self.deployer.submit(sharding.deployment_request(
+                'test_sharded_{0}'.format(index), template_path))
+        updates = []
+        results = self.deployer.run_until_complete(on_update=updates.append)
+        self.assertEqual([None] * 3, [r['error'] for r in results])
+        for result in results:
+            self.assertEqual(context.OrchestraContext.COMPLETED,
+                             result['context']['status'])
+            self.assertEqual({}, result['outputs'])
+        statuses = [(u['context'], u['status']) for u in updates
+                    if u['type'] == sharding.STATUS]
+        self.assertIn(('test_sharded_0', 'completed'), statuses)
+        creates = [u for u in updates if u['type'] == sharding.EVENT and
+                   u['event'] == 'create']
+        self.assertEqual(15, len(creates))
+
+        for result in results:
+            self.deployer.submit(result['context'], action='undeploy')
+        results = self.deployer.run_until_complete()
+        for result in results:
+            self.assertIsNone(result['error'])
+            self.assertEqual(context.OrchestraContext.PENDING,
+                             result['context']['status'])
+
+    @base.with_deployed('template_for_parallel_deployment.yaml',
+                        do_deploy=False)
+    def test_context_state_applied(self, c):
+        self.deployer.submit(c)
+        self.deployer.run_until_complete()
+        self.assertEqual(c.COMPLETED, c.status)
+        for orchestra_node in c.nodes:
+            self.assertTrue(orchestra_node.is_provisioned)
+            self.assertTrue(orchestra_node.runtime_properties['created'])
+        self.deployer.submit(c, action='undeploy')
+        self.deployer.run_until_complete()
+        self.assertEqual(c.PENDING, c.status)
+
+    @base.with_deployed('template_for_parallel_deployment.yaml',
+                        do_deploy=False)
+    def test_node_mismatch_not_applied(self, c):
+        serialized = c.serialize()
+        serialized['status'] = c.COMPLETED
+        serialized['nodes'] = [dict(ser_n, is_provisioned=True)
+                               for ser_n in serialized['nodes']]
+        serialized['nodes'].append(dict(serialized['nodes'][0],
+                                        __name='node_x'))
+        future = self.event_loop.create_future()
+        future.set_result({'context': serialized})
+        sharding.ShardedDeployer._ShardedDeployer__apply(c, future)
+        self.assertEqual(c.PENDING, c.status)
+        for orchestra_node in c.nodes:
+            self.assertFalse(orchestra_node.is_provisioned)
+
+    def test_unknown_action(self):
+        self.assertRaises(Exception, self.deployer.submit,
+                          {'name': 'test'}, action='explode')
@@ -0,0 +1,83 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from aiorchestra.core import context
+from aiorchestra.core import templates
+
+from aiorchestra.tests import base
+
+
+class TestTemplateCache(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestTemplateCache, self).setUp()
+
+    def tearDown(self):
+        super(TestTemplateCache, self).tearDown()
+
+    @base.with_template('template_with_plugin.yaml')
+    def test_template_parsed_once(self, template_path):
+        cache = templates.TemplateCache()
+        first = self.build_context(template_path, template_cache=cache)
+        second = self.build_context(template_path, template_cache=cache)
+        self.assertIs(first._tmplt, second._tmplt)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(1, cache.hits)
+
+    @base.with_template('template_with_plugin.yaml')
+    def test_template_inputs_are_part_of_key(self, template_path):
+        cache = templates.TemplateCache()
+        first = self.build_context(template_path, template_cache=cache)
+        second = self.build_context(template_path, template_cache=cache,
+                                    template_inputs={'a': 1})
+        self.assertIsNot(first._tmplt, second._tmplt)
+        self.assertEqual(2, len(cache))
+
+    @base.with_template('template_with_plugin.yaml')
+    def test_least_recently_used_eviction(self, template_path):
+        cache = templates.TemplateCache(max_size=1)
+        first = self.build_context(template_path, template_cache=cache)
+        self.build_context(template_path, template_cache=cache,
+                           template_inputs={'a': 1})
+        self.assertEqual(1, len(cache))
+        third = self.build_context(template_path, template_cache=cache)
+        self.assertIsNot(first._tmplt, third._tmplt)
+        self.assertEqual(3, cache.misses)
+
+    @base.with_template('template_with_plugin.yaml')
+    def test_shared_template_deployments(self, template_path):
+        cache = templates.TemplateCache()
+        first = self.build_context(template_path, template_cache=cache)
+        second = self.build_context(template_path, template_cache=cache)
+        first.run_deploy()
+        self.assertEqual({}, second.node_from_name(
+            'test_node').runtime_properties)
+        second.run_deploy()
+        self.assertEqual(context.OrchestraContext.COMPLETED, second.status)
+        first.run_undeploy()
+        second.run_undeploy()
+
+    @base.with_template('template_with_functions.yaml')
+    def test_cached_template_keeps_inputs(self, template_path):
+        cache = templates.TemplateCache()
+        inputs = {'node_name': 'first'}
+        first = self.build_context(template_path, template_cache=cache,
+                                   template_inputs=inputs)
+        inputs['node_name'] = 'changed'
+        first.template_inputs['node_name'] = 'second'
+        second = self.build_context(template_path, template_cache=cache,
+                                    template_inputs={'node_name': 'first'})
+        self.assertIs(first._tmplt, second._tmplt)
+        self.assertEqual({'node_name': 'first'}, second._tmplt.parsed_params)
+        self.assertEqual({'node_name': 'first'}, second.template_inputs)
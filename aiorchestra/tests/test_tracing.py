@@ -0,0 +1,119 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import json
+import os
+import tempfile
+
+from aiorchestra.core import tracing
+from aiorchestra.core import utils
+
+from aiorchestra.tests import base
+
+
+Named = collections.namedtuple('Named', ['name'])
+
+
+class TestTracing(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestTracing, self).setUp()
+
+    def tearDown(self):
+        super(TestTracing, self).tearDown()
+
+    def deploy(self, template_path, sinks, enable_rollback=False):
+        c = self.build_context(template_path, sinks=sinks,
+                               enable_rollback=enable_rollback)
+        c.run_deploy()
+        return c
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_records(self, template_path):
+        sink = tracing.MemorySink()
+        c = self.deploy(template_path, [sink])
+        events = collections.Counter(r.event for r in sink.records)
+        self.assertEqual({'create': 5, 'configure': 5,
+                          'start': 5, 'link': 4}, dict(events))
+        for record in sink.records:
+            self.assertEqual(tracing.SUCCEEDED, record.outcome)
+            self.assertEqual(c.name, record.context)
+        for record in sink.for_context(c.name, events=['link']):
+            self.assertEqual('joint_node', record.node)
+        slowest = sink.slowest(count=3)
+        self.assertEqual(3, len(slowest))
+        self.assertTrue(slowest[0].duration >= 0.1)
+        c.run_undeploy()
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_critical_path(self, template_path):
+        sink = tracing.MemorySink()
+        c = self.deploy(template_path, [sink])
+        path = sink.critical_path(c)
+        self.assertEqual(2, len(path))
+        self.assertEqual('joint_node', path[-1]['node'])
+        c.run_undeploy()
+
+    @base.with_template('template_for_parallel_deployment.yaml')
+    def test_json_lines_and_spans(self, template_path):
+        fd, filename = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, filename)
+        lines = tracing.JSONLinesSink(filename)
+        spans = tracing.SpanSink()
+        c = self.deploy(template_path, [lines, spans])
+        c.tracer.flush()
+        with open(filename) as records:
+            serialized = [json.loads(line) for line in records]
+        self.assertEqual(19, len(serialized))
+        self.assertEqual(19, len(spans.exporter.spans))
+        self.assertEqual(1, len(set(
+            span['trace_id'] for span in spans.exporter.spans)))
+        for span in spans.exporter.spans:
+            self.assertEqual('OK', span['status']['code'])
+            self.assertTrue(span['end_time_unix_nano'] >=
+                            span['start_time_unix_nano'])
+        c.run_undeploy()
+        lines.close()
+
+    @base.with_template('simple_template_for_rollback_test.yaml')
+    def test_swallowed_failure(self, template_path):
+        sink = tracing.MemorySink()
+        c = self.deploy(template_path, [sink], enable_rollback=True)
+        failed = [r for r in sink.records if r.outcome == tracing.FAILED]
+        self.assertEqual(1, len(failed))
+        self.assertEqual(('dependent_node', 'start'),
+                         (failed[0].node, failed[0].event))
+        self.assertEqual('i must fail.', failed[0].error)
+        c.run_undeploy()
+
+    def test_retries(self):
+        sink = tracing.MemorySink()
+        tracer = tracing.Tracer(sinks=[sink])
+        attempts = []
+
+        async def poll():
+            attempts.append(True)
+            return len(attempts) == 3
+
+        async def operation():
+            record, token = tracer.start(Named('context'), Named('node'),
+                                         'create')
+            await utils.retry(poll, task_retries=5, task_retry_interval=0)
+            tracer.finish(record, token, tracing.SUCCEEDED)
+
+        self.event_loop.run_until_complete(operation())
+        self.assertEqual(2, sink.records[0].retries)
+        self.assertIsNone(tracing.current_record())
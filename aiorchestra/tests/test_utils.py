@@ -0,0 +1,114 @@
+#    Author: Denys Makogon
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+
+from unittest import mock
+
+from aiorchestra.core import utils
+
+from aiorchestra.tests import base
+
+
+class Poller(object):
+
+    def __init__(self, ready_after=None):
+        self.calls = 0
+        self.ready_after = ready_after
+
+    async def poll(self):
+        self.calls += 1
+        if self.ready_after and self.calls >= self.ready_after:
+            return True
+        return False
+
+
+class TestRetry(base.BaseAIOrchestraTestCase):
+
+    def setUp(self):
+        super(TestRetry, self).setUp()
+
+    def tearDown(self):
+        super(TestRetry, self).tearDown()
+
+    def run_retry(self, *args, **kwargs):
+        return self.event_loop.run_until_complete(
+            utils.retry(*args, **kwargs))
+
+    def sleeps(self, **kwargs):
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        with mock.patch.object(utils.asyncio, 'sleep', sleep):
+            self.assertRaises(Exception, self.run_retry,
+                              Poller().poll, **kwargs)
+        return delays
+
+    def test_fixed_interval(self):
+        delays = self.sleeps(task_retries=4, task_retry_interval=2)
+        self.assertEqual([2, 2, 2], delays)
+
+    def test_exponential_backoff(self):
+        delays = self.sleeps(task_retries=6, task_retry_interval=1,
+                             backoff=2, max_retry_interval=10)
+        self.assertEqual([1, 2, 4, 8, 10], delays)
+
+    def test_jitter(self):
+        delays = self.sleeps(task_retries=20, task_retry_interval=1,
+                             jitter=0.5)
+        for delay in delays:
+            self.assertTrue(0.5 <= delay <= 1)
+
+    def test_result(self):
+        poller = Poller(ready_after=3)
+        self.assertTrue(self.run_retry(poller.poll, task_retries=5,
+                                       task_retry_interval=0))
+        self.assertEqual(3, poller.calls)
+
+    def test_deadline(self):
+        poller = Poller()
+        started = self.event_loop.time()
+        ex = self.assertRaises(Exception, self.run_retry, poller.poll,
+                               task_retries=1000, task_retry_interval=0.02,
+                               deadline=0.1)
+        self.assertIn('deadline exceeded', str(ex))
+        self.assertTrue(self.event_loop.time() - started < 1)
+
+    def test_ready_future(self):
+        poller = Poller(ready_after=2)
+        ready = asyncio.Future(loop=self.event_loop)
+        self.event_loop.call_later(0.05, ready.set_result, True)
+        started = self.event_loop.time()
+        self.assertTrue(self.run_retry(poller.poll, task_retries=2,
+                                       task_retry_interval=10, ready=ready))
+        self.assertTrue(self.event_loop.time() - started < 1)
+
+    def test_ready_during_poll(self):
+        ready = asyncio.Future(loop=self.event_loop)
+        calls = []
+
+        async def poll():
+            calls.append(self.event_loop.time())
+            if not ready.done():
+                ready.set_result(True)
+            return len(calls) >= 3
+
+        self.assertTrue(self.run_retry(poll, task_retries=3,
+                                       task_retry_interval=0.2,
+                                       ready=ready))
+        # poll right after signal, regular interval afterwards
+        self.assertLess(calls[1] - calls[0], 0.1)
+        self.assertGreaterEqual(calls[2] - calls[1], 0.19)
@@ -28,6 +28,7 @@ setuptools.setup(
     author='Denys Makogon',
     author_email='lildee1991@gmail.com',
     packages=setuptools.find_packages(),
+    python_requires='>=3.7',
     install_requires=[
         # 'uvloop',
         'tosca-parser',
@@ -42,9 +43,9 @@ setuptools.setup(
         'Intended Audience :: System Administrators',
         'Intended Audience :: Developers',
         'Environment :: No Input/Output (Daemon)',
-        'Programming Language :: Python :: 2.7',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.7',
         'Topic :: Software Development :: '
         'Libraries :: Python Modules',
         'Topic :: System :: Distributed Computing',